@@ -0,0 +1,81 @@
+"""
+Process-level cache of ingredient names keyed by ingredient ID.
+
+Recipe responses embed the name of every ingredient they use. Instead of
+loading the whole ingredients table on each request, names are kept in a
+bounded LRU map and only the missing IDs are fetched from the DB.
+
+Ingredient names are never updated in place and IDs are never reused, so
+the only writes that can make an entry stale are creates and deletes, which
+the ingredient service forwards here.
+"""
+
+import os
+import threading
+from collections import OrderedDict
+from typing import Dict, Iterable, List, Tuple
+
+
+class IngredientNameCache:
+    """
+    Thread-safe LRU mapping ``ingredient_id -> name`` with a fixed capacity.
+
+    Sync routes run in Starlette's thread pool, so every access goes through
+    a lock. The critical sections are dict operations only; no I/O is done
+    while holding it.
+    """
+
+    def __init__(self, max_size: int = 10_000) -> None:
+        if max_size <= 0:
+            raise ValueError("max_size must be a positive integer")
+        self.max_size = max_size
+        self._names: "OrderedDict[int, str]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get_many(self, ingredient_ids: Iterable[int]) -> Tuple[Dict[int, str], List[int]]:
+        """
+        Look up several IDs at once.
+
+        Returns:
+            A tuple ``(found, missing)`` where ``found`` maps cached IDs to their
+            names and ``missing`` lists the IDs that must be loaded from the DB.
+        """
+        found: Dict[int, str] = {}
+        missing: List[int] = []
+        with self._lock:
+            for ing_id in dict.fromkeys(ingredient_ids):   # de-duplicate, keep order
+                name = self._names.get(ing_id)
+                if name is None:
+                    missing.append(ing_id)
+                else:
+                    self._names.move_to_end(ing_id)
+                    found[ing_id] = name
+        return found, missing
+
+    def put_many(self, names: Dict[int, str]) -> None:
+        """Insert or refresh several entries, evicting the least recently used ones."""
+        with self._lock:
+            for ing_id, name in names.items():
+                self._names[ing_id] = name
+                self._names.move_to_end(ing_id)
+            while len(self._names) > self.max_size:
+                self._names.popitem(last=False)
+
+    def put(self, ingredient_id: int, name: str) -> None:
+        self.put_many({ingredient_id: name})
+
+    def invalidate(self, ingredient_id: int) -> None:
+        with self._lock:
+            self._names.pop(ingredient_id, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._names.clear()
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+
+ingredient_name_cache = IngredientNameCache(
+    max_size=int(os.getenv("INGREDIENT_NAME_CACHE_SIZE", "10000")),
+)
@@ -0,0 +1,357 @@
+"""
+Read-through cache for the responses of the GET services.
+
+Services wrap their loaders with `response_cache.get_or_load`; every entry
+is stored with *tags* naming the rows it was built from (``recipe:12``,
+``author:3``, ``recipes`` for list pages...). Write services call
+`response_cache.invalidate(*tags)` after committing, which drops exactly
+the entries built from the changed rows, e.g. updating an author evicts
+every cached recipe and recipe page that embeds it. TTLs only bound how
+long an entry lives if an invalidation is ever missed.
+
+A load can read a row just before a write commits and finish after the
+write invalidated its tags. To keep that stale value out, backends count
+invalidations in an *epoch* and remember, for one TTL, the epoch at which
+each tag was last invalidated: `get_or_load` reads the epoch before
+loading, and the entry is not stored if any of its tags was invalidated
+since.
+
+Entries are served to every client, so loaders read on the primary
+(`loader_session`): a replica that has not replayed a write yet would put
+the old rows back right after the write invalidated them.
+
+Backends are selected with `RESPONSE_CACHE_BACKEND`:
+
+* ``memory`` (default) – per-process TTL + LRU map holding the response
+  objects themselves. Invalidations only reach the current process.
+* ``redis`` – shared cache on any Redis-protocol server (`REDIS_URL`),
+  storing responses as JSON. Needs the optional `redis` package.
+* ``none`` – caching disabled.
+"""
+
+import os
+import threading
+import time
+from collections import OrderedDict
+from contextlib import nullcontext
+from typing import Any, Callable, ContextManager, Dict, Iterable, Optional, Set, Tuple, TypeVar
+
+import orjson
+from pydantic import TypeAdapter
+from sqlalchemy.orm import Session
+
+from app.persistence.db import primary_session
+from app.persistence.replicas import replica_primary
+
+T = TypeVar("T")
+
+
+class PlainJSONAdapter:
+    """
+    Stands in for a `TypeAdapter` when the cached values are already plain
+    JSON types (dicts, lists, strings, numbers): encoded with orjson and
+    decoded without any validation.
+    """
+
+    @staticmethod
+    def dump_json(value: Any) -> bytes:
+        return orjson.dumps(value)
+
+    @staticmethod
+    def validate_json(data: bytes) -> Any:
+        return orjson.loads(data)
+
+
+PLAIN_JSON = PlainJSONAdapter()
+
+
+class MemoryCacheBackend:
+    """
+    Thread-safe LRU map with a per-entry TTL and a tag -> keys index.
+
+    Values are kept as Python objects: cached responses are never mutated,
+    so a hit costs a dict lookup and no decoding.
+    """
+
+    stores_objects = True
+
+    def __init__(self, max_entries: int = 10_000) -> None:
+        if max_entries <= 0:
+            raise ValueError("max_entries must be a positive integer")
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, Tuple[float, Any, Tuple[str, ...]]]" = OrderedDict()
+        self._keys_by_tag: Dict[str, Set[str]] = {}
+        # tag -> (epoch, expiry) of its last invalidation, oldest first
+        self._invalidated: "OrderedDict[str, Tuple[int, float]]" = OrderedDict()
+        self._epoch = 0
+        self._lock = threading.Lock()
+        self.evictions = 0
+
+    def epoch(self) -> int:
+        return self._epoch
+
+    def get(self, key: str) -> Optional[Any]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value, _ = entry
+            if expires_at < time.monotonic():
+                self._drop(key)
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: Any, *, tags: Iterable[str], ttl: float, since: Optional[int] = None) -> None:
+        """Store `value`, unless one of `tags` was invalidated after epoch `since`."""
+        tags = tuple(set(tags))
+        with self._lock:
+            if since is not None and self._invalidated_since(tags, since):
+                return
+            self._drop(key)
+            self._entries[key] = (time.monotonic() + ttl, value, tags)
+            for tag in tags:
+                self._keys_by_tag.setdefault(tag, set()).add(key)
+            while len(self._entries) > self.max_entries:
+                self._drop(next(iter(self._entries)))
+                self.evictions += 1
+
+    def invalidate(self, tags: Iterable[str], *, ttl: float) -> int:
+        dropped = 0
+        with self._lock:
+            self._epoch += 1
+            now = time.monotonic()
+            while self._invalidated and next(iter(self._invalidated.values()))[1] < now:
+                self._invalidated.popitem(last=False)
+            for tag in tags:
+                self._invalidated.pop(tag, None)
+                self._invalidated[tag] = (self._epoch, now + ttl)
+                for key in self._keys_by_tag.pop(tag, ()):
+                    dropped += self._drop(key)
+        return dropped
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._keys_by_tag.clear()
+            self._invalidated.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _invalidated_since(self, tags: Tuple[str, ...], since: int) -> bool:
+        now = time.monotonic()
+        for tag in tags:
+            entry = self._invalidated.get(tag)
+            if entry is not None and entry[0] > since and entry[1] >= now:
+                return True
+        return False
+
+    def _drop(self, key: str) -> int:
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return 0
+        for tag in entry[2]:
+            keys = self._keys_by_tag.get(tag)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._keys_by_tag[tag]
+        return 1
+
+
+class RedisCacheBackend:
+    """
+    Cache on a Redis-protocol server, shared by every API process.
+
+    Each entry is a string key with an expiry; each tag is a set of the keys
+    built from it, whose expiry is pushed back to that of the newest one
+    (all entries share one TTL, so it outlives them all). Invalidation
+    first records the new epoch on each tag, then reads the tag sets and
+    deletes them with their keys in one pipeline. `set` watches those
+    epoch keys, so an invalidation racing with it aborts the write.
+
+    `client` may be any redis-py compatible client (e.g. `fakeredis.FakeRedis`).
+    """
+
+    stores_objects = False
+
+    def __init__(self, url: Optional[str] = None, *, client: Any = None, prefix: str = "rc:") -> None:
+        try:
+            import redis
+        except ImportError as exc:
+            raise RuntimeError(
+                "RESPONSE_CACHE_BACKEND=redis needs the 'redis' package (poetry install -E redis)"
+            ) from exc
+        if client is None:
+            client = redis.Redis.from_url(url or "redis://localhost:6379/0")
+        self._watch_error = redis.WatchError
+        self.client = client
+        self.prefix = prefix
+        self.evictions = 0   # evicted by the server, not observable from here
+
+    def get(self, key: str) -> Optional[bytes]:
+        return self.client.get(self.prefix + key)
+
+    def epoch(self) -> int:
+        return int(self.client.get(self.prefix + "epoch") or 0)
+
+    def set(self, key: str, value: bytes, *, tags: Iterable[str], ttl: float, since: Optional[int] = None) -> None:
+        """Store `value`, unless one of `tags` was invalidated after epoch `since`."""
+        tags = set(tags)
+        ttl_ms = int(ttl * 1000)
+        with self.client.pipeline(transaction=True) as pipe:
+            if since is not None and tags:
+                epoch_keys = [self._epoch_key(tag) for tag in tags]
+                pipe.watch(*epoch_keys)
+                if any(int(epoch) > since for epoch in pipe.mget(epoch_keys) if epoch is not None):
+                    return
+                pipe.multi()
+            pipe.set(self.prefix + key, value, px=ttl_ms)
+            for tag in tags:
+                tag_key = self._tag_key(tag)
+                pipe.sadd(tag_key, key)
+                pipe.pexpire(tag_key, ttl_ms)
+            try:
+                pipe.execute()
+            except self._watch_error:
+                pass   # invalidated meanwhile: not stored
+
+    def invalidate(self, tags: Iterable[str], *, ttl: float) -> int:
+        tags = set(tags)
+        tag_keys = [self._tag_key(tag) for tag in tags]
+        if not tag_keys:
+            return 0
+        epoch = self.client.incr(self.prefix + "epoch")
+        pipe = self.client.pipeline(transaction=False)
+        for tag in tags:
+            pipe.set(self._epoch_key(tag), epoch, px=int(ttl * 1000))
+        pipe.execute()
+
+        keys = self.client.sunion(tag_keys)
+        pipe = self.client.pipeline(transaction=False)
+        if keys:
+            pipe.delete(*(self.prefix + k.decode() for k in keys))
+        pipe.delete(*tag_keys)
+        results = pipe.execute()
+        return results[0] if keys else 0
+
+    def clear(self) -> None:
+        for key in self.client.scan_iter(match=self.prefix + "*"):
+            self.client.delete(key)
+
+    def __len__(self) -> int:
+        return sum(1 for key in self.client.scan_iter(match=self.prefix + "*")
+                   if not key.decode().startswith((self.prefix + "tag:", self.prefix + "epoch")))
+
+    def _tag_key(self, tag: str) -> str:
+        return f"{self.prefix}tag:{tag}"
+
+    def _epoch_key(self, tag: str) -> str:
+        return f"{self.prefix}epoch:{tag}"
+
+
+class ResponseCache:
+    """
+    Front object used by the services: read-through lookups, tag
+    invalidation and hit/miss counters. With no backend every call goes
+    straight to the loader.
+
+    Counters are plain attribute increments: they may undercount slightly
+    under heavy thread contention but never take a lock on the read path.
+    """
+
+    def __init__(self, backend: Optional[Any], *, ttl: float = 60) -> None:
+        self.backend = backend
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.backend is not None
+
+    def loader_session(self, db: Session) -> ContextManager[Session]:
+        """
+        The session a `get_or_load` loader reads with: one on the primary
+        when caching is on (see `primary_session`), `db` itself otherwise.
+        """
+        return primary_session(db) if self.enabled else nullcontext(db)
+
+    def loader_reads_primary(self, db: Session) -> bool:
+        """Whether `loader_session(db)` reads on the primary."""
+        return self.enabled or replica_primary(db) is None
+
+    def get_or_load(
+        self,
+        key: str,
+        load: Callable[[], T],
+        *,
+        adapter: TypeAdapter,
+        tags: Callable[[T], Iterable[str]],
+    ) -> T:
+        """
+        Return the cached value for `key`, or call `load`, cache its result
+        under the tags `tags(result)` and return it. Exceptions raised by
+        `load` (e.g. not found) propagate and nothing is cached.
+        """
+        if self.backend is None:
+            return load()
+
+        value = self.peek(key, adapter)
+        if value is not None:
+            self.hits += 1
+            return value
+
+        self.misses += 1
+        since = self.backend.epoch()
+        value = load()
+        stored = value if self.backend.stores_objects else adapter.dump_json(value)
+        self.backend.set(key, stored, tags=tags(value), ttl=self.ttl, since=since)
+        return value
+
+    def peek(self, key: str, adapter: TypeAdapter) -> Optional[Any]:
+        """The cached value for `key`, or None; never loads and does not count as a hit."""
+        if self.backend is None:
+            return None
+        stored = self.backend.get(key)
+        if stored is None or self.backend.stores_objects:
+            return stored
+        return adapter.validate_json(stored)
+
+    def invalidate(self, *tags: str) -> None:
+        """Drop every entry built from any of `tags`."""
+        if self.backend is None or not tags:
+            return
+        self.invalidations += self.backend.invalidate(tags, ttl=self.ttl)
+
+    def clear(self) -> None:
+        if self.backend is not None:
+            self.backend.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "backend": type(self.backend).__name__ if self.backend is not None else None,
+            "entries": len(self.backend) if self.backend is not None else 0,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": self.hits / lookups if lookups else 0.0,
+            "invalidations": self.invalidations,
+            "evictions": getattr(self.backend, "evictions", 0),
+        }
+
+
+def _build_backend() -> Optional[Any]:
+    kind = os.getenv("RESPONSE_CACHE_BACKEND", "memory").lower()
+    if kind == "none":
+        return None
+    if kind == "redis":
+        return RedisCacheBackend(os.getenv("REDIS_URL"))
+    if kind == "memory":
+        return MemoryCacheBackend(max_entries=int(os.getenv("RESPONSE_CACHE_MAX_ENTRIES", "10000")))
+    raise ValueError(f"Unknown RESPONSE_CACHE_BACKEND: {kind!r} (expected memory, redis or none)")
+
+
+response_cache = ResponseCache(_build_backend(), ttl=float(os.getenv("RESPONSE_CACHE_TTL", "60")))
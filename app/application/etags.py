@@ -0,0 +1,55 @@
+"""
+Strong entity tags for conditional GETs.
+
+A tag is a digest of the version of every row that shapes a response: the
+row itself and the rows embedded in it (a recipe embeds its author).
+Ingredient names never change and a recipe's ingredient list is covered by
+the recipe's own version, so a tag can be computed either from a loaded
+entity or from a narrow ``SELECT id, version`` query, and both give the
+same value. The repositories bump `version` on every update.
+"""
+
+import hashlib
+from typing import Any, Iterable, Mapping, Tuple
+
+VersionKey = Tuple[int, ...]
+
+
+def version_key(entity: Any) -> VersionKey:
+    """
+    ``(id, version)`` of an author or ingredient, and
+    ``(id, version, author id, author version)`` of a recipe.
+
+    Works on ORM instances, response schemas and the plain dicts of the
+    recipe listing alike.
+    """
+    if isinstance(entity, Mapping):
+        key = (entity["id"], entity["version"])
+        author = entity.get("author")
+        if author is not None:
+            key += (author["id"], author["version"])
+        return key
+
+    key = (entity.id, entity.version)
+    author = getattr(entity, "author", None)
+    if author is not None:
+        key += (author.id, author.version)
+    return key
+
+
+def entity_etag(kind: str, key: VersionKey) -> str:
+    """ETag of a single entity, e.g. ``entity_etag("recipe", version_key(recipe))``."""
+    return _digest(kind, key)
+
+
+def page_etag(kind: str, limit: int, keys: Iterable[VersionKey]) -> str:
+    """
+    ETag of one page of a list endpoint.
+
+    `limit` is part of it because it decides whether an X-Next-Cursor header is sent.
+    """
+    return _digest(kind, limit, *keys)
+
+
+def _digest(*parts: Any) -> str:
+    return '"' + hashlib.blake2b(repr(parts).encode(), digest_size=16).hexdigest() + '"'
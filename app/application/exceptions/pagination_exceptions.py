@@ -0,0 +1,3 @@
+class InvalidCursorError(Exception):
+    def __init__(self, cursor: str) -> None:
+        super().__init__(f"Invalid pagination cursor '{cursor}'.")
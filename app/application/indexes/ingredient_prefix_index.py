@@ -0,0 +1,164 @@
+"""
+Process-level prefix index over ingredient names, for typeahead.
+
+Every name is kept in a sorted list under its casefolded form, and in a
+second one under the casefolded form of each later word ("juice" for
+"Lemon Juice"), so the entries matching a prefix form one contiguous run
+in each list, found by binary search.
+
+Like the ingredient -> recipes index, it is loaded on first use and then
+kept current by the ingredient service on create and delete. It is
+reloaded after `INGREDIENT_SUGGEST_MAX_AGE` seconds to pick up writes made
+by other processes (0 disables the periodic reload).
+"""
+
+import bisect
+import os
+import threading
+import time
+from typing import Callable, Iterable, List, Optional, Tuple
+
+# (casefolded key, ingredient ID, name)
+_Entry = Tuple[str, int, str]
+
+
+def _normalize(text: str) -> str:
+    return " ".join(text.casefold().split())
+
+
+def _entries(ingredient_id: int, name: str) -> Tuple[_Entry, List[_Entry]]:
+    """Helper: the whole-name entry and the later-word entries of one ingredient."""
+    words = _normalize(name).split(" ")
+    whole = (" ".join(words), ingredient_id, name)
+    return whole, [(" ".join(words[i:]), ingredient_id, name) for i in range(1, len(words))]
+
+
+class IngredientPrefixIndex:
+    """
+    Thread-safe sorted-array prefix index.
+
+    Lookups are a bisect plus at most `limit` entries read per list;
+    creates and deletes are a bisect insert/remove. All operations hold a
+    single lock briefly.
+    """
+
+    def __init__(self, max_age: float = 0) -> None:
+        self.max_age = max_age
+        self._names: List[_Entry] = []
+        self._words: List[_Entry] = []
+        self._loaded_at: Optional[float] = None
+        self._stale = False
+        self._pending: Optional[List[Tuple[str, int, str]]] = None
+        self._lock = threading.Lock()
+        self._load_lock = threading.Lock()
+
+    # ───────────────────────── loading ──────────────────────────
+    def ensure_loaded(self, loader: Callable[[], Iterable[Tuple[int, str]]]) -> None:
+        """
+        Load every (id, name) pair with `loader` on first use or when stale.
+
+        Like `IngredientRecipeIndex.ensure_loaded`, the first load holds a
+        thread lock across `loader`: on an event loop, let one caller in
+        until `loaded` is true.
+        """
+        if self._loaded_at is not None and not self._is_stale():
+            return
+        if not self._load_lock.acquire(blocking=self._loaded_at is None):
+            return   # another request is reloading; keep serving the current entries
+        try:
+            if self._loaded_at is not None and not self._is_stale():
+                return
+            with self._lock:
+                self._pending = []
+                self._stale = False
+
+            names: List[_Entry] = []
+            words: List[_Entry] = []
+            for ing_id, name in loader():
+                whole, later = _entries(ing_id, name)
+                names.append(whole)
+                words.extend(later)
+            names.sort()
+            words.sort()
+
+            with self._lock:
+                pending, self._pending = self._pending, None
+                self._names, self._words = names, words
+                for op, ing_id, name in pending:
+                    self._apply(op, ing_id, name)
+                self._loaded_at = time.monotonic()
+        finally:
+            self._load_lock.release()
+
+    @property
+    def loaded(self) -> bool:
+        """Whether the index was loaded at least once (stale or not)."""
+        return self._loaded_at is not None
+
+    def invalidate(self) -> None:
+        """Force a reload on next use (e.g. after a bulk import)."""
+        with self._lock:
+            self._stale = True
+
+    def _is_stale(self) -> bool:
+        if self._stale:
+            return True
+        return self.max_age > 0 and time.monotonic() - self._loaded_at > self.max_age
+
+    # ───────────────────────── writes ───────────────────────────
+    def add(self, ingredient_id: int, name: str) -> None:
+        self._write("add", ingredient_id, name)
+
+    def remove(self, ingredient_id: int, name: str) -> None:
+        self._write("remove", ingredient_id, name)
+
+    def _write(self, op: str, ingredient_id: int, name: str) -> None:
+        with self._lock:
+            if self._pending is not None:
+                self._pending.append((op, ingredient_id, name))
+            if self._loaded_at is not None:
+                self._apply(op, ingredient_id, name)
+
+    def _apply(self, op: str, ingredient_id: int, name: str) -> None:
+        whole, later = _entries(ingredient_id, name)
+        for entries, entry in [(self._names, whole)] + [(self._words, e) for e in later]:
+            pos = bisect.bisect_left(entries, entry)
+            present = pos < len(entries) and entries[pos] == entry
+            if op == "add" and not present:
+                entries.insert(pos, entry)
+            elif op == "remove" and present:
+                del entries[pos]
+
+    # ───────────────────────── queries ──────────────────────────
+    def suggest(self, prefix: str, *, limit: int = 10) -> List[Tuple[int, str]]:
+        """
+        Up to `limit` ingredients whose name, or a later word of it, starts
+        with `prefix` (case-insensitive). Whole-name matches come first,
+        each group in alphabetical order.
+
+        Returns:
+            ``(ingredient_id, name)`` tuples.
+        """
+        key = _normalize(prefix)
+        if not key:
+            return []
+
+        found: List[Tuple[int, str]] = []
+        seen = set()
+        with self._lock:
+            for entries in (self._names, self._words):
+                pos = bisect.bisect_left(entries, (key,))
+                while pos < len(entries) and len(found) < limit:
+                    entry_key, ing_id, name = entries[pos]
+                    if not entry_key.startswith(key):
+                        break
+                    if ing_id not in seen:
+                        seen.add(ing_id)
+                        found.append((ing_id, name))
+                    pos += 1
+        return found
+
+
+ingredient_prefix_index = IngredientPrefixIndex(
+    max_age=float(os.getenv("INGREDIENT_SUGGEST_MAX_AGE", "300")),
+)
@@ -0,0 +1,221 @@
+"""
+Process-level inverted index ``ingredient_id -> recipe IDs``.
+
+Answers "recipes with all/any/none of these ingredients" and "what can I
+cook with my pantry" from memory, as set algebra on compressed (roaring)
+bitmaps, instead of self-joining and grouping `recipe_ingredients` in SQL.
+
+The index is built lazily from two aggregate queries on first use, then
+kept current by the recipe services, which forward every create, update
+and delete here after committing. Writes made by other processes are not
+seen, so it is also rebuilt after `INGREDIENT_INDEX_MAX_AGE` seconds
+(0 disables the periodic rebuild).
+"""
+
+import os
+import threading
+import time
+from itertools import islice
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+from pyroaring import BitMap
+
+# (ingredient_id -> recipe IDs, ingredient count -> recipe IDs), as loaded from the DB
+Postings = Tuple[Iterable[Tuple[int, List[int]]], Iterable[Tuple[int, List[int]]]]
+
+
+class IngredientRecipeIndex:
+    """
+    Thread-safe ingredient -> recipe bitmaps, plus recipes bucketed by how
+    many ingredients they have (used to rank pantry matches).
+
+    Queries and writes hold a lock only around bitmap operations. A rebuild
+    loads the new bitmaps without it; writes that land meanwhile are
+    recorded and replayed onto the new bitmaps before they are installed.
+    """
+
+    def __init__(self, max_age: float = 0) -> None:
+        self.max_age = max_age
+        self._postings: Dict[int, BitMap] = {}
+        self._by_size: Dict[int, BitMap] = {}
+        self._built_at: Optional[float] = None
+        self._stale = False
+        self._pending: Optional[List[Tuple[str, int, Tuple[int, ...]]]] = None
+        self._lock = threading.Lock()
+        self._build_lock = threading.Lock()
+
+    # ───────────────────────── loading ──────────────────────────
+    def ensure_loaded(self, loader: Callable[[], Postings]) -> None:
+        """
+        Build the index with `loader` if it was never built, or rebuild it
+        when it is stale. Only the first build blocks concurrent readers; a
+        rebuild is done by one caller while the others keep using the
+        current bitmaps.
+
+        The first build holds a thread lock while `loader` runs: callers
+        sharing an event loop (sync services under `run_sync`) must make
+        sure only one of them gets here before `loaded` is true (see
+        app/application/services/async_recipe_service.py).
+        """
+        if self._built_at is not None and not self._is_stale():
+            return
+        blocking = self._built_at is None
+        if not self._build_lock.acquire(blocking=blocking):
+            return
+        try:
+            if self._built_at is not None and not self._is_stale():
+                return
+            with self._lock:
+                self._pending = []
+                self._stale = False
+
+            by_ingredient, by_size = loader()
+            postings = {ing_id: BitMap(ids) for ing_id, ids in by_ingredient}
+            sizes = {size: BitMap(ids) for size, ids in by_size}
+            for bitmap in (*postings.values(), *sizes.values()):
+                bitmap.run_optimize()
+
+            with self._lock:
+                pending, self._pending = self._pending, None
+                self._postings, self._by_size = postings, sizes
+                for op, recipe_id, ingredient_ids in pending:
+                    self._apply(op, recipe_id, ingredient_ids)
+                self._built_at = time.monotonic()
+        finally:
+            self._build_lock.release()
+
+    @property
+    def loaded(self) -> bool:
+        """Whether the index was built at least once (stale or not)."""
+        return self._built_at is not None
+
+    def invalidate(self) -> None:
+        """Force a rebuild on next use (e.g. after a bulk import)."""
+        with self._lock:
+            self._stale = True
+
+    def _is_stale(self) -> bool:
+        if self._stale:
+            return True
+        return self.max_age > 0 and time.monotonic() - self._built_at > self.max_age
+
+    # ───────────────────────── writes ───────────────────────────
+    def add_recipe(self, recipe_id: int, ingredient_ids: Iterable[int]) -> None:
+        self._write("add", recipe_id, ingredient_ids)
+
+    def remove_recipe(self, recipe_id: int, ingredient_ids: Iterable[int]) -> None:
+        """`ingredient_ids` must be the ingredients the recipe had when it was indexed."""
+        self._write("remove", recipe_id, ingredient_ids)
+
+    def _write(self, op: str, recipe_id: int, ingredient_ids: Iterable[int]) -> None:
+        ingredient_ids = tuple(set(ingredient_ids))
+        with self._lock:
+            if self._pending is not None:
+                self._pending.append((op, recipe_id, ingredient_ids))
+            if self._built_at is not None:
+                self._apply(op, recipe_id, ingredient_ids)
+
+    def _apply(self, op: str, recipe_id: int, ingredient_ids: Tuple[int, ...]) -> None:
+        # Both operations are idempotent, so replaying a write the loader already saw is harmless.
+        if op == "add":
+            for ing_id in ingredient_ids:
+                self._postings.setdefault(ing_id, BitMap()).add(recipe_id)
+            self._by_size.setdefault(len(ingredient_ids), BitMap()).add(recipe_id)
+        else:
+            for ing_id in ingredient_ids:
+                posting = self._postings.get(ing_id)
+                if posting is not None:
+                    posting.discard(recipe_id)
+            size_bucket = self._by_size.get(len(ingredient_ids))
+            if size_bucket is not None:
+                size_bucket.discard(recipe_id)
+
+    # ───────────────────────── queries ──────────────────────────
+    def match(
+        self,
+        *,
+        all_of: Iterable[int] = (),
+        any_of: Iterable[int] = (),
+        none_of: Iterable[int] = (),
+        after_id: Optional[int] = None,
+        limit: int = 100,
+    ) -> List[int]:
+        """
+        IDs of the recipes that use every ingredient of `all_of`, at least
+        one of `any_of` (when given) and none of `none_of`, in ID order.
+        """
+        all_of, any_of, none_of = set(all_of), set(any_of), set(none_of)
+        with self._lock:
+            if all_of:
+                result = BitMap.intersection(*(self._posting(i) for i in all_of))
+            else:
+                result = BitMap.union(BitMap(), *self._by_size.values())
+            if any_of:
+                result &= BitMap.union(*(self._posting(i) for i in any_of))
+            if none_of:
+                result -= BitMap.union(*(self._posting(i) for i in none_of))
+
+        start = 0 if after_id is None else after_id + 1
+        return list(islice(result.iter_equal_or_larger(start), limit))
+
+    def pantry(
+        self,
+        have: Iterable[int],
+        *,
+        max_missing: int,
+        after: Optional[Tuple[int, int]] = None,
+        limit: int = 100,
+    ) -> List[Tuple[int, int]]:
+        """
+        Recipes that use at least one ingredient of `have`, ordered by how
+        many of their ingredients are missing, then by ID.
+
+        Args:
+            have: Ingredient IDs available in the pantry.
+            max_missing: Recipes missing more ingredients than this are left out.
+            after: Keyset cursor, the (missing, recipe_id) of the last row of the previous page.
+            limit: Maximum number of rows to return.
+
+        Returns:
+            ``(recipe_id, missing_count)`` tuples.
+        """
+        have = set(have)
+        with self._lock:
+            postings = [self._posting(i) for i in have]
+            by_size = {size: recipes for size, recipes in self._by_size.items() if size}
+
+            # at_least[j] = recipes using at least j pantry ingredients ("bit-sliced" counting)
+            levels = min(len(postings), max(by_size, default=0))
+            at_least = [BitMap() for _ in range(levels + 2)]
+            for seen, posting in enumerate(postings, start=1):
+                for j in range(min(seen, levels), 1, -1):
+                    at_least[j] |= at_least[j - 1] & posting
+                at_least[1] |= posting
+
+            # A recipe of `size` ingredients misses `missing` of them iff it matches exactly size - missing.
+            buckets: List[BitMap] = []
+            for missing in range(max_missing + 1):
+                bucket = BitMap()
+                for size, recipes in by_size.items():
+                    matched = size - missing
+                    if 1 <= matched <= levels:
+                        bucket |= recipes & (at_least[matched] - at_least[matched + 1])
+                buckets.append(bucket)
+
+        rows: List[Tuple[int, int]] = []
+        first_missing, after_id = after if after is not None else (0, None)
+        for missing in range(first_missing, max_missing + 1):
+            start = after_id + 1 if missing == first_missing and after_id is not None else 0
+            for recipe_id in islice(buckets[missing].iter_equal_or_larger(start), limit - len(rows)):
+                rows.append((recipe_id, missing))
+            if len(rows) >= limit:
+                break
+        return rows
+
+    def _posting(self, ingredient_id: int) -> BitMap:
+        return self._postings.get(ingredient_id) or BitMap()
+
+
+ingredient_recipe_index = IngredientRecipeIndex(
+    max_age=float(os.getenv("INGREDIENT_INDEX_MAX_AGE", "300")),
+)
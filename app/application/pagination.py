@@ -0,0 +1,85 @@
+"""
+Opaque cursors for keyset pagination.
+
+A cursor encodes the sort key of the last row of a page (e.g. ``{"id": 42}``)
+as URL-safe base64 JSON. Clients pass it back as ``?after=<cursor>`` and the
+repositories resume with ``WHERE key > :last`` instead of ``OFFSET``, so deep
+pages cost the same as the first one.
+"""
+
+import base64
+import binascii
+import json
+from typing import Any, Dict, Mapping, Optional, Sequence, Tuple
+
+from app.application.exceptions.pagination_exceptions import InvalidCursorError
+
+
+def encode_cursor(values: Dict[str, Any]) -> str:
+    """Serialize the sort key of the last returned row into an opaque token."""
+    raw = json.dumps(values, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Dict[str, Any]:
+    """
+    Parse a token produced by `encode_cursor`.
+
+    Raises:
+        InvalidCursorError: If the token is not a cursor issued by this API.
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        values = json.loads(raw)
+    except (binascii.Error, ValueError) as exc:
+        raise InvalidCursorError(cursor) from exc
+    if not isinstance(values, dict):
+        raise InvalidCursorError(cursor)
+    return values
+
+
+def decode_id_cursor(cursor: Optional[str]) -> Optional[int]:
+    """Decode an ``{"id": ...}`` cursor; ``None`` means "start from the beginning"."""
+    if cursor is None:
+        return None
+    last_id = decode_cursor(cursor).get("id")
+    if not isinstance(last_id, int) or isinstance(last_id, bool):
+        raise InvalidCursorError(cursor)
+    return last_id
+
+
+def decode_int_cursor(cursor: Optional[str], *keys: str) -> Optional[Tuple[int, ...]]:
+    """Decode a cursor whose `keys` are all integers, e.g. ``{"missing": 1, "id": 42}``."""
+    if cursor is None:
+        return None
+    values = decode_cursor(cursor)
+    decoded = tuple(values.get(key) for key in keys)
+    if not all(isinstance(v, int) and not isinstance(v, bool) for v in decoded):
+        raise InvalidCursorError(cursor)
+    return decoded
+
+
+def next_id_cursor(items: Sequence[Any], limit: int) -> Optional[str]:
+    """Cursor for the page after `items`, or ``None`` when this was the last page."""
+    if len(items) < limit or not items:
+        return None
+    last = items[-1]
+    return encode_cursor({"id": last["id"] if isinstance(last, Mapping) else last.id})
+
+
+def decode_rank_cursor(cursor: Optional[str]) -> Optional[Tuple[float, int]]:
+    """Decode a ``{"rank": ..., "id": ...}`` cursor of a ranked (search) listing."""
+    if cursor is None:
+        return None
+    values = decode_cursor(cursor)
+    rank, last_id = values.get("rank"), values.get("id")
+    if not isinstance(rank, (int, float)) or isinstance(rank, bool) or not isinstance(last_id, int):
+        raise InvalidCursorError(cursor)
+    return float(rank), last_id
+
+
+def next_rank_cursor(items: Sequence[Any], limit: int) -> Optional[str]:
+    """Like `next_id_cursor`, for items ordered by ``rank DESC, id``."""
+    if len(items) < limit or not items:
+        return None
+    return encode_cursor({"rank": items[-1].rank, "id": items[-1].id})
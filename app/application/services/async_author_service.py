@@ -0,0 +1,86 @@
+"""
+Async service layer for Author entity.
+
+Async counterparts of `author_service`, for the `async def` routers. Each
+function runs the sync service inside `AsyncSession.run_sync`, so the
+business rules and queries live in a single place while the DB I/O happens
+on the asyncpg connection without blocking the event loop.
+
+ORM objects are converted to response schemas before leaving `run_sync`:
+attribute loads outside of it would fail on an async connection.
+"""
+
+from typing import List, Optional
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.application.services import author_service
+from app.domain.schemas.author import (
+    AuthorBulkResult,
+    AuthorConflictPolicy,
+    AuthorCreate,
+    AuthorResponse,
+)
+
+
+async def create_authors_service(db: AsyncSession, author_items: List[AuthorCreate]) -> List[AuthorResponse]:
+    def _create(session) -> List[AuthorResponse]:
+        authors = author_service.create_authors_service(session, author_items)
+        return [AuthorResponse.model_validate(a) for a in authors]
+
+    return await db.run_sync(_create)
+
+
+async def bulk_create_authors_service(
+    db: AsyncSession,
+    author_items: List[AuthorCreate],
+    *,
+    on_conflict: AuthorConflictPolicy = AuthorConflictPolicy.error,
+) -> AuthorBulkResult:
+    return await db.run_sync(
+        author_service.bulk_create_authors_service, author_items, on_conflict=on_conflict
+    )
+
+
+async def get_author_service(db: AsyncSession, author_id: int) -> AuthorResponse:
+    return await db.run_sync(author_service.get_author_service, author_id)
+
+
+async def list_authors_service(
+    db: AsyncSession,
+    skip: int = 0,
+    limit: int = 100,
+    after: Optional[str] = None,
+) -> List[AuthorResponse]:
+    return await db.run_sync(author_service.list_authors_service, skip=skip, limit=limit, after=after)
+
+
+async def get_author_etag_service(db: AsyncSession, author_id: int) -> str:
+    return await db.run_sync(author_service.get_author_etag_service, author_id)
+
+
+async def list_authors_etag_service(
+    db: AsyncSession,
+    *,
+    skip: int = 0,
+    limit: int = 100,
+    after: Optional[str] = None,
+) -> str:
+    return await db.run_sync(author_service.list_authors_etag_service, skip=skip, limit=limit, after=after)
+
+
+async def update_author_service(
+    db: AsyncSession,
+    author_id: int,
+    *,
+    name: Optional[str] = None,
+    email: Optional[str] = None
+) -> AuthorResponse:
+    def _update(session) -> AuthorResponse:
+        author = author_service.update_author_service(session, author_id, name=name, email=email)
+        return AuthorResponse.model_validate(author)
+
+    return await db.run_sync(_update)
+
+
+async def delete_author_service(db: AsyncSession, author_id: int) -> None:
+    await db.run_sync(author_service.delete_author_service, author_id)
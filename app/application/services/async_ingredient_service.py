@@ -0,0 +1,71 @@
+"""
+Async service layer for Ingredient entity.
+
+Async counterparts of `ingredient_service`; see `async_author_service`
+for how the sync services are reused through `AsyncSession.run_sync`.
+"""
+
+from typing import List, Optional
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.application.indexes.ingredient_prefix_index import ingredient_prefix_index
+from app.application.services import ingredient_service
+from app.application.singleflight import AsyncSingleFlight
+from app.domain.schemas.ingredient import IngredientResponse, IngredientSuggestion
+
+# Like the ingredient -> recipes index (see `async_recipe_service`), the
+# first prefix index load must not be entered twice from `run_sync`.
+async_prefix_index_loads = AsyncSingleFlight("async_prefix_index_loads", timeout=None)
+
+
+# ───────────────────────── CREATE ─────────────────────────
+async def create_ingredient_service(db: AsyncSession, *, name: str) -> IngredientResponse:
+    def _create(session) -> IngredientResponse:
+        ingredient = ingredient_service.create_ingredient_service(session, name=name)
+        return IngredientResponse.model_validate(ingredient)
+
+    return await db.run_sync(_create)
+
+
+# ───────────────────────── READ ──────────────────────────
+async def get_ingredient_service(db: AsyncSession, ingredient_id: int) -> IngredientResponse:
+    return await db.run_sync(ingredient_service.get_ingredient_service, ingredient_id)
+
+
+async def list_ingredients_service(
+    db: AsyncSession,
+    skip: int = 0,
+    limit: int = 100,
+    after: Optional[str] = None,
+) -> List[IngredientResponse]:
+    return await db.run_sync(ingredient_service.list_ingredients_service, skip=skip, limit=limit, after=after)
+
+
+async def get_ingredient_etag_service(db: AsyncSession, ingredient_id: int) -> str:
+    return await db.run_sync(ingredient_service.get_ingredient_etag_service, ingredient_id)
+
+
+async def list_ingredients_etag_service(
+    db: AsyncSession,
+    *,
+    skip: int = 0,
+    limit: int = 100,
+    after: Optional[str] = None,
+) -> str:
+    return await db.run_sync(ingredient_service.list_ingredients_etag_service, skip=skip, limit=limit, after=after)
+
+
+async def suggest_ingredients_service(
+    db: AsyncSession, prefix: str, *, limit: int = 10, fuzzy: bool = False
+) -> List[IngredientSuggestion]:
+    if not ingredient_prefix_index.loaded:
+        await async_prefix_index_loads.do(
+            "ingredient_prefix_index",
+            lambda: db.run_sync(ingredient_service.ensure_prefix_index_service),
+        )
+    return await db.run_sync(ingredient_service.suggest_ingredients_service, prefix, limit=limit, fuzzy=fuzzy)
+
+
+# ───────────────────────── DELETE ────────────────────────
+async def delete_ingredient_service(db: AsyncSession, ingredient_id: int) -> None:
+    await db.run_sync(ingredient_service.delete_ingredient_service, ingredient_id)
@@ -0,0 +1,168 @@
+"""
+Async service layer for Recipe entity.
+
+Async counterparts of `recipe_service`; see `async_author_service`
+for how the sync services are reused through `AsyncSession.run_sync`.
+"""
+
+from typing import List, Optional
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.application.indexes.ingredient_recipe_index import ingredient_recipe_index
+from app.application.services import recipe_service
+from app.application.singleflight import AsyncSingleFlight
+from app.domain.schemas.recipe import RecipePantryMatch, RecipeResponse, RecipeSearchHit, ShoppingListResponse
+
+# Reads are coalesced here, before `run_sync`: the sync services' thread-based
+# coalescing would block the event loop while the leader awaits the database.
+async_recipe_reads = AsyncSingleFlight("async_recipe_reads", timeout=recipe_service.COALESCE_TIMEOUT)
+
+# The first index build holds a thread lock across its queries: a second
+# request entering it from `run_sync` would block the loop the first one
+# needs to finish. Only one request builds; the others await it, untimed.
+async_index_builds = AsyncSingleFlight("async_index_builds", timeout=None)
+
+
+async def _ensure_ingredient_index(db: AsyncSession) -> None:
+    """Helper: let a single request build the ingredient -> recipes index the first time."""
+    if not ingredient_recipe_index.loaded:
+        await async_index_builds.do(
+            "ingredient_recipe_index",
+            lambda: db.run_sync(recipe_service.ensure_ingredient_index_service),
+        )
+
+
+# ───────────────────────── CREATE ──────────────────────────
+async def create_recipe_service(
+    db: AsyncSession,
+    *,
+    title: str,
+    description: Optional[str],
+    author_id: int,
+    ingredients_data: List[dict],
+) -> RecipeResponse:
+    def _create(session) -> RecipeResponse:
+        recipe = recipe_service.create_recipe_service(
+            session,
+            title=title,
+            description=description,
+            author_id=author_id,
+            ingredients_data=ingredients_data,
+        )
+        return RecipeResponse.model_validate(recipe)
+
+    return await db.run_sync(_create)
+
+
+# ───────────────────────── READ ────────────────────────────
+async def get_recipe_service(db: AsyncSession, recipe_id: int) -> RecipeResponse:
+    return await async_recipe_reads.do(
+        recipe_service.read_flight_key(db.sync_session, f"recipe:{recipe_id}"),
+        lambda: db.run_sync(recipe_service.get_recipe_service, recipe_id, coalesce=False),
+    )
+
+
+async def list_recipes_service(
+    db: AsyncSession,
+    *,
+    skip: int = 0,
+    limit: int = 100,
+    after: Optional[str] = None,
+) -> List[dict]:
+    return await async_recipe_reads.do(
+        recipe_service.read_flight_key(db.sync_session, f"recipes:{skip}:{limit}:{after}"),
+        lambda: db.run_sync(
+            recipe_service.list_recipes_service, skip=skip, limit=limit, after=after, coalesce=False
+        ),
+    )
+
+
+async def search_recipes_service(
+    db: AsyncSession,
+    query: str,
+    *,
+    limit: int = 20,
+    after: Optional[str] = None,
+) -> List[RecipeSearchHit]:
+    return await db.run_sync(recipe_service.search_recipes_service, query, limit=limit, after=after)
+
+
+async def find_recipes_by_ingredients_service(
+    db: AsyncSession,
+    *,
+    all_of: List[int],
+    any_of: List[int],
+    none_of: List[int],
+    limit: int = 100,
+    after: Optional[str] = None,
+) -> List[RecipeResponse]:
+    await _ensure_ingredient_index(db)
+    return await db.run_sync(
+        recipe_service.find_recipes_by_ingredients_service,
+        all_of=all_of,
+        any_of=any_of,
+        none_of=none_of,
+        limit=limit,
+        after=after,
+    )
+
+
+async def pantry_recipes_service(
+    db: AsyncSession,
+    have: List[int],
+    *,
+    max_missing: int = 3,
+    limit: int = 20,
+    after: Optional[str] = None,
+) -> List[RecipePantryMatch]:
+    await _ensure_ingredient_index(db)
+    return await db.run_sync(
+        recipe_service.pantry_recipes_service, have, max_missing=max_missing, limit=limit, after=after
+    )
+
+
+async def shopping_list_service(
+    db: AsyncSession, recipe_ids: List[int], multipliers: List[float]
+) -> ShoppingListResponse:
+    return await db.run_sync(recipe_service.shopping_list_service, recipe_ids, multipliers)
+
+
+async def get_recipe_etag_service(db: AsyncSession, recipe_id: int) -> str:
+    return await db.run_sync(recipe_service.get_recipe_etag_service, recipe_id)
+
+
+async def list_recipes_etag_service(
+    db: AsyncSession,
+    *,
+    skip: int = 0,
+    limit: int = 100,
+    after: Optional[str] = None,
+) -> str:
+    return await db.run_sync(recipe_service.list_recipes_etag_service, skip=skip, limit=limit, after=after)
+
+
+# ───────────────────────── UPDATE ──────────────────────────
+async def update_recipe_service(
+    db: AsyncSession,
+    recipe_id: int,
+    *,
+    title: Optional[str] = None,
+    description: Optional[str] = None,
+    ingredients_data: Optional[List[dict]] = None,
+) -> RecipeResponse:
+    def _update(session) -> RecipeResponse:
+        recipe = recipe_service.update_recipe_service(
+            session,
+            recipe_id,
+            title=title,
+            description=description,
+            ingredients_data=ingredients_data,
+        )
+        return RecipeResponse.model_validate(recipe)
+
+    return await db.run_sync(_update)
+
+
+# ───────────────────────── DELETE ──────────────────────────
+async def delete_recipe_service(db: AsyncSession, recipe_id: int) -> None:
+    await db.run_sync(recipe_service.delete_recipe_service, recipe_id)
@@ -5,17 +5,32 @@ This module contains business logic related to authors, and interacts
 with the repository layer to perform DB operations.
 """
 
-from typing import List, Optional
+from typing import Iterator, List, Optional
+from pydantic import TypeAdapter
+from sqlalchemy import Row
 from sqlalchemy.orm import Session
 
-from app.domain.models.author import Author
+from app.persistence.constraints import ConstraintViolation
 from app.persistence.repositories import author_repository
-from app.domain.schemas.author import AuthorCreate
+from app.application.indexes.ingredient_recipe_index import ingredient_recipe_index
+from app.domain.schemas.author import (
+    AuthorBulkItemResult,
+    AuthorBulkResult,
+    AuthorBulkStatus,
+    AuthorConflictPolicy,
+    AuthorCreate,
+    AuthorResponse,
+)
 from app.application.exceptions.author_exceptions import AuthorAlreadyExistsError, AuthorNotFoundError
+from app.application.cache.response_cache import response_cache
+from app.application.etags import entity_etag, page_etag, version_key
+from app.application.pagination import decode_id_cursor
 
+_AUTHOR = TypeAdapter(AuthorResponse)
+_AUTHOR_PAGE = TypeAdapter(List[AuthorResponse])
 
 
-def create_authors_service(db: Session, author_items: List[AuthorCreate]) -> List[Author]:
+def create_authors_service(db: Session, author_items: List[AuthorCreate]) -> List[Row]:
     """
     Create one or many authors.
 
@@ -25,30 +40,160 @@ def create_authors_service(db: Session, author_items: List[AuthorCreate]) -> Lis
     if len(set(emails)) != len(emails):
         raise AuthorAlreadyExistsError(email="Duplicated email in payload")
 
-    # 2) Verify if there are duplicated emails in DB
-    for email in emails:
-        if author_repository.get_author_by_email(db, email):
-            raise AuthorAlreadyExistsError(email=email)
+    # 2) Emails already in DB are rejected by the unique constraint on the INSERT itself
+    try:
+        created = author_repository.create_authors(db, author_items)
+    except ConstraintViolation as exc:
+        raise _email_conflict(exc) from exc
+    response_cache.invalidate("authors")
+    return created
 
-    return author_repository.create_authors(db, author_items)
 
+def _email_conflict(violation: ConstraintViolation) -> Exception:
+    """Helper: the domain error for a write rejected by a constraint."""
+    if violation.is_unique and violation.column == "email":
+        return AuthorAlreadyExistsError(email=violation.value)
+    return violation
 
-def get_author_service(db: Session, author_id: int) -> Author:
+
+def bulk_create_authors_service(
+    db: Session,
+    author_items: List[AuthorCreate],
+    *,
+    on_conflict: AuthorConflictPolicy = AuthorConflictPolicy.error,
+) -> AuthorBulkResult:
+    """
+    Create many authors and report what happened to each payload item.
+
+    With `on_conflict=error` this behaves like `create_authors_service`.
+    With `skip` or `update`, conflicts on existing emails are resolved by
+    PostgreSQL in the INSERT itself. Repeated emails inside the payload
+    are reported as skipped after their first occurrence.
+
+    Raises:
+        AuthorAlreadyExistsError: Only with `on_conflict=error`.
+    """
+    if on_conflict is AuthorConflictPolicy.error:
+        created = create_authors_service(db, author_items)
+        items = [
+            AuthorBulkItemResult(email=row.email, status=AuthorBulkStatus.created, author=row)
+            for row in created
+        ]
+    else:
+        unique_items: List[AuthorCreate] = []
+        seen: set[str] = set()
+        for a in author_items:
+            if a.email not in seen:
+                seen.add(a.email)
+                unique_items.append(a)
+
+        rows = author_repository.upsert_authors(
+            db,
+            unique_items,
+            update_existing=on_conflict is AuthorConflictPolicy.update,
+        )
+        by_email = {row.email: row for row in rows}
+        response_cache.invalidate("authors", *(f"author:{row.id}" for row in rows if not row.inserted))
+
+        items = []
+        for a in author_items:
+            row = by_email.pop(a.email, None)
+            if row is None:
+                items.append(AuthorBulkItemResult(email=a.email, status=AuthorBulkStatus.skipped))
+            else:
+                status = AuthorBulkStatus.created if row.inserted else AuthorBulkStatus.updated
+                items.append(AuthorBulkItemResult(email=a.email, status=status, author=row))
+
+    return AuthorBulkResult(
+        created=sum(i.status is AuthorBulkStatus.created for i in items),
+        updated=sum(i.status is AuthorBulkStatus.updated for i in items),
+        skipped=sum(i.status is AuthorBulkStatus.skipped for i in items),
+        items=items,
+    )
+
+
+def get_author_service(db: Session, author_id: int) -> AuthorResponse:
     """
-    Retrieve an author by ID, or raise if not found.
+    Retrieve an author by ID (from the response cache when present), or raise if not found.
 
     Raises:
         AuthorNotFoundError: If no author with the given ID exists.
     """
-    author = author_repository.get_author_by_id(db, author_id)
-    if author is None:
+    def _load() -> AuthorResponse:
+        with response_cache.loader_session(db) as session:
+            author = author_repository.get_author_by_id(session, author_id)
+            if author is None:
+                raise AuthorNotFoundError(author_id=author_id)
+            return AuthorResponse.model_validate(author)
+
+    return response_cache.get_or_load(
+        f"author:{author_id}", _load, adapter=_AUTHOR, tags=lambda a: [f"author:{a.id}"]
+    )
+
+
+def list_authors_service(
+    db: Session,
+    skip: int = 0,
+    limit: int = 100,
+    after: Optional[str] = None,
+) -> List[AuthorResponse]:
+    """
+    Return a paginated list of authors.
+
+    Raises:
+        InvalidCursorError: If `after` is not a valid pagination cursor.
+    """
+    after_id = decode_id_cursor(after)
+
+    def _load() -> List[AuthorResponse]:
+        with response_cache.loader_session(db) as session:
+            authors = author_repository.list_authors(session, skip=skip, limit=limit, after_id=after_id)
+            return [AuthorResponse.model_validate(a) for a in authors]
+
+    return response_cache.get_or_load(
+        f"authors:{skip}:{limit}:{after_id}",
+        _load,
+        adapter=_AUTHOR_PAGE,
+        tags=lambda page: ["authors", *(f"author:{a.id}" for a in page)],
+    )
+
+
+def get_author_etag_service(db: Session, author_id: int) -> str:
+    """
+    Current ETag of an author: from the cached response when there is one,
+    otherwise from its version columns only (no load, no serialization).
+    """
+    cached = response_cache.peek(f"author:{author_id}", _AUTHOR)
+    if cached is not None:
+        return entity_etag("author", version_key(cached))
+
+    key = author_repository.get_author_version(db, author_id)
+    if key is None:
         raise AuthorNotFoundError(author_id=author_id)
-    return author
+    return entity_etag("author", key)
+
+
+def list_authors_etag_service(
+    db: Session,
+    *,
+    skip: int = 0,
+    limit: int = 100,
+    after: Optional[str] = None,
+) -> str:
+    """Current ETag of the page `list_authors_service` would return for the same arguments."""
+    after_id = decode_id_cursor(after)
+    cached = response_cache.peek(f"authors:{skip}:{limit}:{after_id}", _AUTHOR_PAGE)
+    if cached is not None:
+        return page_etag("authors", limit, map(version_key, cached))
+
+    keys = author_repository.list_author_versions(db, skip=skip, limit=limit, after_id=after_id)
+    return page_etag("authors", limit, keys)
 
 
-def list_authors_service(db: Session, skip: int = 0, limit: int = 100) -> List[Author]:
-    """Return a paginated list of authors."""
-    return author_repository.list_authors(db, skip=skip, limit=limit)
+def export_authors_service(db: Session, *, batch_size: int = 1000) -> Iterator[List[AuthorResponse]]:
+    """Yield every author, in ID order and in batches, for a streaming export."""
+    for batch in author_repository.stream_authors(db, batch_size=batch_size):
+        yield [AuthorResponse.model_validate(a) for a in batch]
 
 
 def update_author_service(
@@ -57,23 +202,24 @@ def update_author_service(
     *,
     name: Optional[str] = None,
     email: Optional[str] = None
-) -> Author:
+) -> Row:
     """
     Update an author. Raises if not found.
 
     Raises:
         AuthorNotFoundError: If the author doesn't exist.
+        AuthorAlreadyExistsError: If the email belongs to another author.
     """
-    author = author_repository.get_author_by_id(db, author_id)
+    try:
+        author = author_repository.update_author(db, author_id, name=name, email=email)
+    except ConstraintViolation as exc:
+        raise _email_conflict(exc) from exc
     if author is None:
         raise AuthorNotFoundError(author_id=author_id)
-    
-    if email is not None:
-        duplicate = author_repository.get_author_by_email(db, email)
-        if duplicate and duplicate.id != author_id:
-            raise AuthorAlreadyExistsError(email)
 
-    return author_repository.update_author(db, author, name=name, email=email)
+    # Also evicts every cached recipe (and recipe page) embedding this author.
+    response_cache.invalidate(f"author:{author_id}")
+    return author
 
 
 def delete_author_service(db: Session, author_id: int) -> None:
@@ -83,8 +229,11 @@ def delete_author_service(db: Session, author_id: int) -> None:
     Raises:
         AuthorNotFoundError: If the author doesn't exist.
     """
-    author = author_repository.get_author_by_id(db, author_id)
-    if author is None:
+    deleted_recipes = author_repository.delete_author(db, author_id)
+    if deleted_recipes is None:
         raise AuthorNotFoundError(author_id=author_id)
 
-    author_repository.delete_author(db, author)
+    for recipe_id, ingredient_ids in deleted_recipes.items():
+        ingredient_recipe_index.remove_recipe(recipe_id, ingredient_ids)
+    # Deleting an author deletes their recipes too.
+    response_cache.invalidate(f"author:{author_id}", "authors", "recipes")
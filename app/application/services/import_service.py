@@ -0,0 +1,232 @@
+"""
+Service layer for NDJSON bulk imports.
+
+Each line is validated on its own with the entity's Pydantic schema and
+buffered. Every `chunk_size` valid rows the buffer is written through the
+repositories' bulk functions (COPY where the driver allows it) and
+committed, so only one chunk is ever held in memory whatever the size of
+the input. Invalid lines are counted and reported, never fatal.
+"""
+
+from typing import Dict, Iterable, List, Optional, Set, Tuple, Type, Union
+from pydantic import BaseModel, ValidationError
+from sqlalchemy.orm import Session
+
+from app.domain.schemas.author import AuthorCreate
+from app.domain.schemas.ingredient import IngredientCreate
+from app.domain.schemas.recipe import RecipeImport
+from app.domain.schemas.data_import import ImportEntity, ImportLineError, ImportResult
+from app.persistence.repositories import (
+    author_repository,
+    ingredient_repository,
+    recipe_repository,
+)
+from app.application.cache.response_cache import response_cache
+from app.application.indexes.ingredient_prefix_index import ingredient_prefix_index
+from app.application.indexes.ingredient_recipe_index import ingredient_recipe_index
+
+# Keeps the response small when a whole file is malformed.
+MAX_REPORTED_ERRORS = 100
+
+_SCHEMAS: Dict[ImportEntity, Type[BaseModel]] = {
+    ImportEntity.authors: AuthorCreate,
+    ImportEntity.ingredients: IngredientCreate,
+    ImportEntity.recipes: RecipeImport,
+}
+
+
+class NdjsonImporter:
+    """
+    Incremental importer for one entity type.
+
+    Usage:
+
+        importer = NdjsonImporter(db, ImportEntity.recipes)
+        for line in lines:
+            if importer.add_line(line):
+                importer.flush()
+        importer.flush()
+        report = importer.result()
+
+    `add_line` is CPU only; `flush` is where the DB round trips happen, so
+    async callers can run it in a worker thread.
+    """
+
+    def __init__(self, db: Session, entity: ImportEntity, *, chunk_size: int = 1000) -> None:
+        self.db = db
+        self.entity = entity
+        self.chunk_size = chunk_size
+        self._schema = _SCHEMAS[entity]
+        self._batch: List[Tuple[int, BaseModel]] = []
+        self._line_no = 0
+        self.imported = 0
+        self.skipped = 0
+        self.failed = 0
+        self.errors: List[ImportLineError] = []
+
+    def add_line(self, raw: Union[str, bytes]) -> bool:
+        """
+        Validate one NDJSON line and buffer it.
+
+        Returns:
+            True when a full chunk is buffered and `flush` should be called.
+        """
+        self._line_no += 1
+        if not raw.strip():
+            return False
+
+        try:
+            item = self._schema.model_validate_json(raw)
+        except ValidationError as exc:
+            self._reject(self._line_no, _format_validation_error(exc))
+            return False
+
+        self._batch.append((self._line_no, item))
+        return len(self._batch) >= self.chunk_size
+
+    def flush(self) -> None:
+        """Write and commit the buffered chunk, if any."""
+        if not self._batch:
+            return
+        batch, self._batch = self._batch, []
+
+        if self.entity is ImportEntity.authors:
+            self._flush_authors(batch)
+        elif self.entity is ImportEntity.ingredients:
+            self._flush_ingredients(batch)
+        else:
+            self._flush_recipes(batch)
+
+    def result(self) -> ImportResult:
+        return ImportResult(
+            entity=self.entity,
+            imported=self.imported,
+            skipped=self.skipped,
+            failed=self.failed,
+            errors=sorted(self.errors, key=lambda e: e.line),
+        )
+
+    # ───────────────────────── per-entity writers ─────────────────────────
+    def _flush_authors(self, batch: List[Tuple[int, BaseModel]]) -> None:
+        rows = [(a.name, a.email) for _, a in batch]
+        inserted = author_repository.import_authors(self.db, rows)
+        if inserted:
+            response_cache.invalidate("authors")
+        self.imported += inserted
+        self.skipped += len(rows) - inserted
+
+    def _flush_ingredients(self, batch: List[Tuple[int, BaseModel]]) -> None:
+        names = [i.name for _, i in batch]
+        inserted = ingredient_repository.import_ingredients(self.db, names)
+        if inserted:
+            ingredient_prefix_index.invalidate()
+            response_cache.invalidate("ingredients")
+        self.imported += inserted
+        self.skipped += len(names) - inserted
+
+    def _flush_recipes(self, batch: List[Tuple[int, BaseModel]]) -> None:
+        recipes = [r for _, r in batch]
+
+        # Resolve every author/ingredient reference of the chunk with one query per kind.
+        known_author_ids = author_repository.get_existing_ids(
+            self.db, {r.author_id for r in recipes if r.author_id is not None}
+        )
+        author_ids_by_email = author_repository.get_ids_by_email(
+            self.db, {r.author_email for r in recipes if r.author_id is None}
+        )
+        refs = [i for r in recipes for i in r.ingredients]
+        known_ingredient_ids = set(
+            ingredient_repository.get_ingredient_names(
+                self.db, {i.ingredient_id for i in refs if i.ingredient_id is not None}
+            )
+        )
+        ingredient_ids_by_name = ingredient_repository.get_ingredient_ids_by_name(
+            self.db, {i.ingredient_name for i in refs if i.ingredient_id is None}
+        )
+
+        rows: List[dict] = []
+        for line_no, recipe in batch:
+            row, error = _resolve_recipe(
+                recipe,
+                known_author_ids,
+                author_ids_by_email,
+                known_ingredient_ids,
+                ingredient_ids_by_name,
+            )
+            if error is not None:
+                self._reject(line_no, error)
+            else:
+                rows.append(row)
+
+        if rows:
+            self.imported += recipe_repository.import_recipes(self.db, rows)
+            # Bulk path: rebuild the ingredient index rather than patch it row by row.
+            ingredient_recipe_index.invalidate()
+            response_cache.invalidate("recipes")
+
+    def _reject(self, line_no: int, error: str) -> None:
+        self.failed += 1
+        if len(self.errors) < MAX_REPORTED_ERRORS:
+            self.errors.append(ImportLineError(line=line_no, error=error))
+
+
+def import_ndjson_service(
+    db: Session,
+    entity: ImportEntity,
+    lines: Iterable[Union[str, bytes]],
+    *,
+    chunk_size: int = 1000,
+) -> ImportResult:
+    """Import every line of an NDJSON source synchronously (used by the CLI)."""
+    importer = NdjsonImporter(db, entity, chunk_size=chunk_size)
+    for line in lines:
+        if importer.add_line(line):
+            importer.flush()
+    importer.flush()
+    return importer.result()
+
+
+def _resolve_recipe(
+    recipe: RecipeImport,
+    known_author_ids: Set[int],
+    author_ids_by_email: Dict[str, int],
+    known_ingredient_ids: Set[int],
+    ingredient_ids_by_name: Dict[str, int],
+) -> Tuple[Optional[dict], Optional[str]]:
+    """Helper: map a validated import line to repository input, or explain why it can't be."""
+    if recipe.author_id is not None:
+        if recipe.author_id not in known_author_ids:
+            return None, f"Author with ID {recipe.author_id} not found."
+        author_id = recipe.author_id
+    else:
+        author_id = author_ids_by_email.get(recipe.author_email)
+        if author_id is None:
+            return None, f"Author with email '{recipe.author_email}' not found."
+
+    ingredients = []
+    for item in recipe.ingredients:
+        if item.ingredient_id is not None:
+            if item.ingredient_id not in known_ingredient_ids:
+                return None, f"Ingredient with ID {item.ingredient_id} not found."
+            ingredient_id = item.ingredient_id
+        else:
+            ingredient_id = ingredient_ids_by_name.get(item.ingredient_name)
+            if ingredient_id is None:
+                return None, f"Ingredient '{item.ingredient_name}' not found."
+        ingredients.append({"ingredient_id": ingredient_id, "quantity": item.quantity, "unit": item.unit})
+
+    if len({i["ingredient_id"] for i in ingredients}) != len(ingredients):
+        return None, "The same ingredient is listed more than once."
+
+    return {
+        "title": recipe.title,
+        "description": recipe.description,
+        "author_id": author_id,
+        "ingredients": ingredients,
+    }, None
+
+
+def _format_validation_error(exc: ValidationError) -> str:
+    return "; ".join(
+        f"{'.'.join(str(p) for p in err['loc']) or 'line'}: {err['msg']}" for err in exc.errors()
+    )
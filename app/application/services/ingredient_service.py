@@ -5,46 +5,170 @@ This module contains business logic related to ingredients, and interacts
 with the repository layer to perform DB operations.
 """
 
-from typing import List
+from typing import Iterator, List, Optional
+from pydantic import TypeAdapter
+from sqlalchemy import Row
 from sqlalchemy.orm import Session
 
-from app.domain.models.ingredient import Ingredient
-from app.domain.models.recipe_ingredient import RecipeIngredient
+from app.domain.schemas.ingredient import IngredientResponse, IngredientSuggestion
+from app.persistence.constraints import ConstraintViolation
+from app.persistence.db import primary_session
 from app.persistence.repositories import ingredient_repository
+from app.application.cache.ingredient_name_cache import ingredient_name_cache
+from app.application.cache.response_cache import response_cache
+from app.application.indexes.ingredient_prefix_index import ingredient_prefix_index
+from app.application.etags import entity_etag, page_etag, version_key
+from app.application.pagination import decode_id_cursor
 from app.application.exceptions.ingredient_exceptions import (
     IngredientAlreadyExistsError,
     IngredientNotFoundError,
     IngredientInUseError,
 )
 
+_INGREDIENT = TypeAdapter(IngredientResponse)
+_INGREDIENT_PAGE = TypeAdapter(List[IngredientResponse])
+
 
 # ───────────────────────── CREATE ─────────────────────────
-def create_ingredient_service(db: Session, *, name: str) -> Ingredient:
-    if ingredient_repository.get_ingredient_by_name(db, name):
-        raise IngredientAlreadyExistsError(name)
-    return ingredient_repository.create_ingredient(db, name=name)
+def create_ingredient_service(db: Session, *, name: str) -> Row:
+    try:
+        ingredient = ingredient_repository.create_ingredient(db, name=name)
+    except ConstraintViolation as exc:
+        if exc.is_unique and exc.column == "name":
+            raise IngredientAlreadyExistsError(name) from exc
+        raise
+    ingredient_name_cache.put(ingredient.id, ingredient.name)
+    ingredient_prefix_index.add(ingredient.id, ingredient.name)
+    response_cache.invalidate("ingredients")
+    return ingredient
 
 
 # ───────────────────────── READ ──────────────────────────
-def get_ingredient_service(db: Session, ingredient_id: int) -> Ingredient:
-    ingredient = ingredient_repository.get_ingredient_by_id(db, ingredient_id)
-    if ingredient is None:
+def get_ingredient_service(db: Session, ingredient_id: int) -> IngredientResponse:
+    def _load() -> IngredientResponse:
+        with response_cache.loader_session(db) as session:
+            ingredient = ingredient_repository.get_ingredient_by_id(session, ingredient_id)
+            if ingredient is None:
+                raise IngredientNotFoundError(ingredient_id)
+            return IngredientResponse.model_validate(ingredient)
+
+    return response_cache.get_or_load(
+        f"ingredient:{ingredient_id}", _load, adapter=_INGREDIENT, tags=lambda i: [f"ingredient:{i.id}"]
+    )
+
+
+def list_ingredients_service(
+    db: Session,
+    skip: int = 0,
+    limit: int = 100,
+    after: Optional[str] = None,
+) -> List[IngredientResponse]:
+    after_id = decode_id_cursor(after)
+
+    def _load() -> List[IngredientResponse]:
+        with response_cache.loader_session(db) as session:
+            ingredients = ingredient_repository.list_ingredients(session, skip=skip, limit=limit, after_id=after_id)
+            return [IngredientResponse.model_validate(i) for i in ingredients]
+
+    return response_cache.get_or_load(
+        f"ingredients:{skip}:{limit}:{after_id}",
+        _load,
+        adapter=_INGREDIENT_PAGE,
+        tags=lambda page: ["ingredients", *(f"ingredient:{i.id}" for i in page)],
+    )
+
+
+def get_ingredient_etag_service(db: Session, ingredient_id: int) -> str:
+    """
+    Current ETag of an ingredient: from the cached response when there is
+    one, otherwise from its version columns only (no load, no serialization).
+    """
+    cached = response_cache.peek(f"ingredient:{ingredient_id}", _INGREDIENT)
+    if cached is not None:
+        return entity_etag("ingredient", version_key(cached))
+
+    key = ingredient_repository.get_ingredient_version(db, ingredient_id)
+    if key is None:
         raise IngredientNotFoundError(ingredient_id)
-    return ingredient
+    return entity_etag("ingredient", key)
+
 
+def list_ingredients_etag_service(
+    db: Session,
+    *,
+    skip: int = 0,
+    limit: int = 100,
+    after: Optional[str] = None,
+) -> str:
+    """Current ETag of the page `list_ingredients_service` would return for the same arguments."""
+    after_id = decode_id_cursor(after)
+    cached = response_cache.peek(f"ingredients:{skip}:{limit}:{after_id}", _INGREDIENT_PAGE)
+    if cached is not None:
+        return page_etag("ingredients", limit, map(version_key, cached))
 
-def list_ingredients_service(db: Session, skip: int = 0, limit: int = 100) -> List[Ingredient]:
-    return ingredient_repository.list_ingredients(db, skip=skip, limit=limit)
+    keys = ingredient_repository.list_ingredient_versions(db, skip=skip, limit=limit, after_id=after_id)
+    return page_etag("ingredients", limit, keys)
+
+
+def export_ingredients_service(db: Session, *, batch_size: int = 1000) -> Iterator[List[IngredientResponse]]:
+    for batch in ingredient_repository.stream_ingredients(db, batch_size=batch_size):
+        yield [IngredientResponse.model_validate(i) for i in batch]
+
+
+def ensure_prefix_index_service(db: Session) -> None:
+    """
+    Load the ingredient name prefix index on first use (or when it is
+    stale), from the primary: a lagging replica could miss recent writes.
+    """
+    with primary_session(db) as session:
+        ingredient_prefix_index.ensure_loaded(lambda: ingredient_repository.get_all_ingredient_names(session))
+
+
+# Below this length trigrams carry too little signal for fuzzy matching.
+FUZZY_MIN_LENGTH = 3
+
+
+def suggest_ingredients_service(
+    db: Session, prefix: str, *, limit: int = 10, fuzzy: bool = False
+) -> List[IngredientSuggestion]:
+    """
+    Typeahead suggestions for `prefix`.
+
+    Served from the in-memory prefix index. The pg_trgm index is queried
+    only when the prefix matches no name at all (typically a typo), or
+    when `fuzzy` asks to complete a short list with the closest names:
+    most keystrokes never reach the database.
+    """
+    ensure_prefix_index_service(db)
+    suggestions = [
+        IngredientSuggestion(id=ing_id, name=name, match="prefix")
+        for ing_id, name in ingredient_prefix_index.suggest(prefix, limit=limit)
+    ]
+
+    wants_fuzzy = not suggestions or (fuzzy and len(suggestions) < limit)
+    if wants_fuzzy and len(prefix.strip()) >= FUZZY_MIN_LENGTH:
+        fuzzy_matches = ingredient_repository.suggest_ingredients_fuzzy(
+            db,
+            prefix.strip(),
+            limit=limit - len(suggestions),
+            exclude_ids={s.id for s in suggestions},
+        )
+        suggestions += [IngredientSuggestion(id=i.id, name=i.name, match="fuzzy") for i in fuzzy_matches]
+    return suggestions
 
 
 # ───────────────────────── DELETE ────────────────────────
 def delete_ingredient_service(db: Session, ingredient_id: int) -> None:
-    ingredient = ingredient_repository.get_ingredient_by_id(db, ingredient_id)
-    if ingredient is None:
+    try:
+        name = ingredient_repository.delete_ingredient(db, ingredient_id)
+    except ConstraintViolation as exc:
+        # recipe_ingredients still references it
+        if exc.is_foreign_key and exc.referenced:
+            raise IngredientInUseError(ingredient_id) from exc
+        raise
+    if name is None:
         raise IngredientNotFoundError(ingredient_id)
 
-    in_use = db.query(RecipeIngredient).filter_by(ingredient_id=ingredient_id).first()
-    if in_use:
-        raise IngredientInUseError(ingredient_id)
-
-    ingredient_repository.delete_ingredient(db, ingredient)
+    ingredient_name_cache.invalidate(ingredient_id)
+    ingredient_prefix_index.remove(ingredient_id, name)
+    response_cache.invalidate(f"ingredient:{ingredient_id}", "ingredients")
@@ -5,43 +5,165 @@ This module contains business logic for managing recipes,
 including ingredient validation and delegation to the repository layer.
 """
 
-from typing import List, Optional
+import os
+from typing import Iterator, List, Optional, Type
+from pydantic import TypeAdapter
+from sqlalchemy import Row
 from sqlalchemy.orm import Session
 
-from app.domain.models.ingredient import Ingredient
+from app.domain.models.recipe import Recipe
+from app.persistence.constraints import ConstraintViolation
+from app.persistence.db import primary_session
 from app.persistence.repositories import (
     recipe_repository,
-    author_repository,
     ingredient_repository,
 )
 
-from app.domain.schemas.recipe import RecipeResponse, IngredientInRecipe
+from app.domain.schemas.author import AuthorResponse
+from app.domain.schemas.recipe import (
+    RecipeResponse,
+    RecipePantryMatch,
+    RecipeSearchHighlights,
+    RecipeSearchHit,
+    ShoppingListItem,
+    ShoppingListResponse,
+    IngredientInRecipe,
+)
+from app.application.cache.ingredient_name_cache import ingredient_name_cache
+from app.application.cache.response_cache import PLAIN_JSON, response_cache
+from app.application.indexes.ingredient_recipe_index import ingredient_recipe_index
+from app.application.etags import entity_etag, page_etag, version_key
+from app.application.singleflight import SingleFlight
+from app.application.pagination import decode_id_cursor, decode_int_cursor, decode_rank_cursor
 from app.application.exceptions.recipe_exceptions import RecipeNotFoundError
 from app.application.exceptions.ingredient_exceptions import IngredientNotFoundError
 from app.application.exceptions.author_exceptions import AuthorNotFoundError
 
+_RECIPE = TypeAdapter(RecipeResponse)
+
+# Concurrent identical reads share one load; waiters give up after this many seconds.
+COALESCE_TIMEOUT = float(os.getenv("RECIPE_COALESCE_TIMEOUT", "5"))
+recipe_reads = SingleFlight("recipe_reads", timeout=COALESCE_TIMEOUT)
+
+
+def read_flight_key(db: Session, key: str) -> str:
+    """
+    The coalescing key of the read `key` made with `db`. Without the
+    response cache, loaders read with `db` itself: a request pinned to the
+    primary (read-your-writes) must not wait for a replica read.
+    """
+    return key if response_cache.loader_reads_primary(db) else f"replica:{key}"
+
+
+def _missing_reference(violation: ConstraintViolation, author_id: Optional[int] = None) -> Exception:
+    """Helper: the domain error for a recipe write rejected by a foreign key."""
+    if violation.is_foreign_key and violation.column == "ingredient_id":
+        return IngredientNotFoundError(violation.int_value())
+    if violation.is_foreign_key and violation.column == "author_id":
+        return AuthorNotFoundError(author_id=author_id)
+    if violation.is_foreign_key and violation.column == "recipe_id":
+        return RecipeNotFoundError(violation.int_value())   # deleted while being updated
+    return violation
+
+
+def _ingredient_names(db: Session, ingredient_ids: List[int]) -> dict[int, str]:
+    """
+    Helper: returns a mapping from ingredient_id to name for `ingredient_ids`.
+
+    Names are served from the process-level cache; only the IDs it does not
+    hold yet are fetched, with one targeted IN (...) query on the primary
+    (the cache outlives the request, so it is not filled from a replica).
+    """
+    id_to_name, missing = ingredient_name_cache.get_many(ingredient_ids)
+    if missing:
+        with primary_session(db) as session:
+            loaded = ingredient_repository.get_ingredient_names(session, missing)
+        ingredient_name_cache.put_many(loaded)
+        id_to_name.update(loaded)
+    return id_to_name
+
+
+def _build_id_to_name_map(db: Session, recipes: List[Recipe]) -> dict[int, str]:
+    """Helper: `_ingredient_names` for the ingredients used by `recipes`."""
+    return _ingredient_names(db, [ri.ingredient_id for r in recipes for ri in r.ingredients])
+
+
+def _to_recipe_response(
+    recipe: Recipe,
+    id_to_name: dict[int, str],
+    schema: Type[RecipeResponse] = RecipeResponse,
+    **extra,
+) -> RecipeResponse:
+    """
+    Helper: build the denormalized response (author + ingredient names) for a recipe.
 
-def _validate_ingredients_exist(db: Session, ingredient_ids: List[int]) -> None:
-    """Helper: ensure every ID in 'ingredient_ids' exists in the DB."""
-    if not ingredient_ids:
-        return
+    `schema` may be a RecipeResponse subclass whose additional fields are given in `extra`.
+    """
+    enriched_ingredients = [
+        IngredientInRecipe(
+            ingredient_id=ri.ingredient_id,
+            quantity=ri.quantity,
+            unit=ri.unit,
+            ingredient_name=id_to_name.get(ri.ingredient_id),
+        )
+        for ri in recipe.ingredients
+    ]
 
-    found_ids = (
-        db.query(Ingredient.id)
-        .filter(Ingredient.id.in_(ingredient_ids))
-        .all()
+    return schema(
+        id=recipe.id,
+        version=recipe.version,
+        title=recipe.title,
+        description=recipe.description,
+        author=recipe.author,
+        ingredients=enriched_ingredients,
+        **extra,
     )
-    found_ids = {row.id for row in found_ids} # set comprehension. 
 
-    for ing_id in ingredient_ids:
-        if ing_id not in found_ids:
-            raise IngredientNotFoundError(ing_id)
 
+def _recipe_dicts(recipe_rows: List[Row], ingredient_rows: List[Row], id_to_name: dict[int, str]) -> List[dict]:
+    """
+    Helper: a page of recipes as plain dicts, straight from the repository rows.
+
+    Same fields, in the same order, as `RecipeResponse`, so the JSON is
+    identical, without building and validating a model per recipe, author
+    and ingredient line: the rows come from the database, which already
+    enforced their shape. An author's dict is built once per page and
+    shared by all their recipes.
+    """
+    lines_by_recipe: dict[int, List[dict]] = {}
+    for line in ingredient_rows:
+        lines_by_recipe.setdefault(line.recipe_id, []).append({
+            "ingredient_id": line.ingredient_id,
+            "quantity": line.quantity,
+            "unit": line.unit,
+            "ingredient_name": id_to_name.get(line.ingredient_id),
+        })
+
+    authors: dict[int, dict] = {}
+    page = []
+    for r in recipe_rows:
+        author = authors.get(r.author_id)
+        if author is None:
+            author = authors[r.author_id] = {
+                "name": r.author_name,
+                "email": r.author_email,
+                "id": r.author_id,
+                "version": r.author_version,
+            }
+        page.append({
+            "title": r.title,
+            "description": r.description,
+            "id": r.id,
+            "version": r.version,
+            "author": author,
+            "ingredients": lines_by_recipe.get(r.id, []),
+        })
+    return page
 
-def _build_id_to_name_map(db: Session) -> dict[int, str]:
-    """Helper: returns a mapping from ingredient_id to name."""
-    ingredients = ingredient_repository.list_ingredients(db, skip=0, limit=10000)
-    return {ing.id: ing.name for ing in ingredients}
+
+def _recipe_tags(recipe: RecipeResponse) -> List[str]:
+    """Helper: response cache tags of a recipe (the recipe and the author it embeds)."""
+    return [f"recipe:{recipe.id}", f"author:{recipe.author.id}"]
 
 
 # ───────────────────────── CREATE ──────────────────────────
@@ -52,82 +174,296 @@ def create_recipe_service(
     description: Optional[str],
     author_id: int,
     ingredients_data: List[dict],
-):
+) -> RecipeResponse:
     """
     Business flow to create a recipe.
 
-    1. Ensure author exists.
-    2. Ensure every ingredient_id in `ingredients_data` exists.
-    3. Delegate insert to repository.
+    The author and ingredients are not looked up beforehand: their foreign
+    keys reject the INSERT, which is mapped to the not-found errors. A
+    repeated ingredient_id keeps its last line, as on update.
+
+    Raises:
+        AuthorNotFoundError: If the author doesn't exist.
+        IngredientNotFoundError: If an ingredient doesn't exist.
     """
-    author = author_repository.get_author_by_id(db, author_id)
-    if author is None:
-        raise AuthorNotFoundError(author_id=author_id)
+    lines = list({item["ingredient_id"]: item for item in ingredients_data}.values())
+    try:
+        row = recipe_repository.create_recipe(
+            db,
+            title=title,
+            description=description,
+            author_id=author_id,
+            ingredients_data=lines,
+        )
+    except ConstraintViolation as exc:
+        raise _missing_reference(exc, author_id) from exc
 
-    ingredient_ids = [item["ingredient_id"] for item in ingredients_data]
-    _validate_ingredients_exist(db, ingredient_ids)
+    ingredient_ids = [item["ingredient_id"] for item in lines]
+    ingredient_recipe_index.add_recipe(row.id, ingredient_ids)
+    response_cache.invalidate("recipes")
 
-    return recipe_repository.create_recipe(
-        db,
+    id_to_name = _ingredient_names(db, ingredient_ids)
+    return RecipeResponse(
+        id=row.id,
+        version=row.version,
         title=title,
         description=description,
-        author_id=author_id,
-        ingredients_data=ingredients_data,
+        author=AuthorResponse(
+            id=row.author_id, name=row.author_name, email=row.author_email, version=row.author_version
+        ),
+        ingredients=[
+            IngredientInRecipe(**{**item, "ingredient_name": id_to_name.get(item["ingredient_id"])})
+            for item in lines
+        ],
     )
 
 
 # ───────────────────────── READ ────────────────────────────
-def get_recipe_service(db: Session, recipe_id: int):
-    recipe = recipe_repository.get_recipe_by_id(db, recipe_id)
-    if recipe is None:
+def get_recipe_service(db: Session, recipe_id: int, *, coalesce: bool = True) -> RecipeResponse:
+    """
+    The denormalized recipe, served from the response cache when present.
+
+    Concurrent calls for the same recipe share a single load unless
+    `coalesce` is False (the async services coalesce on the event loop instead).
+
+    Raises:
+        RecipeNotFoundError: If no recipe with the given ID exists.
+    """
+    def _load() -> RecipeResponse:
+        with response_cache.loader_session(db) as session:
+            recipe = recipe_repository.get_recipe_by_id(session, recipe_id)
+            if recipe is None:
+                raise RecipeNotFoundError(recipe_id)
+
+            id_to_name = _build_id_to_name_map(session, [recipe])
+            return _to_recipe_response(recipe, id_to_name)
+
+    key = f"recipe:{recipe_id}"
+
+    def _read() -> RecipeResponse:
+        return response_cache.get_or_load(key, _load, adapter=_RECIPE, tags=_recipe_tags)
+
+    return recipe_reads.do(read_flight_key(db, key), _read) if coalesce else _read()
+
+
+def list_recipes_service(
+    db: Session,
+    *,
+    skip: int = 0,
+    limit: int = 100,
+    after: Optional[str] = None,
+    coalesce: bool = True,
+) -> List[dict]:
+    """
+    One page of recipes; coalesced and cached like `get_recipe_service`.
+
+    This is the hottest listing, so the page is built as plain dicts in
+    `RecipeResponse`'s shape (see `_recipe_dicts`) that the route encodes
+    as they are, instead of response models validated twice.
+    """
+    after_id = decode_id_cursor(after)
+
+    def _load() -> List[dict]:
+        with response_cache.loader_session(db) as session:
+            recipes, ingredients = recipe_repository.list_recipe_rows(
+                session, skip=skip, limit=limit, after_id=after_id
+            )
+            id_to_name = _ingredient_names(session, [line.ingredient_id for line in ingredients])
+            return _recipe_dicts(recipes, ingredients, id_to_name)
+
+    key = f"recipes:{skip}:{limit}:{after_id}"
+
+    def _read() -> List[dict]:
+        return response_cache.get_or_load(
+            key,
+            _load,
+            adapter=PLAIN_JSON,
+            # A page changes when any recipe on it changes, and when recipes are added or removed.
+            tags=lambda page: [
+                "recipes",
+                *(tag for r in page for tag in (f"recipe:{r['id']}", f"author:{r['author']['id']}")),
+            ],
+        )
+
+    return recipe_reads.do(read_flight_key(db, key), _read) if coalesce else _read()
+
+
+def get_recipe_etag_service(db: Session, recipe_id: int) -> str:
+    """
+    Current ETag of a recipe: from the cached response when there is one,
+    otherwise from its version columns only (no load, no serialization).
+    """
+    cached = response_cache.peek(f"recipe:{recipe_id}", _RECIPE)
+    if cached is not None:
+        return entity_etag("recipe", version_key(cached))
+
+    key = recipe_repository.get_recipe_version(db, recipe_id)
+    if key is None:
         raise RecipeNotFoundError(recipe_id)
+    return entity_etag("recipe", key)
 
-    id_to_name = _build_id_to_name_map(db)
-    enriched_ingredients = [
-        IngredientInRecipe(
-            ingredient_id=ri.ingredient_id,
-            quantity=ri.quantity,
-            unit=ri.unit,
-            ingredient_name=id_to_name.get(ri.ingredient_id),
+
+def list_recipes_etag_service(
+    db: Session,
+    *,
+    skip: int = 0,
+    limit: int = 100,
+    after: Optional[str] = None,
+) -> str:
+    """Current ETag of the page `list_recipes_service` would return for the same arguments."""
+    after_id = decode_id_cursor(after)
+    cached = response_cache.peek(f"recipes:{skip}:{limit}:{after_id}", PLAIN_JSON)
+    if cached is not None:
+        return page_etag("recipes", limit, map(version_key, cached))
+
+    keys = recipe_repository.list_recipe_versions(db, skip=skip, limit=limit, after_id=after_id)
+    return page_etag("recipes", limit, keys)
+
+
+def export_recipes_service(db: Session, *, batch_size: int = 1000) -> Iterator[List[RecipeResponse]]:
+    """
+    Yield every recipe, in ID order and in batches, for a streaming export.
+
+    Ingredient names are resolved per batch through the name cache, never
+    for the whole catalog at once.
+    """
+    for recipes in recipe_repository.stream_recipes(db, batch_size=batch_size):
+        id_to_name = _build_id_to_name_map(db, recipes)
+        yield [_to_recipe_response(r, id_to_name) for r in recipes]
+
+
+def search_recipes_service(
+    db: Session,
+    query: str,
+    *,
+    limit: int = 20,
+    after: Optional[str] = None,
+) -> List[RecipeSearchHit]:
+    """
+    Rank recipes against a full-text query and return one page of hits,
+    each with the usual denormalized recipe plus its rank and highlights.
+    """
+    hits = recipe_repository.search_recipes(
+        db, query, limit=limit, after=decode_rank_cursor(after)
+    )
+    id_to_name = _build_id_to_name_map(db, [recipe for recipe, *_ in hits])
+
+    return [
+        _to_recipe_response(
+            recipe,
+            id_to_name,
+            RecipeSearchHit,
+            rank=rank,
+            highlights=RecipeSearchHighlights(title=title_hl, description=description_hl),
         )
-        for ri in recipe.ingredients
+        for recipe, rank, title_hl, description_hl in hits
     ]
 
-    return RecipeResponse(
-        id=recipe.id,
-        title=recipe.title,
-        description=recipe.description,
-        author=recipe.author,
-        ingredients=enriched_ingredients,
+
+def ensure_ingredient_index_service(db: Session) -> None:
+    """
+    Build the ingredient -> recipes index on first use (or when it is
+    stale), from the primary: a lagging replica could miss recent writes.
+    """
+    with primary_session(db) as session:
+        ingredient_recipe_index.ensure_loaded(
+            lambda: (
+                recipe_repository.get_recipe_ids_by_ingredient(session),
+                recipe_repository.get_recipe_ids_by_ingredient_count(session),
+            )
+        )
+
+
+def find_recipes_by_ingredients_service(
+    db: Session,
+    *,
+    all_of: List[int],
+    any_of: List[int],
+    none_of: List[int],
+    limit: int = 100,
+    after: Optional[str] = None,
+) -> List[RecipeResponse]:
+    """
+    Recipes using every ingredient of `all_of`, at least one of `any_of`
+    (if given) and none of `none_of`, in ID order.
+
+    The matching runs on the in-memory ingredient index; the database is
+    only asked for the recipes of the returned page.
+    """
+    after_id = decode_id_cursor(after)
+    ensure_ingredient_index_service(db)
+    recipe_ids = ingredient_recipe_index.match(
+        all_of=all_of, any_of=any_of, none_of=none_of, after_id=after_id, limit=limit
     )
+    recipes = recipe_repository.get_recipes_by_ids(db, recipe_ids)
+    id_to_name = _build_id_to_name_map(db, recipes)
 
+    return [_to_recipe_response(r, id_to_name) for r in recipes]
 
-def list_recipes_service(db: Session, *, skip: int = 0, limit: int = 100):
-    recipes = recipe_repository.list_recipes(db, skip=skip, limit=limit)
-    id_to_name = _build_id_to_name_map(db)
 
-    response: List[RecipeResponse] = []
-    for r in recipes:
-        enriched_ingredients = [
-            IngredientInRecipe(
-                ingredient_id=ri.ingredient_id,
-                quantity=ri.quantity,
-                unit=ri.unit,
-                ingredient_name=id_to_name.get(ri.ingredient_id),
-            )
-            for ri in r.ingredients
-        ]
-
-        response.append(
-            RecipeResponse(
-                id=r.id,
-                title=r.title,
-                description=r.description,
-                author=r.author,
-                ingredients=enriched_ingredients,
-            )
+def pantry_recipes_service(
+    db: Session,
+    have: List[int],
+    *,
+    max_missing: int = 3,
+    limit: int = 20,
+    after: Optional[str] = None,
+) -> List[RecipePantryMatch]:
+    """
+    Recipes that can be cooked (or nearly) with the ingredients in `have`,
+    fewest missing ingredients first, each listing what is missing.
+    """
+    cursor = decode_int_cursor(after, "missing", "id")
+    ensure_ingredient_index_service(db)
+    matches = ingredient_recipe_index.pantry(have, max_missing=max_missing, after=cursor, limit=limit)
+    recipes = recipe_repository.get_recipes_by_ids(db, [recipe_id for recipe_id, _ in matches])
+    id_to_name = _build_id_to_name_map(db, recipes)
+
+    missing_by_id = dict(matches)
+    pantry = set(have)
+    return [
+        _to_recipe_response(
+            recipe,
+            id_to_name,
+            RecipePantryMatch,
+            missing_count=missing_by_id[recipe.id],
+            missing_ingredient_ids=[
+                ri.ingredient_id for ri in recipe.ingredients if ri.ingredient_id not in pantry
+            ],
         )
-    return response
+        for recipe in recipes
+    ]
+
+
+# ───────────────────────── SHOPPING LIST ───────────────────
+def shopping_list_service(
+    db: Session, recipe_ids: List[int], multipliers: List[float]
+) -> ShoppingListResponse:
+    """
+    Ingredient totals of a meal plan, in base units where the unit is known.
+
+    The sums run in the database (one GROUP BY over the plan's recipe
+    lines), so only one row per ingredient and unit comes back, whatever
+    the number of recipes.
+
+    Raises:
+        RecipeNotFoundError: If a recipe of the plan doesn't exist.
+    """
+    missing = recipe_repository.get_missing_recipe_ids(db, recipe_ids)
+    if missing:
+        raise RecipeNotFoundError(missing[0])
+
+    rows = recipe_repository.shopping_list_rows(db, recipe_ids, multipliers)
+    return ShoppingListResponse(items=[
+        ShoppingListItem(
+            ingredient_id=row.ingredient_id,
+            ingredient_name=row.ingredient_name,
+            quantity=round(row.quantity, 3),
+            unit=row.unit,
+            recipe_count=row.recipe_count,
+        )
+        for row in rows
+    ])
 
 
 # ───────────────────────── UPDATE ──────────────────────────
@@ -138,32 +474,46 @@ def update_recipe_service(
     title: Optional[str] = None,
     description: Optional[str] = None,
     ingredients_data: Optional[List[dict]] = None,
-):
+) -> RecipeResponse:
     """
     Update a recipe and, if provided, replace its ingredient list.
+
+    Raises:
+        RecipeNotFoundError: If the recipe doesn't exist.
+        IngredientNotFoundError: If a new ingredient doesn't exist.
     """
-    recipe = recipe_repository.get_recipe_by_id(db, recipe_id)
+    recipe = recipe_repository.get_recipe_for_update(db, recipe_id)
     if recipe is None:
         raise RecipeNotFoundError(recipe_id)
 
-    # Validate new ingredients only if caller sent a new list
-    if ingredients_data is not None:
-        ingredient_ids = [i["ingredient_id"] for i in ingredients_data]
-        _validate_ingredients_exist(db, ingredient_ids)
+    old_ingredient_ids = {ri.ingredient_id for ri in recipe.ingredients}
+    try:
+        recipe = recipe_repository.update_recipe(
+            db,
+            recipe,
+            title=title,
+            description=description,
+            ingredients_data=ingredients_data,
+        )
+    except ConstraintViolation as exc:
+        raise _missing_reference(exc) from exc
+    if recipe is None:
+        raise RecipeNotFoundError(recipe_id)
 
-    return recipe_repository.update_recipe(
-        db,
-        recipe,
-        title=title,
-        description=description,
-        ingredients_data=ingredients_data,
-    )
+    ingredient_ids = {ri.ingredient_id for ri in recipe.ingredients}
+    if ingredient_ids != old_ingredient_ids:
+        # Full sets both ways: the index also buckets the recipe by its ingredient count.
+        ingredient_recipe_index.remove_recipe(recipe_id, old_ingredient_ids)
+        ingredient_recipe_index.add_recipe(recipe_id, ingredient_ids)
+    response_cache.invalidate(f"recipe:{recipe_id}")
+    return _to_recipe_response(recipe, _build_id_to_name_map(db, [recipe]))
 
 
 # ───────────────────────── DELETE ──────────────────────────
 def delete_recipe_service(db: Session, recipe_id: int) -> None:
-    recipe = recipe_repository.get_recipe_by_id(db, recipe_id)
-    if recipe is None:
+    ingredient_ids = recipe_repository.delete_recipe(db, recipe_id)
+    if ingredient_ids is None:
         raise RecipeNotFoundError(recipe_id)
 
-    recipe_repository.delete_recipe(db, recipe)
\ No newline at end of file
+    ingredient_recipe_index.remove_recipe(recipe_id, ingredient_ids)
+    response_cache.invalidate(f"recipe:{recipe_id}", "recipes")
@@ -0,0 +1,57 @@
+"""
+Service layer for the recipe statistics.
+
+Every read is served by the counter tables the recipe write paths keep up
+to date (see app/persistence/repositories/stats_repository.py): a primary
+key or index lookup, whatever the size of the catalog.
+"""
+
+from datetime import date, datetime, timedelta, timezone
+from typing import List, Optional
+
+from sqlalchemy.orm import Session
+
+from app.domain.schemas.stats import AuthorRecipeCount, DailyRecipeCount, IngredientUsage
+from app.persistence.repositories import stats_repository
+from app.application.exceptions.author_exceptions import AuthorNotFoundError
+
+# Days returned by the per-day counts when no range is given.
+DEFAULT_DAYS = 30
+
+
+def author_recipe_count_service(db: Session, author_id: int) -> AuthorRecipeCount:
+    """
+    Number of recipes of one author.
+
+    Raises:
+        AuthorNotFoundError: If the author doesn't exist.
+    """
+    row = stats_repository.get_author_recipe_count(db, author_id)
+    if row is None:
+        raise AuthorNotFoundError(author_id)
+    return AuthorRecipeCount(**row._mapping)
+
+
+def top_authors_service(db: Session, limit: int = 10) -> List[AuthorRecipeCount]:
+    """Authors with the most recipes, most first."""
+    return [AuthorRecipeCount(**row._mapping) for row in stats_repository.list_top_authors(db, limit)]
+
+
+def top_ingredients_service(db: Session, limit: int = 10) -> List[IngredientUsage]:
+    """Ingredients used by the most recipes, most first."""
+    return [IngredientUsage(**row._mapping) for row in stats_repository.list_top_ingredients(db, limit)]
+
+
+def recipes_per_day_service(
+    db: Session, since: Optional[date] = None, until: Optional[date] = None
+) -> List[DailyRecipeCount]:
+    """
+    Recipes created per day (UTC) between `since` and `until`, inclusive;
+    days without recipes are left out. Defaults to the last `DEFAULT_DAYS` days.
+    """
+    until = until or datetime.now(timezone.utc).date()
+    since = since or until - timedelta(days=DEFAULT_DAYS - 1)
+    return [
+        DailyRecipeCount(**row._mapping)
+        for row in stats_repository.list_daily_recipe_counts(db, since, until)
+    ]
@@ -0,0 +1,152 @@
+"""
+Request coalescing ("singleflight") for hot reads.
+
+When several requests ask for the same key at the same time, the first
+one (the leader) runs the load and the others wait for its result instead
+of running the same queries again. The leader's exception, if any, is
+raised in every waiter too. Nothing is kept once the load is over: this
+is not a cache, it only collapses loads that overlap in time.
+
+A waiter gives up after `timeout` seconds and runs the load itself, so a
+stuck leader delays its followers but never fails them. A group created
+with ``timeout=None`` waits for its leader however long it takes.
+
+`SingleFlight` is for the sync services (one thread per request);
+`AsyncSingleFlight` is for the async ones, whose requests share one event
+loop and must never block it waiting for each other.
+"""
+
+import asyncio
+import threading
+from typing import Any, Awaitable, Callable, Dict, List, Optional, TypeVar
+
+T = TypeVar("T")
+
+_registry: List["_FlightGroup"] = []
+
+
+class _Call:
+    __slots__ = ("done", "value", "error")
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.value: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class _FlightGroup:
+    """
+    What both implementations share: a name, the default wait timeout and
+    plain counters (incremented without a lock, like the cache counters).
+    Subclasses keep their in-flight calls in `_calls`.
+    """
+
+    _calls: Dict[Any, Any]
+
+    def __init__(self, name: str, timeout: Optional[float]) -> None:
+        self.name = name
+        self.timeout = timeout
+        self.leaders = 0
+        self.coalesced = 0
+        self.timeouts = 0
+        _registry.append(self)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "leaders": self.leaders,
+            "coalesced": self.coalesced,
+            "timeouts": self.timeouts,
+            "in_flight": len(self._calls),
+        }
+
+
+class SingleFlight(_FlightGroup):
+    """Coalesces concurrent `do(key, load)` calls made from different threads."""
+
+    def __init__(self, name: str, *, timeout: Optional[float] = 5.0) -> None:
+        super().__init__(name, timeout)
+        self._calls: Dict[Any, _Call] = {}
+        self._lock = threading.Lock()
+
+    def do(self, key: Any, load: Callable[[], T], *, timeout: Optional[float] = None) -> T:
+        """Run `load`, or wait for the identical load already in flight for `key`."""
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+
+        if not leader:
+            self.coalesced += 1
+            if call.done.wait(self.timeout if timeout is None else timeout):
+                if call.error is not None:
+                    raise call.error
+                return call.value
+            self.timeouts += 1
+            return load()
+
+        self.leaders += 1
+        try:
+            call.value = load()
+            return call.value
+        except BaseException as exc:
+            call.error = exc
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+
+
+class _LeaderGone(Exception):
+    """Set on the shared future when the leading request was cancelled mid-load."""
+
+
+class AsyncSingleFlight(_FlightGroup):
+    """Coalesces concurrent `await do(key, load)` calls made on one event loop."""
+
+    def __init__(self, name: str, *, timeout: Optional[float] = 5.0) -> None:
+        super().__init__(name, timeout)
+        self._calls: Dict[Any, "asyncio.Future[Any]"] = {}
+
+    async def do(self, key: Any, load: Callable[[], Awaitable[T]], *, timeout: Optional[float] = None) -> T:
+        """Await `load()`, or wait for the identical load already in flight for `key`."""
+        call = self._calls.get(key)
+        if call is not None:
+            self.coalesced += 1
+            try:
+                return await asyncio.wait_for(
+                    asyncio.shield(call), self.timeout if timeout is None else timeout
+                )
+            except asyncio.TimeoutError:
+                self.timeouts += 1
+            except _LeaderGone:
+                # The first waiter to wake up takes over, the others wait for it.
+                return await self.do(key, load, timeout=timeout)
+            return await load()
+
+        call = self._calls[key] = asyncio.get_running_loop().create_future()
+        self.leaders += 1
+        try:
+            value = await load()
+        except asyncio.CancelledError:
+            self._fail(call, _LeaderGone())
+            raise
+        except BaseException as exc:
+            self._fail(call, exc)
+            raise
+        else:
+            call.set_result(value)
+            return value
+        finally:
+            del self._calls[key]
+
+    @staticmethod
+    def _fail(call: "asyncio.Future[Any]", exc: BaseException) -> None:
+        call.set_exception(exc)
+        call.exception()   # marks it retrieved: no "never retrieved" warning when nobody waited
+
+
+def singleflight_stats() -> Dict[str, Dict[str, Any]]:
+    """Counters of every coalescing group, by name."""
+    return {group.name: group.stats() for group in _registry}
@@ -2,3 +2,5 @@ from .author import Author              # noqa: F401
 from .ingredient import Ingredient      # noqa: F401
 from .recipe import Recipe              # noqa: F401
 from .recipe_ingredient import RecipeIngredient  # noqa: F401
+from .unit_conversion import UnitConversion  # noqa: F401
+from .recipe_stats import AuthorRecipeCount, DailyRecipeCount, IngredientRecipeCount  # noqa: F401
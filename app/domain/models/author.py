@@ -4,7 +4,7 @@ SQLAlchemy model definition for the 'authors' table.
 Defines the Author entity and its relationship with Recipe.
 """
 
-from sqlalchemy import Column, Integer, String
+from sqlalchemy import Column, DateTime, Integer, String, func
 from sqlalchemy.orm import relationship
 from app.persistence.db import Base
 
@@ -22,6 +22,10 @@ class Author(Base):
     name = Column(String, nullable=False)
     email = Column(String, unique=True, nullable=False)
 
+    # Bumped by every update; embedded in the ETag of the author and of its recipes.
+    version = Column(Integer, nullable=False, server_default="1")
+    updated_at = Column(DateTime(timezone=True), server_default=func.now())
+
     # One-to-many relationship: an author can have many recipes
     # The cascade option ensures that when an Author is deleted,
     # all their associated recipes are also deleted
@@ -4,7 +4,7 @@ SQLAlchemy model definition for the 'ingredients' table.
 Defines the Ingredient entity and its relationship with RecipeIngredient.
 """
 
-from sqlalchemy import Column, Integer, String
+from sqlalchemy import DDL, Column, DateTime, Index, Integer, String, event, func
 from sqlalchemy.orm import relationship
 from app.persistence.db import Base
 
@@ -17,10 +17,31 @@ class Ingredient(Base):
     Deletion of an ingredient that is still in use by recipes is not allowed.
     """
     __tablename__ = "ingredients"
+    __table_args__ = (
+        # Trigram index for typo-tolerant name suggestions (`%>` / `<->>` operators).
+        Index(
+            "ix_ingredients_name_trgm",
+            "name",
+            postgresql_using="gist",
+            postgresql_ops={"name": "gist_trgm_ops"},
+        ),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     name = Column(String, unique=True, nullable=False)
 
+    # Names are immutable today, so this stays at 1; kept for ETags like the other entities.
+    version = Column(Integer, nullable=False, server_default="1")
+    updated_at = Column(DateTime(timezone=True), server_default=func.now())
+
     # One-to-many relationship with the association table RecipeIngredient.
     # No cascade: deletion is restricted if the ingredient is still used in recipes.
-    recipe_ingredients = relationship("RecipeIngredient", back_populates="ingredient")
\ No newline at end of file
+    recipe_ingredients = relationship("RecipeIngredient", back_populates="ingredient")
+
+
+# The trigram operator class lives in the pg_trgm extension.
+event.listen(
+    Ingredient.__table__,
+    "before_create",
+    DDL("CREATE EXTENSION IF NOT EXISTS pg_trgm").execute_if(dialect="postgresql"),
+)
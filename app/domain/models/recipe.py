@@ -4,8 +4,9 @@ SQLAlchemy model definition for the 'recipes' table.
 Defines the Recipe entity and its relationships with Author and RecipeIngredient.
 """
 
-from sqlalchemy import Column, Integer, String, ForeignKey, DateTime, func
-from sqlalchemy.orm import relationship
+from sqlalchemy import Column, Integer, String, ForeignKey, DateTime, Index, func
+from sqlalchemy.dialects.postgresql import TSVECTOR
+from sqlalchemy.orm import deferred, relationship
 from app.persistence.db import Base
 
 class Recipe(Base):
@@ -17,12 +18,26 @@ class Recipe(Base):
     A recipe contains multiple ingredients through the RecipeIngredient association table.
     """
     __tablename__ = "recipes"
+    __table_args__ = (
+        Index("ix_recipes_search_vector", "search_vector", postgresql_using="gin"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     title = Column(String, nullable=False)
     description = Column(String)
-    author_id = Column(Integer, ForeignKey("authors.id"), nullable=False)
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    # Indexed: author pages join on it and deleting an author looks up its recipes.
+    author_id = Column(Integer, ForeignKey("authors.id"), nullable=False, index=True)
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), index=True)
+
+    # Bumped by every update (title, description or ingredient list); part of the ETag.
+    version = Column(Integer, nullable=False, server_default="1")
+    updated_at = Column(DateTime(timezone=True), server_default=func.now())
+
+    # Full-text document over title, description and ingredient names.
+    # It spans two tables, so it can't be a generated column: the recipe
+    # repository recomputes it on every create/update/import.
+    # Deferred: only the search query reads it.
+    search_vector = deferred(Column(TSVECTOR))
 
     # One-to-many relationship: a recipe includes multiple ingredients.
     # Cascade ensures that deleting a recipe also deletes its associated entries in the association table.
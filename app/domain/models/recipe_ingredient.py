@@ -21,7 +21,9 @@ class RecipeIngredient(Base):
     __tablename__ = "recipe_ingredients"
 
     recipe_id = Column(Integer, ForeignKey("recipes.id"), primary_key=True)
-    ingredient_id = Column(Integer, ForeignKey("ingredients.id"), primary_key=True)
+    # The primary key only serves lookups by recipe; this index serves the
+    # reverse ones (ingredient filters, the "in use" check before a delete).
+    ingredient_id = Column(Integer, ForeignKey("ingredients.id"), primary_key=True, index=True)
     quantity = Column(Float, nullable=False)
     unit = Column(String, nullable=False)
 
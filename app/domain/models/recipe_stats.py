@@ -0,0 +1,41 @@
+"""
+SQLAlchemy model definitions for the recipe statistics tables.
+
+Counters kept up to date by the recipe write paths (see
+app/persistence/repositories/stats_repository.py), so the /stats endpoints
+read a few rows instead of aggregating `recipes` and `recipe_ingredients`.
+"""
+
+from sqlalchemy import Column, Date, ForeignKey, Index, Integer
+from app.persistence.db import Base
+
+class AuthorRecipeCount(Base):
+    """Number of recipes of an author; no row means none."""
+    __tablename__ = "author_recipe_counts"
+    __table_args__ = (
+        # Serves "top authors" as an index scan.
+        Index("ix_author_recipe_counts_top", "recipe_count", "author_id"),
+    )
+
+    author_id = Column(Integer, ForeignKey("authors.id", ondelete="CASCADE"), primary_key=True)
+    recipe_count = Column(Integer, nullable=False, server_default="0")
+
+
+class IngredientRecipeCount(Base):
+    """Number of recipes using an ingredient; no row means none."""
+    __tablename__ = "ingredient_recipe_counts"
+    __table_args__ = (
+        # Serves "most used ingredients" as an index scan.
+        Index("ix_ingredient_recipe_counts_top", "recipe_count", "ingredient_id"),
+    )
+
+    ingredient_id = Column(Integer, ForeignKey("ingredients.id", ondelete="CASCADE"), primary_key=True)
+    recipe_count = Column(Integer, nullable=False, server_default="0")
+
+
+class DailyRecipeCount(Base):
+    """Number of existing recipes created on a day (UTC)."""
+    __tablename__ = "daily_recipe_counts"
+
+    day = Column(Date, primary_key=True)
+    recipe_count = Column(Integer, nullable=False, server_default="0")
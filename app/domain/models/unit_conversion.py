@@ -0,0 +1,53 @@
+"""
+SQLAlchemy model definition for the 'unit_conversions' table.
+
+Maps the unit spellings found in recipe lines to a base unit, so quantities
+written in different units can be added up (shopping lists).
+"""
+
+from sqlalchemy import Column, Float, String, event
+from app.persistence.db import Base
+
+class UnitConversion(Base):
+    """
+    SQLAlchemy model for one known unit spelling.
+
+    `unit` is the spelling, lower-cased and trimmed (recipe lines are
+    matched on ``lower(trim(unit))``); a quantity in it is `factor` times
+    a quantity in `base_unit` (``g``, ``ml`` or ``pcs``). Units missing
+    from the table are not converted.
+    """
+    __tablename__ = "unit_conversions"
+
+    unit = Column(String, primary_key=True)
+    base_unit = Column(String, nullable=False)
+    factor = Column(Float, nullable=False)
+
+
+# (base unit, factor, spellings); a migration loads the same rows.
+DEFAULT_CONVERSIONS = [
+    ("g", 1, ("g", "gr", "gram", "grams", "gramme", "grammes")),
+    ("g", 1000, ("kg", "kilo", "kilos", "kilogram", "kilograms")),
+    ("g", 0.001, ("mg", "milligram", "milligrams")),
+    ("ml", 1, ("ml", "milliliter", "milliliters", "millilitre", "millilitres")),
+    ("ml", 10, ("cl", "centiliter", "centiliters", "centilitre", "centilitres")),
+    ("ml", 100, ("dl", "deciliter", "deciliters", "decilitre", "decilitres")),
+    ("ml", 1000, ("l", "liter", "liters", "litre", "litres")),
+    ("ml", 15, ("tbsp", "tablespoon", "tablespoons")),
+    ("ml", 5, ("tsp", "teaspoon", "teaspoons")),
+    ("pcs", 1, ("pcs", "pc", "piece", "pieces", "unit", "units")),
+]
+
+
+def default_rows():
+    return [
+        {"unit": spelling, "base_unit": base_unit, "factor": factor}
+        for base_unit, factor, spellings in DEFAULT_CONVERSIONS
+        for spelling in spellings
+    ]
+
+
+@event.listens_for(UnitConversion.__table__, "after_create")
+def _load_default_conversions(table, connection, **_kw) -> None:
+    # Databases created with Base.metadata.create_all (scripts/init_db.py).
+    connection.execute(table.insert(), default_rows())
@@ -1,5 +1,6 @@
+from enum import Enum
 from pydantic import BaseModel, EmailStr, Field, ConfigDict
-from typing import Optional
+from typing import List, Optional
 
 
 # ─────────────────────────────── BASE ───────────────────────────────
@@ -22,5 +23,33 @@ class AuthorUpdate(BaseModel):
 # ─────────────────────────────── RESPONSE ───────────────────────────
 class AuthorResponse(AuthorBase):
     id: int
+    version: int = Field(..., example=1)
 
     model_config = ConfigDict(from_attributes=True)
+
+
+# ─────────────────────────────── BULK ───────────────────────────────
+class AuthorConflictPolicy(str, Enum):
+    """What a bulk insert does with emails that already exist."""
+    error = "error"     # reject the whole payload (409)
+    skip = "skip"       # keep the existing author untouched
+    update = "update"   # overwrite the existing author's name
+
+
+class AuthorBulkStatus(str, Enum):
+    created = "created"
+    updated = "updated"
+    skipped = "skipped"
+
+
+class AuthorBulkItemResult(BaseModel):
+    email: EmailStr
+    status: AuthorBulkStatus
+    author: Optional[AuthorResponse] = None
+
+
+class AuthorBulkResult(BaseModel):
+    created: int
+    updated: int
+    skipped: int
+    items: List[AuthorBulkItemResult]
@@ -0,0 +1,26 @@
+from enum import Enum
+from pydantic import BaseModel, Field
+from typing import List
+
+
+# ─────────────────────────────── ENTITY ─────────────────────────────
+class ImportEntity(str, Enum):
+    authors = "authors"
+    ingredients = "ingredients"
+    recipes = "recipes"
+
+
+# ─────────────────────────────── RESPONSE ───────────────────────────
+class ImportLineError(BaseModel):
+    line: int = Field(..., example=42)
+    error: str = Field(..., example="Ingredient 'Saffron' not found.")
+
+
+class ImportResult(BaseModel):
+    entity: ImportEntity
+    imported: int = Field(..., description="Rows written to the database")
+    skipped: int = Field(..., description="Valid rows that already existed (authors/ingredients)")
+    failed: int = Field(..., description="Lines rejected by validation")
+    errors: List[ImportLineError] = Field(
+        ..., description="First rejected lines, capped to keep the report small"
+    )
@@ -1,3 +1,5 @@
+from typing import Literal
+
 from pydantic import BaseModel, Field, ConfigDict
 
 # ─────────────────────── BASE ─────────────────────────
@@ -13,5 +15,12 @@ class IngredientCreate(IngredientBase):
 # ─────────────────────── RESPONSE ─────────────────────────
 class IngredientResponse(IngredientBase):
     id: int
+    version: int = Field(..., example=1)
 
     model_config = ConfigDict(from_attributes=True)
+
+
+# ─────────────────────── SUGGEST ─────────────────────────
+class IngredientSuggestion(IngredientBase):
+    id: int
+    match: Literal["prefix", "fuzzy"] = Field(..., example="prefix")
@@ -1,4 +1,4 @@
-from pydantic import BaseModel, Field, ConfigDict
+from pydantic import BaseModel, EmailStr, Field, ConfigDict, model_validator
 from typing import List, Optional, Union
 
 from app.domain.schemas.author import AuthorResponse
@@ -45,10 +45,86 @@ class RecipeUpdate(BaseModel):
     )
 
 
+# ─────────────────────────────── IMPORT ─────────────────────────────
+class IngredientRefInRecipe(BaseModel):
+    """Ingredient line of an imported recipe, referenced by ID or by name."""
+    ingredient_id: Optional[int] = Field(None, example=1)
+    ingredient_name: Optional[str] = Field(None, example="Sugar")
+    quantity: Union[int, float] = Field(..., example=200)
+    unit: str = Field(..., example="grams")
+
+    @model_validator(mode="after")
+    def _check_reference(self) -> "IngredientRefInRecipe":
+        if self.ingredient_id is None and self.ingredient_name is None:
+            raise ValueError("ingredient_id or ingredient_name is required")
+        return self
+
+
+class RecipeImport(RecipeBase):
+    """One NDJSON line of a recipe import; the author is referenced by ID or by email."""
+    author_id: Optional[int] = Field(None, example=1)
+    author_email: Optional[EmailStr] = Field(None, example="pepe_argg@mail.com")
+    ingredients: List[IngredientRefInRecipe]
+
+    @model_validator(mode="after")
+    def _check_author(self) -> "RecipeImport":
+        if self.author_id is None and self.author_email is None:
+            raise ValueError("author_id or author_email is required")
+        return self
+
+
 # ─────────────────────────────── RESPONSE ───────────────────────────
 class RecipeResponse(RecipeBase):
     id: int
+    version: int = Field(..., example=1)
     author: AuthorResponse
     ingredients: List[IngredientInRecipe]
 
     model_config = ConfigDict(from_attributes=True)
+
+
+
+# ─────────────────────────────── SEARCH ─────────────────────────────
+class RecipeSearchHighlights(BaseModel):
+    """Matching fragments, with the matched terms wrapped in <mark> tags."""
+    title: str = Field(..., example="Spaghetti <mark>Carbonara</mark>")
+    description: Optional[str] = Field(None, example="A classic Roman <mark>pasta</mark> dish.")
+
+
+class RecipeSearchHit(RecipeResponse):
+    rank: float = Field(..., example=0.0759)
+    highlights: RecipeSearchHighlights
+
+
+# ─────────────────────────── BY INGREDIENTS ─────────────────────────
+class RecipePantryMatch(RecipeResponse):
+    missing_count: int = Field(..., example=1)
+    missing_ingredient_ids: List[int] = Field(..., example=[3])
+
+
+# ─────────────────────────── SHOPPING LIST ──────────────────────────
+class ShoppingListEntry(BaseModel):
+    recipe_id: int = Field(..., example=1)
+    multiplier: float = Field(1, gt=0, example=2, description="Servings factor: 2 doubles every quantity")
+
+
+class ShoppingListRequest(BaseModel):
+    """Recipes of a meal plan; a recipe listed twice is counted twice."""
+    recipes: List[ShoppingListEntry] = Field(
+        ...,
+        min_length=1,
+        max_length=2000,
+        example=[{"recipe_id": 1, "multiplier": 2}, {"recipe_id": 3, "multiplier": 1}],
+    )
+
+
+class ShoppingListItem(BaseModel):
+    ingredient_id: int = Field(..., example=1)
+    ingredient_name: str = Field(..., example="Sugar")
+    quantity: float = Field(..., example=450)
+    unit: str = Field(..., example="g", description="Base unit (g, ml, pcs), or the recipes' own unit when it is not convertible")
+    recipe_count: int = Field(..., example=2, description="Distinct recipes of the plan using it in this unit")
+
+
+class ShoppingListResponse(BaseModel):
+    items: List[ShoppingListItem]
@@ -0,0 +1,22 @@
+from datetime import date
+
+from pydantic import BaseModel, Field
+
+# ─────────────────────── AUTHORS ─────────────────────────
+class AuthorRecipeCount(BaseModel):
+    author_id: int = Field(..., example=1)
+    name: str = Field(..., example="Juan Pérez")
+    recipe_count: int = Field(..., example=12)
+
+
+# ─────────────────────── INGREDIENTS ─────────────────────
+class IngredientUsage(BaseModel):
+    ingredient_id: int = Field(..., example=1)
+    name: str = Field(..., example="Sugar")
+    recipe_count: int = Field(..., example=340, description="Recipes using the ingredient")
+
+
+# ─────────────────────── RECIPES PER DAY ─────────────────
+class DailyRecipeCount(BaseModel):
+    day: date = Field(..., example="2026-10-17", description="Creation day (UTC)")
+    recipe_count: int = Field(..., example=25)
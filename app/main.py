@@ -1,13 +1,113 @@
+import asyncio
+import logging
+import os
+import time
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
+from fastapi.concurrency import run_in_threadpool
 from fastapi.middleware.cors import CORSMiddleware
 
+from app.persistence.db import (
+    ASYNC_DB,
+    DB_POOL_SIZE,
+    READ_YOUR_WRITES_SECONDS,
+    engine,
+    replicas,
+    warm_up_pool,
+)
+from app.presentation import lifecycle, metrics
+from app.presentation.lifecycle import DrainingMiddleware
+from app.presentation.query_timing import QueryTimingMiddleware
+from app.presentation.read_your_writes import ReadYourWritesMiddleware
 from app.presentation.routes import system
-from app.presentation.routes import author_routes as author
-from app.presentation.routes import recipe_routes as recipe
-from app.presentation.routes import ingredients_routes as ingredient
+from app.presentation.routes import import_routes
+from app.presentation.routes import stats_routes
+
+# ASYNC_DB switches the CRUD routers to their `async def` versions
+if ASYNC_DB:
+    from app.presentation.routes import async_author_routes as author
+    from app.presentation.routes import async_recipe_routes as recipe
+    from app.presentation.routes import async_ingredients_routes as ingredient
+else:
+    from app.presentation.routes import author_routes as author
+    from app.presentation.routes import recipe_routes as recipe
+    from app.presentation.routes import ingredients_routes as ingredient
+
+# Console logging for the app's own loggers (per-request JSON lines, slow queries)
+logging.basicConfig(
+    level=os.getenv("LOG_LEVEL", "INFO").upper(),
+    format="%(asctime)s [%(levelname)s] %(name)s: %(message)s",
+)
+
+logger = logging.getLogger(__name__)
+
+# Connections opened per worker at startup (0 disables the warm-up).
+DB_POOL_WARMUP = int(os.getenv("DB_POOL_WARMUP", str(DB_POOL_SIZE)))
+
+
+@asynccontextmanager
+async def lifespan(_app: FastAPI):
+    """
+    Runs once per worker process: fill the connection pools of the engines
+    that serve requests (primary and read replicas) before traffic arrives,
+    and close them on shutdown, after the in-flight requests have drained
+    (app/presentation/worker.py). A database that is down at startup is
+    logged, not fatal: /ready reports it.
+    """
+    sync_engines = [engine, *(r.engine for r in replicas.replicas)]
+    if ASYNC_DB:
+        from app.persistence.async_db import async_engine, async_replicas, warm_up_async_pool
+
+        targets = [("primary", async_engine)] + [(r.name, r.engine) for r in async_replicas.replicas]
+    else:
+        targets = [("primary", engine)] + [(r.name, r.engine) for r in replicas.replicas]
+
+    # With gunicorn's preload the engines were created in the master: start
+    # this worker on fresh pools, leaving anything inherited to the parent.
+    for target in sync_engines:
+        target.dispose(close=False)
+    if ASYNC_DB:
+        for _name, target in targets:
+            await target.dispose(close=False)
+
+    started = time.perf_counter()
+    if DB_POOL_WARMUP:
+        for name, target in targets:
+            try:
+                if ASYNC_DB:
+                    opened = await warm_up_async_pool(DB_POOL_WARMUP, target)
+                else:
+                    opened = await run_in_threadpool(warm_up_pool, DB_POOL_WARMUP, target)
+                logger.info("Connection pool of %s warmed up with %d connections", name, opened)
+            except Exception as exc:   # pylint: disable=broad-except
+                logger.warning("Connection pool warm-up of %s failed: %s", name, exc)
+    lifecycle.record("warmup", time.perf_counter() - started)
+    logger.info(
+        "Worker %d ready in %.2f s (pool warm-up %.2f s)",
+        os.getpid(), lifecycle.booted(), lifecycle.startup_seconds["warmup"],
+    )
+
+    # With several workers, publish this one's metrics for the others' /metrics.
+    publisher = asyncio.create_task(metrics.publish_metrics_forever()) if metrics.METRICS_DIR else None
+
+    yield
+
+    if publisher is not None:
+        publisher.cancel()
+        metrics.unpublish_metrics()
+
+    if ASYNC_DB:
+        for _name, target in targets:
+            await target.dispose()
+    # The sync engines also serve the streaming exports in async mode.
+    for target in sync_engines:
+        target.dispose()
+    logger.info("Worker %d stopped, connection pools closed", os.getpid())
+
 
 # Create FastAPI app
-app = FastAPI(title="Recipes API", version="0.1.0")
+app = FastAPI(title="Recipes API", version="0.1.0", lifespan=lifespan)
 
 # Add CORS middleware for local development
 origins = [
@@ -21,10 +121,23 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Next-Cursor", "ETag", "Server-Timing"],   # keyset pagination cursor, conditional GETs, DB timing
 )
 
+# Per-request query count / DB time (Server-Timing header + one log line per request)
+app.add_middleware(QueryTimingMiddleware)
+
+# Close keep-alive connections while the worker drains before stopping
+app.add_middleware(DrainingMiddleware)
+
+# GET/HEAD requests read from the replicas, except right after the client's own writes
+if replicas:
+    app.add_middleware(ReadYourWritesMiddleware, window_seconds=READ_YOUR_WRITES_SECONDS)
+
 # Include all routes
 app.include_router(system.router)
 app.include_router(author.router)
 app.include_router(recipe.router)
 app.include_router(ingredient.router)
+app.include_router(import_routes.router)
+app.include_router(stats_routes.router)
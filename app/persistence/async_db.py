@@ -0,0 +1,105 @@
+# app/persistence/async_db.py
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from typing import AsyncGenerator
+import os
+import time
+
+from app.persistence.db import (
+    DATABASE_REPLICA_URLS,
+    DATABASE_URL,
+    DB_POOL_SIZE,
+    POOL_OPTIONS,
+    REPLICA_OPTIONS,
+    SLOW_QUERY_MS,
+    SQL_ECHO,
+)
+from app.persistence.pool_metrics import TimedAsyncAdaptedQueuePool
+from app.persistence.query_stats import instrument_engine
+from app.persistence.replicas import ReplicaSet, check_lag_async, read_from_replica
+
+# ───────────────────────────────────────
+# Configure async engine
+# ───────────────────────────────────────
+def _asyncpg_url(url: str) -> str:
+    return make_url(url).set(drivername="postgresql+asyncpg").render_as_string(hide_password=False)
+
+
+# Defaults to the sync DATABASE_URL with its driver swapped for asyncpg, so a
+# single .env entry is enough for both modes.
+ASYNC_DATABASE_URL = os.getenv("ASYNC_DATABASE_URL", _asyncpg_url(DATABASE_URL))
+
+
+def _async_engine(url: str):
+    created = create_async_engine(url, echo=SQL_ECHO, poolclass=TimedAsyncAdaptedQueuePool, **POOL_OPTIONS)
+    instrument_engine(created.sync_engine, slow_query_ms=SLOW_QUERY_MS)
+    return created
+
+
+async_engine = _async_engine(ASYNC_DATABASE_URL)
+
+# Read replicas: DATABASE_REPLICA_URLS with the asyncpg driver, unless given.
+ASYNC_DATABASE_REPLICA_URLS = [
+    url.strip()
+    for url in os.getenv(
+        "ASYNC_DATABASE_REPLICA_URLS", ",".join(_asyncpg_url(u) for u in DATABASE_REPLICA_URLS)
+    ).split(",")
+    if url.strip()
+]
+async_replicas = ReplicaSet(
+    [_async_engine(url) for url in ASYNC_DATABASE_REPLICA_URLS], primary=async_engine, **REPLICA_OPTIONS
+)
+
+# expire_on_commit=False: objects returned by a service must stay readable
+# after the commit, because lazy loads cannot happen outside the session's
+# greenlet once control is back in the event loop.
+AsyncSessionLocal = async_sessionmaker(
+    bind=async_engine,
+    autoflush=False,
+    expire_on_commit=False,
+)
+
+# ───────────────────────────────────────
+# Pool warm-up and health (see the sync versions in db.py)
+# ───────────────────────────────────────
+async def warm_up_async_pool(connections: int = DB_POOL_SIZE, target=None) -> int:
+    target = target or async_engine
+    conns = []
+    try:
+        for _ in range(min(connections, DB_POOL_SIZE)):
+            conns.append(await target.connect())
+            await conns[-1].exec_driver_sql("SELECT 1")
+    finally:
+        for conn in conns:
+            await conn.close()
+    return len(conns)
+
+
+async def ping_async_db() -> float:
+    started = time.perf_counter()
+    async with async_engine.connect() as conn:
+        await conn.exec_driver_sql("SELECT 1")
+    return (time.perf_counter() - started) * 1000
+
+
+# ───────────────────────────────────────
+# Dependency for FastAPI
+# ───────────────────────────────────────
+async def get_async_db() -> AsyncGenerator[AsyncSession, None]:
+    """
+    Yield an AsyncSession per request and make sure it is closed.
+
+    Like `get_db`, GET/HEAD requests get a session on a read replica when
+    replicas are configured.
+
+    Usage in FastAPI:
+
+        @router.get("/authors")
+        async def list_authors(db: AsyncSession = Depends(get_async_db)):
+            ...
+    """
+    bind = async_engine
+    if async_replicas and read_from_replica.get():
+        bind = await async_replicas.apick(check_lag_async) or async_engine
+    async with AsyncSessionLocal(bind=bind) as db:
+        yield db          # the endpoint gets the session here
@@ -0,0 +1,104 @@
+# app/persistence/constraints.py
+"""
+Constraint violations raised by writes, decoded from PostgreSQL's error.
+
+Writes no longer look rows up before changing them ("does this email
+exist?", "does this author exist?"): the statement runs directly and the
+database's unique and foreign-key constraints reject it if needed, which
+saves a round trip per check and has no check-then-write race.
+
+Repositories wrap such writes in `raise_constraint_violations`, which rolls
+the session back and raises a `ConstraintViolation` saying which kind of
+constraint failed on which column and value. Services map it to their
+domain exceptions (`AuthorAlreadyExistsError`, `IngredientNotFoundError`...).
+Both psycopg2 and asyncpg report the SQLSTATE, constraint name and
+``Key (column)=(value) ...`` detail; only where they keep them differs.
+"""
+
+import re
+from contextlib import contextmanager
+from typing import Iterator, Optional
+
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+UNIQUE = "23505"
+FOREIGN_KEY = "23503"
+
+# "Key (email)=(a@b.c) already exists." / "Key (author_id)=(9) is not present in table ..."
+_KEY_DETAIL = re.compile(r"Key \((?P<column>[^)]*)\)=\((?P<value>.*)\) (?:already exists|is not present|is still referenced)")
+
+
+class ConstraintViolation(Exception):
+    """
+    A write rejected by a unique or foreign-key constraint.
+
+    Attributes:
+        sqlstate: ``UNIQUE`` or ``FOREIGN_KEY`` (or another integrity SQLSTATE).
+        constraint: Constraint name, e.g. ``authors_email_key``.
+        column: Key column(s) as PostgreSQL reports them, e.g. ``email``.
+        value: Offending key value, as text.
+        referenced: For foreign keys, True when a referenced row is missing
+            (insert/update of the child), False when the row is still
+            referenced (delete of the parent).
+    """
+
+    def __init__(
+        self,
+        sqlstate: Optional[str],
+        constraint: Optional[str],
+        column: Optional[str],
+        value: Optional[str],
+        detail: Optional[str],
+    ) -> None:
+        super().__init__(detail or f"constraint {constraint} violated")
+        self.sqlstate = sqlstate
+        self.constraint = constraint
+        self.column = column
+        self.value = value
+        self.referenced = detail is not None and "is still referenced" in detail
+
+    @property
+    def is_unique(self) -> bool:
+        return self.sqlstate == UNIQUE
+
+    @property
+    def is_foreign_key(self) -> bool:
+        return self.sqlstate == FOREIGN_KEY
+
+    def int_value(self) -> Optional[int]:
+        try:
+            return int(self.value) if self.value is not None else None
+        except ValueError:
+            return None
+
+
+def decode_integrity_error(exc: IntegrityError) -> ConstraintViolation:
+    """Extract SQLSTATE, constraint and key from a psycopg2 or asyncpg IntegrityError."""
+    orig = exc.orig
+    sqlstate = getattr(orig, "pgcode", None) or getattr(orig, "sqlstate", None)
+    diag = getattr(orig, "diag", None)                     # psycopg2
+    if diag is not None:
+        constraint, detail = diag.constraint_name, diag.message_detail
+    else:                                                  # asyncpg, wrapped by SQLAlchemy's adapter
+        cause = orig.__cause__
+        constraint, detail = getattr(cause, "constraint_name", None), getattr(cause, "detail", None)
+
+    match = _KEY_DETAIL.match(detail or "")
+    return ConstraintViolation(
+        sqlstate,
+        constraint,
+        match["column"] if match else None,
+        match["value"] if match else None,
+        detail,
+    )
+
+
+@contextmanager
+def raise_constraint_violations(db: Session) -> Iterator[None]:
+    """Roll back and raise `ConstraintViolation` when a write inside the block hits a constraint."""
+    try:
+        yield
+    except IntegrityError as exc:
+        db.rollback()
+        raise decode_integrity_error(exc) from exc
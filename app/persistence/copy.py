@@ -0,0 +1,65 @@
+# app/persistence/copy.py
+"""
+Helpers for loading rows with PostgreSQL's COPY protocol.
+
+COPY streams a whole batch in one round trip and skips per-row statement
+overhead, which makes it the fastest way to bulk-load the catalog. It is
+only reachable through psycopg2's `copy_expert`; callers must fall back to
+multi-row INSERTs when `copy_rows` returns False (e.g. on the asyncpg
+connection used by the async mode).
+"""
+
+import io
+from typing import Any, Iterable, Sequence
+
+from sqlalchemy.orm import Session
+
+
+def supports_copy(db: Session) -> bool:
+    """True if the session's DBAPI connection can run COPY ... FROM STDIN."""
+    cursor = db.connection().connection.cursor()
+    try:
+        return hasattr(cursor, "copy_expert")
+    finally:
+        cursor.close()
+
+
+def copy_rows(
+    db: Session,
+    table: str,
+    columns: Sequence[str],
+    rows: Iterable[Sequence[Any]],
+) -> bool:
+    """
+    COPY `rows` into `table(columns)` inside the session's current transaction.
+
+    Returns:
+        False if the driver has no COPY support and nothing was written.
+    """
+    cursor = db.connection().connection.cursor()
+    try:
+        if not hasattr(cursor, "copy_expert"):
+            return False
+
+        buffer = io.StringIO()
+        for row in rows:
+            buffer.write(",".join(_csv_field(value) for value in row))
+            buffer.write("\n")
+        buffer.seek(0)
+
+        cursor.copy_expert(
+            f"COPY {table} ({', '.join(columns)}) FROM STDIN WITH (FORMAT csv)",
+            buffer,
+        )
+    finally:
+        cursor.close()
+    return True
+
+
+def _csv_field(value: Any) -> str:
+    # In COPY's CSV format an unquoted empty field is NULL, a quoted one is ''.
+    if value is None:
+        return ""
+    if isinstance(value, str):
+        return '"' + value.replace('"', '""') + '"'
+    return str(value)
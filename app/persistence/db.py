@@ -2,8 +2,14 @@
 from sqlalchemy import create_engine
 from sqlalchemy.orm import declarative_base, sessionmaker, Session
 from dotenv import load_dotenv
-from typing import Generator
+from contextlib import contextmanager
+from typing import Generator, Iterator
 import os
+import time
+
+from app.persistence.pool_metrics import TimedQueuePool
+from app.persistence.query_stats import instrument_engine
+from app.persistence.replicas import ReplicaSet, check_lag, read_from_replica, replica_primary
 
 # ───────────────────────────────────────
 # Load .env and configure engine
@@ -15,30 +21,184 @@ DATABASE_URL = os.getenv(
     "postgresql://postgres:postgres@db:5432/recipes",
 )
 
-engine = create_engine(DATABASE_URL, echo=True)
+# Opt-in asyncio persistence mode (see app/persistence/async_db.py).
+# When enabled, app.main mounts the `async def` routers instead of the sync ones.
+ASYNC_DB = os.getenv("ASYNC_DB", "false").lower() in {"1", "true", "yes"}
+
+# Statement echo is for local debugging only: under load it floods stdout and
+# slows every query. Per-request query counts and timings come from query_stats.
+SQL_ECHO = os.getenv("SQL_ECHO", "false").lower() in {"1", "true", "yes"}
+
+# Statements at least this slow (milliseconds) are logged; 0 disables the log.
+SLOW_QUERY_MS = float(os.getenv("SLOW_QUERY_MS", "200"))
+
+# ───────────────────────────────────────
+# Connection pool
+# ───────────────────────────────────────
+# Every worker process has its own pool. DB_MAX_CONNECTIONS is the budget of
+# the whole deployment: when set, and DB_POOL_SIZE is not, it is shared
+# between the WEB_CONCURRENCY workers (pool + overflow per worker).
+WEB_CONCURRENCY = int(os.getenv("WEB_CONCURRENCY", "1"))
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "5"))
+if os.getenv("DB_POOL_SIZE") is None and os.getenv("DB_MAX_CONNECTIONS") is not None:
+    DB_POOL_SIZE = max(1, int(os.environ["DB_MAX_CONNECTIONS"]) // WEB_CONCURRENCY - DB_MAX_OVERFLOW)
+else:
+    DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "10"))
+
+# Seconds a request waits for a free connection before failing, instead of
+# hanging for SQLAlchemy's default 30 s when the pool runs dry.
+DB_POOL_TIMEOUT = float(os.getenv("DB_POOL_TIMEOUT", "5"))
+# Connections older than this (seconds) are replaced, before server/proxy idle timeouts cut them.
+DB_POOL_RECYCLE = int(os.getenv("DB_POOL_RECYCLE", "1800"))
+# Test each connection on checkout and transparently replace dead ones (one round trip).
+DB_POOL_PRE_PING = os.getenv("DB_POOL_PRE_PING", "true").lower() in {"1", "true", "yes"}
+
+POOL_OPTIONS = dict(
+    pool_size=DB_POOL_SIZE,
+    max_overflow=DB_MAX_OVERFLOW,
+    pool_timeout=DB_POOL_TIMEOUT,
+    pool_recycle=DB_POOL_RECYCLE,
+    pool_pre_ping=DB_POOL_PRE_PING,
+)
+
+engine = create_engine(DATABASE_URL, echo=SQL_ECHO, poolclass=TimedQueuePool, **POOL_OPTIONS)
+instrument_engine(engine, slow_query_ms=SLOW_QUERY_MS)
+
+# ───────────────────────────────────────
+# Read replicas (see app/persistence/replicas.py)
+# ───────────────────────────────────────
+# Comma-separated URLs of streaming replicas of DATABASE_URL. GET and HEAD
+# requests read from them in turn; without any, everything uses the primary.
+DATABASE_REPLICA_URLS = [url.strip() for url in os.getenv("DATABASE_REPLICA_URLS", "").split(",") if url.strip()]
+# Seconds between lag checks of a replica, and how long a failing one is left out.
+DB_REPLICA_CHECK_INTERVAL = float(os.getenv("DB_REPLICA_CHECK_INTERVAL", "5"))
+DB_REPLICA_EJECT_SECONDS = float(os.getenv("DB_REPLICA_EJECT_SECONDS", "30"))
+# Replicas replaying more than this many seconds behind the primary are ejected.
+DB_REPLICA_MAX_LAG = float(os.getenv("DB_REPLICA_MAX_LAG", "10"))
+# After a client's own write, its reads stay on the primary for this many seconds.
+READ_YOUR_WRITES_SECONDS = float(os.getenv("READ_YOUR_WRITES_SECONDS", "10"))
+
+REPLICA_OPTIONS = dict(
+    check_interval=DB_REPLICA_CHECK_INTERVAL,
+    eject_seconds=DB_REPLICA_EJECT_SECONDS,
+    max_lag=DB_REPLICA_MAX_LAG,
+)
+
+
+def _replica_engine(url: str):
+    replica = create_engine(url, echo=SQL_ECHO, poolclass=TimedQueuePool, **POOL_OPTIONS)
+    instrument_engine(replica, slow_query_ms=SLOW_QUERY_MS)
+    return replica
 
+
+replicas = ReplicaSet(
+    [_replica_engine(url) for url in DATABASE_REPLICA_URLS], primary=engine, **REPLICA_OPTIONS
+)
+
+# Writes return their new state with RETURNING instead of reloading it, so
+# objects must stay readable after commit (as in app/persistence/async_db.py).
 SessionLocal = sessionmaker(
     bind=engine,
     autoflush=False,
     autocommit=False,
+    expire_on_commit=False,
 )
 
 Base = declarative_base()
 
+# ───────────────────────────────────────
+# Pool warm-up and health
+# ───────────────────────────────────────
+def warm_up_pool(connections: int = DB_POOL_SIZE, target=None) -> int:
+    """
+    Open `connections` pooled connections up front (all held at once, so
+    each is a new physical connection), so the first requests after a
+    start do not pay for the connects. Returns how many were opened.
+
+    `target` is the engine to warm up (default: the primary).
+    """
+    target = target or engine
+    conns = []
+    try:
+        for _ in range(min(connections, DB_POOL_SIZE)):
+            conns.append(target.connect())
+            conns[-1].exec_driver_sql("SELECT 1")
+    finally:
+        for conn in conns:
+            conn.close()
+    return len(conns)
+
+
+def pool_status(pool) -> dict:
+    """Checked-out connections of a pool against its capacity (pool_size + max_overflow)."""
+    capacity = DB_POOL_SIZE + DB_MAX_OVERFLOW
+    checked_out = pool.checkedout()
+    return {
+        "size": DB_POOL_SIZE,
+        "max_overflow": DB_MAX_OVERFLOW,
+        "checked_out": checked_out,
+        "idle": pool.checkedin(),
+        "saturation": round(checked_out / capacity, 3),
+    }
+
+
+def ping_db() -> float:
+    """Run `SELECT 1` on a pooled connection; returns the round trip in milliseconds."""
+    started = time.perf_counter()
+    with engine.connect() as conn:
+        conn.exec_driver_sql("SELECT 1")
+    return (time.perf_counter() - started) * 1000
+
+
 # ───────────────────────────────────────
 # Dependency for FastAPI
 # ───────────────────────────────────────
+def read_engine():
+    """The primary, or the next healthy replica when the current request may read from one."""
+    if replicas and read_from_replica.get():
+        return replicas.pick(check_lag) or engine
+    return engine
+
+
+def new_session() -> Session:
+    """A session for the current request, bound to the engine `read_engine` chooses."""
+    return SessionLocal(bind=read_engine())
+
+
+@contextmanager
+def primary_session(db: Session) -> Iterator[Session]:
+    """
+    `db` itself when it is bound to the primary; otherwise a new session on
+    the primary, closed on exit. For reads whose result outlives the
+    request (shared caches, in-memory indexes), which must not come from a
+    replica that may lag behind.
+
+    Works for the `sync_session` of an AsyncSession too: the new session
+    then uses the async primary, from within `run_sync`.
+    """
+    primary = replica_primary(db)
+    if primary is None:
+        yield db
+        return
+    with SessionLocal(bind=primary) as session:
+        yield session
+
+
 def get_db() -> Generator[Session, None, None]:
     """
     Yield a SQLAlchemy session per request and make sure it is closed.
 
+    GET/HEAD requests get a session on a read replica when replicas are
+    configured (see app/presentation/read_your_writes.py); routes do not
+    need to know which.
+
     Usage in FastAPI:
 
         @router.get("/authors")
         def list_authors(db: Session = Depends(get_db)):
             ...
     """
-    db: Session = SessionLocal()
+    db: Session = new_session()
     try:
         yield db          # the endpoint gets the session here
     finally:
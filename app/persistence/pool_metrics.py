@@ -0,0 +1,52 @@
+# app/persistence/pool_metrics.py
+"""
+Connection pools that record how long checkouts wait.
+
+SQLAlchemy exposes the pool's size, checked-out and overflow counts, but
+not how long a request waited for a connection, which is what grows first
+when a pool is too small. These subclasses time `_do_get` (the call that
+blocks on the pool's queue) and count checkouts that hit `pool_timeout`.
+"""
+
+import time
+
+from sqlalchemy import exc
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+
+
+class PoolWaitStats:
+    """Checkouts, total seconds spent waiting for them, and timeouts (plain counters)."""
+
+    __slots__ = ("checkouts", "wait_seconds", "timeouts")
+
+    def __init__(self) -> None:
+        self.checkouts = 0
+        self.wait_seconds = 0.0
+        self.timeouts = 0
+
+
+class _TimedGet:
+    wait_stats: PoolWaitStats
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.wait_stats = PoolWaitStats()
+
+    def _do_get(self):
+        started = time.perf_counter()
+        try:
+            return super()._do_get()
+        except exc.TimeoutError:
+            self.wait_stats.timeouts += 1
+            raise
+        finally:
+            self.wait_stats.checkouts += 1
+            self.wait_stats.wait_seconds += time.perf_counter() - started
+
+
+class TimedQueuePool(_TimedGet, QueuePool):
+    """`QueuePool` (the default pool of a sync engine) with checkout wait stats."""
+
+
+class TimedAsyncAdaptedQueuePool(_TimedGet, AsyncAdaptedQueuePool):
+    """`AsyncAdaptedQueuePool` (the default pool of an async engine) with checkout wait stats."""
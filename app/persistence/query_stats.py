@@ -0,0 +1,78 @@
+# app/persistence/query_stats.py
+"""
+Per-request SQL statistics collected from engine events.
+
+`instrument_engine` times every statement an engine executes and adds it
+to the `QueryStats` of the current request (a context variable set by the
+HTTP middleware, see app/presentation/query_timing.py), so each response
+can report how many queries it ran and how long they took. Outside of a
+request (scripts, startup) only the slow-query log applies.
+
+Statements slower than the engine's `slow_query_ms` threshold are logged
+on the ``app.sql`` logger at WARNING level.
+"""
+
+import logging
+import time
+from contextvars import ContextVar
+from typing import Optional
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+# Statements are truncated in logs; a bulk INSERT can be megabytes long.
+MAX_LOGGED_SQL = 300
+
+logger = logging.getLogger("app.sql")
+
+
+class QueryStats:
+    """Statement count, total DB time and slowest statement of one request."""
+
+    __slots__ = ("count", "total_ms", "slowest_ms", "slowest_sql")
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.total_ms = 0.0
+        self.slowest_ms = 0.0
+        self.slowest_sql: Optional[str] = None
+
+    def add(self, statement: str, elapsed_ms: float) -> None:
+        self.count += 1
+        self.total_ms += elapsed_ms
+        if elapsed_ms > self.slowest_ms:
+            self.slowest_ms = elapsed_ms
+            self.slowest_sql = statement
+
+
+current_query_stats: ContextVar[Optional[QueryStats]] = ContextVar("current_query_stats", default=None)
+
+
+def shorten_sql(statement: str) -> str:
+    """Collapse whitespace and truncate a statement for logging."""
+    statement = " ".join(statement.split())
+    return statement if len(statement) <= MAX_LOGGED_SQL else statement[:MAX_LOGGED_SQL] + "…"
+
+
+def instrument_engine(engine: Engine, *, slow_query_ms: float = 0) -> None:
+    """
+    Time every statement run by `engine` (for an AsyncEngine, pass its `sync_engine`).
+    Statements taking `slow_query_ms` or more are logged (0 disables the slow-query log).
+
+    The start time is kept on the connection, which runs one statement at a time.
+    """
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def _before(conn, cursor, statement, parameters, context, executemany):
+        conn.info["query_start"] = time.perf_counter()
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def _after(conn, cursor, statement, parameters, context, executemany):
+        elapsed_ms = (time.perf_counter() - conn.info["query_start"]) * 1000
+
+        stats = current_query_stats.get()
+        if stats is not None:
+            stats.add(statement, elapsed_ms)
+
+        if slow_query_ms and elapsed_ms >= slow_query_ms:
+            logger.warning("slow query (%.1f ms): %s", elapsed_ms, shorten_sql(statement))
@@ -0,0 +1,208 @@
+# app/persistence/replicas.py
+"""
+Read replicas: round-robin selection with health-based ejection.
+
+`get_db` / `get_async_db` bind a request's session to a replica when the
+request may read from one (`read_from_replica`, a context variable set by
+app/presentation/read_your_writes.py for GET/HEAD requests of clients
+that did not just write) and to the primary otherwise, so routes and
+services do not know replicas exist.
+
+A `ReplicaSet` hands out its replicas in turn and skips the ejected ones:
+
+* passively, as soon as a statement on a replica fails to connect or
+  loses its connection (engine ``handle_error`` event);
+* actively, every `check_interval` seconds the next request that picks a
+  replica first runs `LAG_QUERY` on it and ejects it when it is
+  unreachable or replays more than `max_lag` seconds behind the primary.
+
+An ejected replica is checked again after `eject_seconds`. When every
+replica is ejected, reads go to the primary.
+
+Process-wide state shared by every client (response cache, in-memory
+indexes) must not be filled from a replica, which may not have replayed a
+write yet: `replica_primary` tells a session bound to a replica apart and
+gives its primary (see `primary_session` in app/persistence/db.py).
+"""
+
+import itertools
+import logging
+import threading
+import time
+from contextvars import ContextVar
+from typing import Any, Awaitable, Callable, Dict, Iterator, List, Optional, Tuple
+
+from sqlalchemy import event, text
+from sqlalchemy.engine import Engine
+
+logger = logging.getLogger("app.replicas")
+
+# Set per request: True when the request's session may use a replica.
+read_from_replica: ContextVar[bool] = ContextVar("read_from_replica", default=False)
+
+# Sync engine of every replica -> sync engine of its primary.
+_primaries: Dict[Engine, Engine] = {}
+
+# Seconds of replay lag; 0 on a primary and on a replica that has replayed
+# everything it received (an idle primary sends nothing to replay).
+LAG_QUERY = text(
+    """
+    SELECT CASE
+        WHEN pg_is_in_recovery() AND pg_last_wal_receive_lsn() IS DISTINCT FROM pg_last_wal_replay_lsn()
+        THEN COALESCE(EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0)
+        ELSE 0
+    END
+    """
+)
+
+
+class Replica:
+    """One replica engine and its health state."""
+
+    __slots__ = ("name", "engine", "ejected_until", "next_check", "last_error")
+
+    def __init__(self, name: str, engine: Any) -> None:
+        self.name = name
+        self.engine = engine
+        self.ejected_until = 0.0
+        self.next_check = 0.0
+        self.last_error: Optional[str] = None
+
+
+class ReplicaSet:
+    """
+    Round-robin over replica engines (sync `Engine`s or `AsyncEngine`s).
+
+    Selection is `pick` for sync engines and `apick` for async ones; both
+    return None when no replica can serve reads right now.
+    """
+
+    def __init__(
+        self,
+        engines: List[Any],
+        *,
+        primary: Optional[Any] = None,
+        check_interval: float = 5,
+        eject_seconds: float = 30,
+        max_lag: float = 10,
+    ) -> None:
+        self.replicas = [Replica(_display_name(e), e) for e in engines]
+        self.check_interval = check_interval
+        self.eject_seconds = eject_seconds
+        self.max_lag = max_lag
+        self._turn = itertools.count()
+        self._lock = threading.Lock()
+        for replica in self.replicas:
+            _eject_on_connection_errors(self, replica)
+            if primary is not None:
+                _primaries[_sync_engine(replica.engine)] = _sync_engine(primary)
+
+    def __bool__(self) -> bool:
+        return bool(self.replicas)
+
+    def pick(self, check: Callable[[Any], float]) -> Optional[Any]:
+        """Next usable sync engine; `check(engine)` returns its lag in seconds."""
+        for replica, needs_check in self._candidates():
+            if needs_check and not self._record_check(replica, lambda: check(replica.engine)):
+                continue
+            return replica.engine
+        return None
+
+    async def apick(self, check: Callable[[Any], Awaitable[float]]) -> Optional[Any]:
+        """Next usable async engine; `await check(engine)` returns its lag in seconds."""
+        for replica, needs_check in self._candidates():
+            if needs_check:
+                try:
+                    lag = await check(replica.engine)
+                except Exception as exc:   # pylint: disable=broad-except
+                    self.eject(replica, f"check failed: {type(exc).__name__}")
+                    continue
+                if not self._record_check(replica, lambda: lag):
+                    continue
+            return replica.engine
+        return None
+
+    def eject(self, replica: Replica, reason: str) -> None:
+        if replica.ejected_until <= time.monotonic():
+            logger.warning("Replica %s ejected for %.0f s: %s", replica.name, self.eject_seconds, reason)
+        replica.ejected_until = time.monotonic() + self.eject_seconds
+        replica.next_check = 0.0            # probe it before it serves again
+        replica.last_error = reason
+
+    def status(self) -> List[dict]:
+        now = time.monotonic()
+        return [
+            {
+                "name": r.name,
+                "healthy": r.ejected_until <= now,
+                "ejected_for_s": round(max(r.ejected_until - now, 0), 1),
+                "last_error": r.last_error,
+            }
+            for r in self.replicas
+        ]
+
+    def _candidates(self) -> Iterator[Tuple[Replica, bool]]:
+        """Replicas in round-robin order, each with whether it is due for a check."""
+        if not self.replicas:
+            return
+        start = next(self._turn)
+        for offset in range(len(self.replicas)):
+            replica = self.replicas[(start + offset) % len(self.replicas)]
+            now = time.monotonic()
+            if replica.ejected_until > now:
+                continue
+            with self._lock:               # one request per interval runs the check
+                needs_check = replica.next_check <= now
+                if needs_check:
+                    replica.next_check = now + self.check_interval
+            yield replica, needs_check
+
+    def _record_check(self, replica: Replica, lag: Callable[[], float]) -> bool:
+        try:
+            seconds = float(lag())
+        except Exception as exc:   # pylint: disable=broad-except
+            self.eject(replica, f"check failed: {type(exc).__name__}")
+            return False
+        if seconds > self.max_lag:
+            self.eject(replica, f"replication lag {seconds:.1f} s")
+            return False
+        if replica.last_error is not None:
+            logger.info("Replica %s is back", replica.name)
+            replica.last_error = None
+        return True
+
+
+def replica_primary(session: Any) -> Optional[Engine]:
+    """
+    The (sync) engine of the primary when `session` is bound to a replica,
+    None when it is bound to the primary. `session` is a `Session`, or the
+    `sync_session` of an `AsyncSession` (what `run_sync` passes).
+    """
+    return _primaries.get(session.get_bind())
+
+
+def check_lag(engine: Engine) -> float:
+    with engine.connect() as conn:
+        return conn.execute(LAG_QUERY).scalar()
+
+
+async def check_lag_async(engine: Any) -> float:
+    async with engine.connect() as conn:
+        return (await conn.execute(LAG_QUERY)).scalar()
+
+
+def _display_name(engine: Any) -> str:
+    url = engine.url
+    return f"{url.host or 'localhost'}:{url.port or 5432}/{url.database}"
+
+
+def _sync_engine(engine: Any) -> Engine:
+    return getattr(engine, "sync_engine", engine)
+
+
+def _eject_on_connection_errors(replicas: ReplicaSet, replica: Replica) -> None:
+    @event.listens_for(_sync_engine(replica.engine), "handle_error")
+    def _on_error(context) -> None:
+        # No connection: the connect itself failed.
+        if context.is_disconnect or context.connection is None:
+            replicas.eject(replica, f"connection error: {type(context.original_exception).__name__}")
@@ -5,14 +5,29 @@ This module contains all low-level database operations related to Author,
 encapsulating direct SQLAlchemy usage from the rest of the application.
 """
 
-from typing import List, Optional
+from collections import Counter
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Tuple
+from sqlalchemy import Column, MetaData, Row, String, Table, delete, func, insert, literal_column, select, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.orm import Session
 
 from app.domain.models.author import Author
+from app.domain.models.recipe import Recipe
+from app.domain.models.recipe_ingredient import RecipeIngredient
 from app.domain.schemas.author import AuthorCreate
+from app.persistence.constraints import raise_constraint_violations
+from app.persistence.copy import copy_rows, supports_copy
+from app.persistence.repositories.stats_repository import apply_recipe_count_deltas, created_day
+
+# Authors per INSERT statement in the bulk paths: large enough to amortize
+# round trips, small enough to keep statements and bind lists reasonable.
+BULK_CHUNK_SIZE = 1000
+
+# What the write paths return instead of reloading the entity (AuthorResponse fields).
+_AUTHOR_COLUMNS = (Author.id, Author.name, Author.email, Author.version)
 
 # POST Authors endpoint is not using this fn at the moment.
-def create_author(db: Session, *, name: str, email: str) -> Author:
+def create_author(db: Session, *, name: str, email: str) -> Row:
     """
     Insert a new Author into the database.
 
@@ -22,12 +37,15 @@ def create_author(db: Session, *, name: str, email: str) -> Author:
         email: Author's email address.
 
     Returns:
-        The newly created Author instance.
+        The created author's row (id, name, email, version).
+
+    Raises:
+        ConstraintViolation: If the email already exists.
     """
-    author = Author(name=name, email=email)
-    db.add(author)
-    db.commit()
-    db.refresh(author)
+    stmt = insert(Author).values(name=name, email=email).returning(*_AUTHOR_COLUMNS)
+    with raise_constraint_violations(db):
+        author = db.execute(stmt).one()
+        db.commit()
     return author
 
 
@@ -35,29 +53,128 @@ def create_author(db: Session, *, name: str, email: str) -> Author:
 def create_authors(
     db: Session,
     author_items: List[AuthorCreate],
-) -> List[Author]:
+) -> List[Row]:
     """
     Insert multiple Authors with a single transaction.
 
+    Rows are sent as multi-row INSERT ... RETURNING statements of up to
+    `BULK_CHUNK_SIZE` authors each, so the generated IDs come back with the
+    insert itself instead of one refresh SELECT per author.
+
     Args:
         db: Database session.
         authors_data: List of AuthorsCreate, each containing .name and .email.
 
     Returns:
-        List of newly created Author instances.
+        One row (id, name, email, version) per created author, in payload order.
+
+    Raises:
+        ConstraintViolation: If an email already exists; nothing is inserted.
     """
-    authors_created: List[Author] = []
+    authors_created: List[Row] = []
+
+    with raise_constraint_violations(db):
+        for chunk in _chunks(author_items):
+            stmt = (
+                insert(Author)
+                .values([{"name": a.name, "email": a.email} for a in chunk])
+                .returning(*_AUTHOR_COLUMNS)
+            )
+            authors_created.extend(db.execute(stmt).all())
+
+        db.commit()             # one commit for all the authors created
+    return authors_created
 
-    for data in author_items:
-        author = Author(name=data.name, email=data.email)
-        db.add(author)
-        authors_created.append(author)
 
-    db.commit()                 # one commit for all the authors created
-    for author in authors_created:
-        db.refresh(author)
+def upsert_authors(
+    db: Session,
+    author_items: List[AuthorCreate],
+    *,
+    update_existing: bool,
+) -> List[Row]:
+    """
+    Insert multiple Authors, resolving email conflicts inside PostgreSQL.
 
-    return authors_created
+    Uses INSERT ... ON CONFLICT (email) DO NOTHING, or DO UPDATE SET name
+    when `update_existing` is true, chunked like `create_authors`.
+    The payload must not contain the same email twice.
+
+    Args:
+        db: Database session.
+        author_items: Authors to insert.
+        update_existing: Overwrite the name of authors whose email already exists.
+
+    Returns:
+        One row (id, name, email, version, inserted) per created or updated author.
+        Skipped authors are not returned.
+    """
+    rows: List[Row] = []
+
+    for chunk in _chunks(author_items):
+        stmt = pg_insert(Author).values([{"name": a.name, "email": a.email} for a in chunk])
+        if update_existing:
+            stmt = stmt.on_conflict_do_update(
+                index_elements=[Author.email],
+                set_={
+                    "name": stmt.excluded.name,
+                    "version": Author.version + 1,
+                    "updated_at": func.now(),
+                },
+            )
+        else:
+            stmt = stmt.on_conflict_do_nothing(index_elements=[Author.email])
+        # xmax is 0 only for tuples created by this statement, not for updated ones
+        stmt = stmt.returning(
+            Author.id,
+            Author.name,
+            Author.email,
+            Author.version,
+            literal_column("xmax = 0").label("inserted"),
+        )
+        rows.extend(db.execute(stmt).all())
+
+    db.commit()
+    return rows
+
+
+def import_authors(db: Session, rows: List[Tuple[str, str]]) -> int:
+    """
+    Bulk-load (name, email) rows, skipping emails that already exist.
+
+    With psycopg2 the rows are COPY'd into a temporary staging table and
+    moved with one INSERT ... SELECT ... ON CONFLICT DO NOTHING; other drivers
+    get a single multi-row INSERT with the same conflict handling.
+
+    Returns:
+        Number of authors actually inserted.
+    """
+    if supports_copy(db):
+        staging = _import_staging_table()
+        staging.create(db.connection())
+        copy_rows(db, staging.name, ("name", "email"), rows)
+        stmt = pg_insert(Author).from_select(["name", "email"], select(staging.c.name, staging.c.email))
+    else:
+        stmt = pg_insert(Author).values([{"name": name, "email": email} for name, email in rows])
+
+    result = db.execute(stmt.on_conflict_do_nothing(index_elements=[Author.email]))
+    db.commit()
+    return result.rowcount
+
+
+def _import_staging_table() -> Table:
+    return Table(
+        "authors_import",
+        MetaData(),
+        Column("name", String),
+        Column("email", String),
+        prefixes=["TEMPORARY"],
+        postgresql_on_commit="DROP",
+    )
+
+
+def _chunks(items: List[AuthorCreate]) -> Iterator[List[AuthorCreate]]:
+    for start in range(0, len(items), BULK_CHUNK_SIZE):
+        yield items[start:start + BULK_CHUNK_SIZE]
 
 
 def get_author_by_id(db: Session, author_id: int) -> Optional[Author]:
@@ -88,61 +205,197 @@ def get_author_by_email(db: Session, email: str) -> Optional[Author]:
     return db.query(Author).filter(Author.email == email).first()
 
 
-def list_authors(db: Session, *, skip: int = 0, limit: int = 100) -> List[Author]:
+def get_ids_by_email(db: Session, emails: Iterable[str]) -> Dict[str, int]:
+    """Return ``{email: id}`` for the given emails that exist, with one query."""
+    emails = list(emails)
+    if not emails:
+        return {}
+    rows = db.execute(select(Author.email, Author.id).where(Author.email.in_(emails)))
+    return {row.email: row.id for row in rows}
+
+
+def get_existing_ids(db: Session, author_ids: Iterable[int]) -> Set[int]:
+    """Return the subset of `author_ids` that exists, with one query."""
+    author_ids = list(author_ids)
+    if not author_ids:
+        return set()
+    return set(db.scalars(select(Author.id).where(Author.id.in_(author_ids))))
+
+
+def list_authors(
+    db: Session,
+    *,
+    skip: int = 0,
+    limit: int = 100,
+    after_id: Optional[int] = None,
+) -> List[Author]:
     """
-    Return a paginated list of authors.
+    Return a paginated list of authors, ordered by ID.
 
     Args:
         db: Database session.
         skip: Number of records to skip.
         limit: Maximum number of records to return.
+        after_id: Keyset cursor; only authors with a greater ID are returned.
 
     Returns:
         A list of Author instances.
     """
-    return db.query(Author).offset(skip).limit(limit).all()
+    query = db.query(Author).order_by(Author.id)
+    if after_id is not None:
+        query = query.filter(Author.id > after_id)
+    return query.offset(skip).limit(limit).all()
+
+
+def get_author_version(db: Session, author_id: int) -> Optional[Tuple[int, int]]:
+    """
+    Return the (id, version) of an author without loading the entity.
+
+    Args:
+        db: Database session.
+        author_id: Author's unique ID.
+
+    Returns:
+        The key used for the author's ETag, or None if it does not exist.
+    """
+    row = db.execute(select(Author.id, Author.version).where(Author.id == author_id)).first()
+    return tuple(row) if row is not None else None
+
+
+def list_author_versions(
+    db: Session,
+    *,
+    skip: int = 0,
+    limit: int = 100,
+    after_id: Optional[int] = None,
+) -> List[Tuple[int, int]]:
+    """
+    (id, version) of the authors `list_authors` would return for the same arguments.
+
+    Returns:
+        A list of (id, version) tuples, ordered by ID.
+    """
+    stmt = select(Author.id, Author.version).order_by(Author.id)
+    if after_id is not None:
+        stmt = stmt.where(Author.id > after_id)
+    return [tuple(row) for row in db.execute(stmt.offset(skip).limit(limit))]
+
+
+def stream_authors(db: Session, *, batch_size: int = 1000) -> Iterator[List[Author]]:
+    """
+    Iterate over every author in ID order, `batch_size` rows at a time.
+
+    Uses a server-side cursor (yield_per), so only one batch is held in
+    memory whatever the size of the table.
+
+    Args:
+        db: Database session, kept open by the caller while iterating.
+        batch_size: Rows fetched per round trip.
+
+    Returns:
+        An iterator of Author batches.
+    """
+    result = db.execute(
+        select(Author).order_by(Author.id).execution_options(yield_per=batch_size)
+    )
+    for batch in result.scalars().partitions():
+        yield list(batch)
 
 
 def update_author(
     db: Session,
-    author: Author,
+    author_id: int,
     *,
     name: Optional[str] = None,
     email: Optional[str] = None,
-) -> Author:
+) -> Optional[Row]:
     """
-    Update an existing Author instance.
+    Update an Author with a single UPDATE ... RETURNING, without loading it first.
 
     Args:
         db: Database session.
-        author: The Author to update (already loaded from DB).
+        author_id: Author's unique ID.
         name: New name (optional).
         email: New email (optional).
 
     Returns:
-        The updated Author instance.
+        The author's row (id, name, email, version) after the update, or
+        None if it does not exist.
+
+    Raises:
+        ConstraintViolation: If the new email belongs to another author.
     """
+    values = {}
     if name is not None:
-        author.name = name
+        values["name"] = name
     if email is not None:
-        author.email = email
-
-    db.add(author)
-    db.commit()
-    db.refresh(author)
+        values["email"] = email
+    if not values:
+        return db.execute(select(*_AUTHOR_COLUMNS).where(Author.id == author_id)).first()
+
+    stmt = (
+        update(Author)
+        .where(Author.id == author_id)
+        # SQL-side increment, so concurrent updates can't both write the same version
+        .values(**values, version=Author.version + 1, updated_at=func.now())
+        .returning(*_AUTHOR_COLUMNS)
+    )
+    with raise_constraint_violations(db):
+        author = db.execute(stmt, execution_options={"synchronize_session": False}).first()
+        if author is not None:
+            db.commit()
     return author
 
 
-def delete_author(db: Session, author: Author) -> None:
+def delete_author(db: Session, author_id: int) -> Optional[Dict[int, List[int]]]:
     """
-    Delete an existing Author from the database.
+    Delete an Author and their recipes with three set-based DELETEs.
+
+    Recipe ingredient lines go first, then the recipes, then the author,
+    in one transaction; nothing is loaded into the session. The deleted
+    recipes are taken off the ingredient and per-day counters; the
+    author's own counter row goes with the author (ON DELETE CASCADE).
 
     Args:
         db: Database session.
-        author: The Author to delete.
+        author_id: Author's unique ID.
 
     Returns:
-        None
+        ``{recipe_id: [ingredient_id, ...]}`` of every deleted recipe (an
+        empty list for a recipe without ingredients), or None if the author
+        does not exist.
     """
-    db.delete(author)
+    author_recipes = select(Recipe.id).where(Recipe.author_id == author_id)
+    lines = db.execute(
+        delete(RecipeIngredient)
+        .where(RecipeIngredient.recipe_id.in_(author_recipes))
+        .returning(RecipeIngredient.recipe_id, RecipeIngredient.ingredient_id),
+        execution_options={"synchronize_session": False},
+    )
+    deleted_recipes: Dict[int, List[int]] = {}
+    for recipe_id, ingredient_id in lines:
+        deleted_recipes.setdefault(recipe_id, []).append(ingredient_id)
+
+    recipes = db.execute(
+        delete(Recipe).where(Recipe.author_id == author_id).returning(Recipe.id, Recipe.created_at),
+        execution_options={"synchronize_session": False},
+    ).all()
+    for recipe_id, _ in recipes:
+        deleted_recipes.setdefault(recipe_id, [])
+    deleted = db.execute(
+        delete(Author).where(Author.id == author_id),
+        execution_options={"synchronize_session": False},
+    )
+    if deleted.rowcount == 0:
+        db.rollback()
+        return None
+    apply_recipe_count_deltas(
+        db,
+        ingredients={
+            ingredient_id: -n
+            for ingredient_id, n in Counter(i for ids in deleted_recipes.values() for i in ids).items()
+        },
+        days={day: -n for day, n in Counter(created_day(c) for _, c in recipes).items()},
+    )
     db.commit()
+    return deleted_recipes
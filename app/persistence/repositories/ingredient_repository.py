@@ -5,22 +5,60 @@ Encapsulates all low-level DB operations so upper layers
 do not deal with raw SQLAlchemy queries.
 """
 
-from typing import List, Optional
+from typing import Collection, Dict, Iterable, Iterator, List, Optional, Tuple
+from sqlalchemy import Column, MetaData, Row, String, Table, delete, insert, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.orm import Session
 
 from app.domain.models.ingredient import Ingredient
+from app.persistence.constraints import raise_constraint_violations
+from app.persistence.copy import copy_rows, supports_copy
 
 
 # ───────────────────────── CREATE ─────────────────────────
-def create_ingredient(db: Session, *, name: str) -> Ingredient:
-    """Insert a new Ingredient into the DB and return it."""
-    ingredient = Ingredient(name=name)
-    db.add(ingredient)
-    db.commit()
-    db.refresh(ingredient)
+def create_ingredient(db: Session, *, name: str) -> Row:
+    """
+    Insert a new Ingredient and return its (id, name, version) row.
+
+    Raises `ConstraintViolation` if the name already exists.
+    """
+    stmt = insert(Ingredient).values(name=name).returning(Ingredient.id, Ingredient.name, Ingredient.version)
+    with raise_constraint_violations(db):
+        ingredient = db.execute(stmt).one()
+        db.commit()
     return ingredient
 
 
+def import_ingredients(db: Session, names: List[str]) -> int:
+    """
+    Bulk-load ingredient names, skipping the ones that already exist.
+
+    Same strategy as `author_repository.import_authors`: COPY into a
+    temporary staging table when the driver supports it, then one
+    INSERT ... SELECT ... ON CONFLICT (name) DO NOTHING.
+
+    Returns:
+        Number of ingredients actually inserted.
+    """
+    if supports_copy(db):
+        staging = Table(
+            "ingredients_import",
+            MetaData(),
+            Column("name", String),
+            prefixes=["TEMPORARY"],
+            postgresql_on_commit="DROP",
+        )
+        staging.create(db.connection())
+        copy_rows(db, staging.name, ("name",), [(name,) for name in names])
+        stmt = pg_insert(Ingredient).from_select(["name"], select(staging.c.name))
+    else:
+        stmt = pg_insert(Ingredient).values([{"name": name} for name in names])
+
+    result = db.execute(stmt.on_conflict_do_nothing(index_elements=[Ingredient.name]))
+    db.commit()
+    return result.rowcount
+
+
 # ───────────────────────── READ ──────────────────────────
 def get_ingredient_by_id(db: Session, ingredient_id: int) -> Optional[Ingredient]:
     return db.get(Ingredient, ingredient_id)
@@ -30,11 +68,105 @@ def get_ingredient_by_name(db: Session, name: str) -> Optional[Ingredient]:
     return db.query(Ingredient).filter(Ingredient.name == name).first()
 
 
-def list_ingredients(db: Session, *, skip: int = 0, limit: int = 100) -> List[Ingredient]:
-    return db.query(Ingredient).offset(skip).limit(limit).all()
+def get_ingredient_names(db: Session, ingredient_ids: Iterable[int]) -> Dict[int, str]:
+    """Return ``{id: name}`` for the given IDs with a single ``IN (...)`` query."""
+    ids = list(ingredient_ids)
+    if not ids:
+        return {}
+    rows = db.query(Ingredient.id, Ingredient.name).filter(Ingredient.id.in_(ids)).all()
+    return {row.id: row.name for row in rows}
+
+
+def get_ingredient_ids_by_name(db: Session, names: Iterable[str]) -> Dict[str, int]:
+    """Return ``{name: id}`` for the given names that exist, with one query."""
+    names = list(names)
+    if not names:
+        return {}
+    rows = db.query(Ingredient.name, Ingredient.id).filter(Ingredient.name.in_(names)).all()
+    return {row.name: row.id for row in rows}
+
+
+def list_ingredients(
+    db: Session,
+    *,
+    skip: int = 0,
+    limit: int = 100,
+    after_id: Optional[int] = None,
+) -> List[Ingredient]:
+    query = db.query(Ingredient).order_by(Ingredient.id)
+    if after_id is not None:
+        query = query.filter(Ingredient.id > after_id)    # keyset: no rows to skip over
+    return query.offset(skip).limit(limit).all()
+
+
+def get_ingredient_version(db: Session, ingredient_id: int) -> Optional[Tuple[int, int]]:
+    """Return the (id, version) ETag key of an ingredient, or None if it does not exist."""
+    row = db.execute(
+        select(Ingredient.id, Ingredient.version).where(Ingredient.id == ingredient_id)
+    ).first()
+    return tuple(row) if row is not None else None
+
+
+def list_ingredient_versions(
+    db: Session,
+    *,
+    skip: int = 0,
+    limit: int = 100,
+    after_id: Optional[int] = None,
+) -> List[Tuple[int, int]]:
+    """(id, version) of the ingredients `list_ingredients` would return for the same arguments."""
+    stmt = select(Ingredient.id, Ingredient.version).order_by(Ingredient.id)
+    if after_id is not None:
+        stmt = stmt.where(Ingredient.id > after_id)
+    return [tuple(row) for row in db.execute(stmt.offset(skip).limit(limit))]
+
+
+def stream_ingredients(db: Session, *, batch_size: int = 1000) -> Iterator[List[Ingredient]]:
+    """Iterate over every ingredient in ID order through a server-side cursor (yield_per)."""
+    result = db.execute(
+        select(Ingredient).order_by(Ingredient.id).execution_options(yield_per=batch_size)
+    )
+    for batch in result.scalars().partitions():
+        yield list(batch)
+
+
+def get_all_ingredient_names(db: Session) -> List[Tuple[int, str]]:
+    """Return every ``(id, name)`` pair; used to load the in-memory suggestion index."""
+    return [tuple(row) for row in db.execute(select(Ingredient.id, Ingredient.name))]
+
+
+def suggest_ingredients_fuzzy(
+    db: Session,
+    text: str,
+    *,
+    limit: int = 10,
+    exclude_ids: Collection[int] = (),
+) -> List[Ingredient]:
+    """
+    Typo-tolerant lookup: ingredients containing a word similar to `text`,
+    closest first, through the pg_trgm GiST index (`%>` filter, `<->>` KNN order).
+    """
+    query = (
+        db.query(Ingredient)
+        .filter(Ingredient.name.op("%>")(text))
+        .order_by(Ingredient.name.op("<->>")(text), Ingredient.id)
+    )
+    if exclude_ids:
+        query = query.filter(Ingredient.id.notin_(list(exclude_ids)))
+    return query.limit(limit).all()
 
 
 # ───────────────────────── DELETE ────────────────────────
-def delete_ingredient(db: Session, ingredient: Ingredient) -> None:
-    db.delete(ingredient)
-    db.commit()
+def delete_ingredient(db: Session, ingredient_id: int) -> Optional[str]:
+    """
+    Delete an Ingredient with a single DELETE ... RETURNING name.
+
+    Returns the deleted name, or None if it does not exist. Raises
+    `ConstraintViolation` if a recipe still uses it.
+    """
+    stmt = delete(Ingredient).where(Ingredient.id == ingredient_id).returning(Ingredient.name)
+    with raise_constraint_violations(db):
+        name = db.execute(stmt, execution_options={"synchronize_session": False}).scalar()
+        if name is not None:
+            db.commit()
+    return name
@@ -5,11 +5,89 @@ This module contains all low-level database operations related to Recipe,
 encapsulating direct SQLAlchemy usage from the rest of the application.
 """
 
-from typing import List, Optional
-from sqlalchemy.orm import Session
+from collections import Counter
+from typing import Iterable, Iterator, List, Optional, Tuple
+from sqlalchemy import (
+    ARRAY, Float, Integer, REAL, Row, String, and_, bindparam, cast, delete, distinct, exists, func, insert,
+    literal, literal_column, or_, select, update,
+)
+from sqlalchemy.orm import Session, joinedload, selectinload
+from sqlalchemy.orm.attributes import set_committed_value
+from sqlalchemy.orm.exc import StaleDataError
 
+from app.domain.models.author import Author
+from app.domain.models.ingredient import Ingredient
 from app.domain.models.recipe import Recipe
 from app.domain.models.recipe_ingredient import RecipeIngredient
+from app.domain.models.unit_conversion import UnitConversion
+from app.persistence.constraints import raise_constraint_violations
+from app.persistence.copy import copy_rows
+from app.persistence.repositories.stats_repository import apply_recipe_count_deltas, created_day
+
+
+# Loader options shared by every read that ends up serialized as a RecipeResponse.
+# The author is joined into the main SELECT and the ingredient rows for the whole
+# result set are fetched with a single extra "WHERE recipe_id IN (...)" query,
+# so a page costs the same number of round trips whatever its size.
+_RECIPE_DETAIL_OPTIONS = (
+    joinedload(Recipe.author),
+    selectinload(Recipe.ingredients),
+)
+
+# Text search configuration used both to build `search_vector` and to parse queries.
+# Rendered inline: asyncpg would bind it as varchar, which does not cast to regconfig.
+SEARCH_CONFIG = literal_column("'english'::regconfig")
+
+_HEADLINE_OPTIONS = "StartSel=<mark>, StopSel=</mark>, MaxFragments=2, MaxWords=20, MinWords=5"
+
+
+def _weighted_vector(text, weight: str):
+    return func.setweight(
+        func.to_tsvector(SEARCH_CONFIG, func.coalesce(text, "")),
+        literal_column(f"'{weight}'::\"char\""),
+    )
+
+
+def _search_document(title, description, ingredient_names):
+    """The weighted document: title (A) over description (B) over ingredient names (C)."""
+    return (
+        _weighted_vector(title, "A")
+        .op("||")(_weighted_vector(description, "B"))
+        .op("||")(_weighted_vector(ingredient_names, "C"))
+    )
+
+
+def _recipe_ingredient_names():
+    """Space-separated ingredient names of the recipe row being updated (correlated)."""
+    return (
+        select(func.string_agg(Ingredient.name, " "))
+        .join(RecipeIngredient, RecipeIngredient.ingredient_id == Ingredient.id)
+        .where(RecipeIngredient.recipe_id == Recipe.id)
+        .scalar_subquery()
+    )
+
+
+def refresh_search_vectors(db: Session, recipe_ids: Optional[Iterable[int]] = None) -> None:
+    """
+    Recompute `search_vector` for the given recipes (all of them when None).
+
+    The document weights the title (A) over the description (B) and the
+    ingredient names (C). It runs as one UPDATE inside the caller's
+    transaction; the caller commits.
+
+    Args:
+        db: Database session.
+        recipe_ids: Recipes whose text or ingredient list changed.
+
+    Returns:
+        None
+    """
+    stmt = update(Recipe).values(
+        search_vector=_search_document(Recipe.title, Recipe.description, _recipe_ingredient_names())
+    )
+    if recipe_ids is not None:
+        stmt = stmt.where(Recipe.id.in_(list(recipe_ids)))
+    db.execute(stmt, execution_options={"synchronize_session": False})
 
 
 def create_recipe(
@@ -19,39 +97,137 @@ def create_recipe(
     description: Optional[str],
     author_id: int,
     ingredients_data: List[dict]
-) -> Recipe:
+) -> Row:
     """
     Insert a new Recipe into the database with its ingredients.
 
+    Two statements, nothing read back afterwards: the recipe INSERT computes
+    `search_vector` inline and, as a data-modifying CTE, returns the new row
+    joined with its author; the ingredient lines follow as one multi-row INSERT.
+    The recipe counters (stats_repository) are updated in the same transaction.
+
     Args:
         db: Database session.
         title: Recipe title.
         description: Optional description.
         author_id: ID of the author.
-        ingredients_data: List of dicts with ingredient_id, quantity, and unit.
+        ingredients_data: List of dicts with ingredient_id, quantity, and unit,
+            one per distinct ingredient_id.
 
     Returns:
-        The newly created Recipe instance.
+        One row: the recipe's id, version and created_at, and its author's
+        author_id, author_name, author_email and author_version.
+
+    Raises:
+        ConstraintViolation: If the author or an ingredient does not exist.
     """
-    recipe = Recipe(title=title, description=description, author_id=author_id)
+    ingredient_ids = [item["ingredient_id"] for item in ingredients_data]
+    ingredient_names = (
+        select(func.string_agg(Ingredient.name, " "))
+        .where(Ingredient.id.in_(ingredient_ids))
+        .scalar_subquery()
+    )
+    recipes = Recipe.__table__
+    inserted = (
+        insert(recipes)
+        .values(
+            title=title,
+            description=description,
+            author_id=author_id,
+            search_vector=_search_document(
+                literal(title, String), literal(description, String), ingredient_names
+            ),
+        )
+        .returning(recipes.c.id, recipes.c.version, recipes.c.author_id, recipes.c.created_at)
+        .cte("inserted_recipe")
+    )
+    stmt = select(
+        inserted.c.id,
+        inserted.c.version,
+        inserted.c.created_at,
+        inserted.c.author_id,
+        Author.name.label("author_name"),
+        Author.email.label("author_email"),
+        Author.version.label("author_version"),
+    ).join_from(inserted, Author, Author.id == inserted.c.author_id)
 
-    for item in ingredients_data:
-        ri = RecipeIngredient(
-            ingredient_id=item["ingredient_id"],
-            quantity=item["quantity"],
-            unit=item["unit"],
+    with raise_constraint_violations(db):
+        recipe = db.execute(stmt).one()
+        if ingredients_data:
+            db.execute(
+                insert(RecipeIngredient),
+                [
+                    {
+                        "recipe_id": recipe.id,
+                        "ingredient_id": item["ingredient_id"],
+                        "quantity": item["quantity"],
+                        "unit": item["unit"],
+                    }
+                    for item in ingredients_data
+                ],
+            )
+        apply_recipe_count_deltas(
+            db,
+            authors={recipe.author_id: 1},
+            ingredients={ingredient_id: 1 for ingredient_id in ingredient_ids},
+            days={created_day(recipe.created_at): 1},
         )
-        recipe.ingredients.append(ri)
+        db.commit()
+    return recipe
+
+
+def import_recipes(db: Session, recipes: List[dict]) -> int:
+    """
+    Bulk-insert recipes together with their ingredients.
+
+    Recipes go in as multi-row INSERT ... RETURNING id, and their
+    `recipe_ingredients` rows are COPY'd (or multi-row INSERTed when the
+    driver has no COPY support); the recipe counters get one upsert per
+    table for the whole batch. Authors and ingredients must already be
+    validated by the caller.
 
-    db.add(recipe)
+    Args:
+        db: Database session.
+        recipes: Dicts with title, description, author_id and an
+            `ingredients` list of dicts with ingredient_id, quantity and unit.
+
+    Returns:
+        Number of recipes inserted.
+    """
+    inserted = db.execute(
+        insert(Recipe).returning(Recipe.id, Recipe.created_at, sort_by_parameter_order=True),
+        [
+            {"title": r["title"], "description": r["description"], "author_id": r["author_id"]}
+            for r in recipes
+        ],
+        # keep NULL descriptions in the same batch instead of splitting it per key set
+        execution_options={"render_nulls": True},
+    ).all()
+    recipe_ids = [row.id for row in inserted]
+
+    columns = ("recipe_id", "ingredient_id", "quantity", "unit")
+    ingredient_rows = [
+        (recipe_id, item["ingredient_id"], item["quantity"], item["unit"])
+        for recipe_id, r in zip(recipe_ids, recipes)
+        for item in r["ingredients"]
+    ]
+    if ingredient_rows and not copy_rows(db, RecipeIngredient.__tablename__, columns, ingredient_rows):
+        db.execute(insert(RecipeIngredient), [dict(zip(columns, row)) for row in ingredient_rows])
+
+    refresh_search_vectors(db, recipe_ids)
+    apply_recipe_count_deltas(
+        db,
+        authors=Counter(r["author_id"] for r in recipes),
+        ingredients=Counter(row[1] for row in ingredient_rows),
+        days=Counter(created_day(row.created_at) for row in inserted),
+    )
     db.commit()
-    db.refresh(recipe)
-    return recipe
+    return len(recipe_ids)
 
 
 def get_recipe_by_id(db: Session, recipe_id: int) -> Optional[Recipe]:
     """
-    Retrieve a Recipe by its primary key.
+    Retrieve a Recipe by its primary key, with its author and ingredients loaded.
 
     Args:
         db: Database session.
@@ -60,22 +236,354 @@ def get_recipe_by_id(db: Session, recipe_id: int) -> Optional[Recipe]:
     Returns:
         The Recipe if found, otherwise None.
     """
-    return db.get(Recipe, recipe_id)
+    return db.get(Recipe, recipe_id, options=_RECIPE_DETAIL_OPTIONS)
+
+
+def get_recipe_for_update(db: Session, recipe_id: int) -> Optional[Recipe]:
+    """
+    Like `get_recipe_by_id`, but with the author and the ingredient lines
+    joined into one SELECT: an update touches a single recipe, so the
+    second round trip of the select-in load buys nothing.
+    """
+    return db.execute(
+        select(Recipe)
+        .where(Recipe.id == recipe_id)
+        .options(joinedload(Recipe.author), joinedload(Recipe.ingredients))
+    ).unique().scalar_one_or_none()
 
 
-def list_recipes(db: Session, *, skip: int = 0, limit: int = 100) -> List[Recipe]:
+def list_recipe_rows(
+    db: Session,
+    *,
+    skip: int = 0,
+    limit: int = 100,
+    after_id: Optional[int] = None,
+) -> Tuple[List[Row], List[Row]]:
     """
-    Return a paginated list of recipes.
+    Return a paginated list of recipes ordered by ID, as plain rows.
+
+    Same two round trips as an eager-loaded ORM query, but no entities are
+    built: the listing endpoint turns the rows straight into its JSON.
 
     Args:
         db: Database session.
         skip: Number of records to skip.
         limit: Maximum number of records to return.
+        after_id: Keyset cursor; only recipes with a greater ID are returned.
+
+    Returns:
+        The recipe rows (id, version, title, description, author_id,
+        author_name, author_email, author_version), and the ingredient rows
+        (recipe_id, ingredient_id, quantity, unit) of those recipes.
+    """
+    stmt = (
+        select(
+            Recipe.id,
+            Recipe.version,
+            Recipe.title,
+            Recipe.description,
+            Recipe.author_id,
+            Author.name.label("author_name"),
+            Author.email.label("author_email"),
+            Author.version.label("author_version"),
+        )
+        .join(Author, Author.id == Recipe.author_id)
+        .order_by(Recipe.id)
+    )
+    if after_id is not None:
+        stmt = stmt.where(Recipe.id > after_id)
+    recipes = db.execute(stmt.offset(skip).limit(limit)).all()
+    if not recipes:
+        return recipes, []
+
+    ingredients = db.execute(
+        select(
+            RecipeIngredient.recipe_id,
+            RecipeIngredient.ingredient_id,
+            RecipeIngredient.quantity,
+            RecipeIngredient.unit,
+        ).where(RecipeIngredient.recipe_id.in_([r.id for r in recipes]))
+    ).all()
+    return recipes, ingredients
+
+
+def _version_select():
+    # A recipe embeds its author, so the author's version is part of the recipe's key.
+    return select(Recipe.id, Recipe.version, Author.id, Author.version).join(
+        Author, Author.id == Recipe.author_id
+    )
+
+
+def get_recipe_version(db: Session, recipe_id: int) -> Optional[Tuple[int, int, int, int]]:
+    """
+    Return the ETag key of a recipe without loading it or its ingredients.
+
+    Args:
+        db: Database session.
+        recipe_id: Recipe's unique ID.
+
+    Returns:
+        (recipe id, recipe version, author id, author version), or None if
+        the recipe does not exist.
+    """
+    row = db.execute(_version_select().where(Recipe.id == recipe_id)).first()
+    return tuple(row) if row is not None else None
+
+
+def list_recipe_versions(
+    db: Session,
+    *,
+    skip: int = 0,
+    limit: int = 100,
+    after_id: Optional[int] = None,
+) -> List[Tuple[int, int, int, int]]:
+    """
+    ETag keys of the recipes `list_recipes` would return for the same arguments.
+
+    Returns:
+        A list of (recipe id, recipe version, author id, author version) tuples, ordered by ID.
+    """
+    stmt = _version_select().order_by(Recipe.id)
+    if after_id is not None:
+        stmt = stmt.where(Recipe.id > after_id)
+    return [tuple(row) for row in db.execute(stmt.offset(skip).limit(limit))]
+
+
+def get_recipes_by_ids(db: Session, recipe_ids: List[int]) -> List[Recipe]:
+    """
+    Load several recipes, with authors and ingredients, in the order of `recipe_ids`.
+
+    Args:
+        db: Database session.
+        recipe_ids: IDs to load; unknown IDs are skipped.
 
     Returns:
         A list of Recipe instances.
     """
-    return db.query(Recipe).offset(skip).limit(limit).all()
+    if not recipe_ids:
+        return []
+    recipes = db.scalars(
+        select(Recipe).options(*_RECIPE_DETAIL_OPTIONS).where(Recipe.id.in_(recipe_ids))
+    ).all()
+    by_id = {r.id: r for r in recipes}
+    return [by_id[i] for i in recipe_ids if i in by_id]
+
+
+def get_recipe_ids_by_ingredient(db: Session, *, batch_size: int = 100) -> Iterator[Tuple[int, List[int]]]:
+    """
+    Stream the ingredient -> recipes postings used to build the in-memory index.
+
+    Args:
+        db: Database session.
+        batch_size: Ingredients fetched per round trip.
+
+    Returns:
+        An iterator of (ingredient_id, [recipe_id, ...]) pairs.
+    """
+    result = db.execute(
+        select(RecipeIngredient.ingredient_id, func.array_agg(RecipeIngredient.recipe_id))
+        .group_by(RecipeIngredient.ingredient_id)
+        .execution_options(yield_per=batch_size)
+    )
+    for ingredient_id, recipe_ids in result:
+        yield ingredient_id, recipe_ids
+
+
+def get_recipe_ids_by_ingredient_count(db: Session) -> Iterator[Tuple[int, List[int]]]:
+    """
+    Group every recipe by the number of ingredients it has.
+
+    Args:
+        db: Database session.
+
+    Returns:
+        An iterator of (ingredient count, [recipe_id, ...]) pairs.
+    """
+    counts = (
+        select(Recipe.id, func.count(RecipeIngredient.ingredient_id).label("size"))
+        .outerjoin(RecipeIngredient, RecipeIngredient.recipe_id == Recipe.id)
+        .group_by(Recipe.id)
+        .subquery()
+    )
+    result = db.execute(
+        select(counts.c.size, func.array_agg(counts.c.id))
+        .group_by(counts.c.size)
+        .execution_options(yield_per=1)
+    )
+    for size, recipe_ids in result:
+        yield size, recipe_ids
+
+
+def stream_recipes(db: Session, *, batch_size: int = 1000) -> Iterator[List[Recipe]]:
+    """
+    Iterate over every recipe in ID order, `batch_size` rows at a time.
+
+    Recipes are read through a server-side cursor (yield_per). Authors and
+    ingredients are loaded per batch with the same options as `list_recipes`,
+    so the whole catalog can be walked with bounded memory.
+
+    Args:
+        db: Database session, kept open by the caller while iterating.
+        batch_size: Recipes fetched per round trip.
+
+    Returns:
+        An iterator of Recipe batches.
+    """
+    result = db.execute(
+        select(Recipe)
+        .options(*_RECIPE_DETAIL_OPTIONS)
+        .order_by(Recipe.id)
+        .execution_options(yield_per=batch_size)
+    )
+    for batch in result.scalars().partitions():
+        yield list(batch)
+
+
+def search_recipes(
+    db: Session,
+    query: str,
+    *,
+    limit: int = 20,
+    after: Optional[Tuple[float, int]] = None,
+) -> List[Tuple[Recipe, float, str, Optional[str]]]:
+    """
+    Full-text search over titles, descriptions and ingredient names.
+
+    `query` uses web search syntax ("quoted phrases", OR, -exclusion). Matches
+    are found through the GIN index on `search_vector` and ordered by rank,
+    then ID. Headlines are only computed for the rows of the returned page.
+
+    Args:
+        db: Database session.
+        query: User search string.
+        limit: Maximum number of hits to return.
+        after: Keyset cursor, the (rank, id) of the last hit of the previous page.
+
+    Returns:
+        (recipe, rank, title headline, description headline) tuples, best first.
+    """
+    tsquery = func.websearch_to_tsquery(SEARCH_CONFIG, query)
+    rank = func.ts_rank(Recipe.search_vector, tsquery)
+
+    stmt = (
+        select(
+            Recipe,
+            rank.label("rank"),
+            func.ts_headline(SEARCH_CONFIG, Recipe.title, tsquery, _HEADLINE_OPTIONS),
+            func.ts_headline(SEARCH_CONFIG, Recipe.description, tsquery, _HEADLINE_OPTIONS),
+        )
+        .options(*_RECIPE_DETAIL_OPTIONS)
+        .where(Recipe.search_vector.op("@@")(tsquery))
+        .order_by(rank.desc(), Recipe.id)
+        .limit(limit)
+    )
+    if after is not None:
+        # ts_rank returns real; compare as real so the round-tripped cursor value matches exactly.
+        last_rank = cast(literal(after[0]), REAL)
+        stmt = stmt.where(
+            or_(rank < last_rank, and_(rank == last_rank, Recipe.id > after[1]))
+        )
+    return [tuple(row) for row in db.execute(stmt)]
+
+
+def _meal_plan():
+    """The (recipe_id, multiplier) pairs of a shopping list, bound as two arrays."""
+    return (
+        func.unnest(
+            bindparam("recipe_ids", type_=ARRAY(Integer)),
+            bindparam("multipliers", type_=ARRAY(Float)),
+        )
+        .table_valued("recipe_id", "multiplier")
+        .render_derived(name="plan")
+    )
+
+
+def get_missing_recipe_ids(db: Session, recipe_ids: List[int]) -> List[int]:
+    """IDs among `recipe_ids` that have no recipe, in request order."""
+    plan = _meal_plan()
+    stmt = select(plan.c.recipe_id).where(~exists().where(Recipe.id == plan.c.recipe_id))
+    return list(db.scalars(stmt, {"recipe_ids": recipe_ids, "multipliers": [1.0] * len(recipe_ids)}))
+
+
+def shopping_list_rows(db: Session, recipe_ids: List[int], multipliers: List[float]) -> List[Row]:
+    """
+    Total quantity of every ingredient over a meal plan, in one GROUP BY.
+
+    Each line's quantity is multiplied by its recipe's multiplier and
+    converted to its base unit through `unit_conversions` (matched on the
+    lower-cased, trimmed unit); lines in units missing from the table keep
+    their own unit and are totalled separately.
+
+    Args:
+        db: Database session.
+        recipe_ids: Recipes of the plan; a recipe listed twice counts twice.
+        multipliers: Servings factor of each entry of `recipe_ids`.
+
+    Returns:
+        Rows of (ingredient_id, ingredient_name, unit, quantity, recipe_count),
+        by ingredient name.
+    """
+    plan = _meal_plan()
+    unit_key = func.lower(func.trim(RecipeIngredient.unit))
+    unit = func.coalesce(UnitConversion.base_unit, unit_key)
+    stmt = (
+        select(
+            RecipeIngredient.ingredient_id,
+            Ingredient.name.label("ingredient_name"),
+            unit.label("unit"),
+            func.sum(
+                RecipeIngredient.quantity * func.coalesce(UnitConversion.factor, 1.0) * plan.c.multiplier
+            ).label("quantity"),
+            func.count(distinct(RecipeIngredient.recipe_id)).label("recipe_count"),
+        )
+        .select_from(plan)
+        .join(RecipeIngredient, RecipeIngredient.recipe_id == plan.c.recipe_id)
+        .join(Ingredient, Ingredient.id == RecipeIngredient.ingredient_id)
+        .outerjoin(UnitConversion, UnitConversion.unit == unit_key)
+        .group_by(RecipeIngredient.ingredient_id, Ingredient.name, unit)
+        .order_by(Ingredient.name, unit)
+    )
+    return db.execute(stmt, {"recipe_ids": recipe_ids, "multipliers": multipliers}).all()
+
+
+def _apply_ingredient_diff(recipe: Recipe, ingredients_data: List[dict]) -> Tuple[bool, bool]:
+    """
+    Make `recipe.ingredients` match `ingredients_data`, touching only the lines that differ.
+
+    Lines are matched by ingredient_id: dropped ones are deleted, changed ones
+    updated in place and new ones inserted. At flush the unit of work sends
+    each kind as one batched statement (executemany / multi-row INSERT), so
+    a one-line edit writes one row instead of rewriting the whole list.
+    A repeated ingredient_id keeps its last line.
+
+    Returns:
+        (whether any line changed, whether the set of ingredients changed)
+    """
+    wanted = {item["ingredient_id"]: item for item in ingredients_data}
+    current = {ri.ingredient_id: ri for ri in recipe.ingredients}
+
+    removed = [ri for ingredient_id, ri in current.items() if ingredient_id not in wanted]
+    for ri in removed:
+        recipe.ingredients.remove(ri)   # delete-orphan: DELETE at flush
+
+    added = updated = 0
+    for ingredient_id, item in wanted.items():
+        ri = current.get(ingredient_id)
+        if ri is None:
+            recipe.ingredients.append(RecipeIngredient(
+                ingredient_id=ingredient_id,
+                quantity=item["quantity"],
+                unit=item["unit"],
+            ))
+            added += 1
+            continue
+        # Assign only what differs, so unchanged lines stay out of the flush.
+        if ri.quantity != item["quantity"] or ri.unit != item["unit"]:
+            ri.quantity = item["quantity"]
+            ri.unit = item["unit"]
+            updated += 1
+    set_changed = bool(removed or added)
+    return set_changed or updated > 0, set_changed
 
 
 def update_recipe(
@@ -85,51 +593,117 @@ def update_recipe(
     title: Optional[str] = None,
     description: Optional[str] = None,
     ingredients_data: Optional[List[dict]] = None
-) -> Recipe:
+) -> Optional[Recipe]:
     """
     Update an existing Recipe instance and optionally replace its ingredients.
 
+    Only what actually differs is written: the ingredient list is diffed by
+    ingredient_id (see `_apply_ingredient_diff`), and when nothing changed
+    (an editor autosaving an unchanged draft) nothing is written at all.
+    Otherwise the recipe row gets a single UPDATE ... RETURNING version that
+    also recomputes `search_vector` when the text or the ingredient set
+    changed; the instance is kept in sync with what was written instead of
+    being refreshed.
+
     Args:
         db: Database session.
-        recipe: The Recipe to update (already loaded from DB).
+        recipe: The Recipe to update (already loaded from DB, with its author
+            and ingredients; see `get_recipe_for_update`).
         title: New title (optional).
         description: New description (optional).
         ingredients_data: New list of ingredients (optional).
 
     Returns:
-        The updated Recipe instance.
+        The updated Recipe instance, or None if it was deleted meanwhile.
+
+    Raises:
+        ConstraintViolation: If a new ingredient does not exist.
     """
-    if title is not None:
-        recipe.title = title
-    if description is not None:
-        recipe.description = description
+    values = {}
+    if title is not None and title != recipe.title:
+        values["title"] = title
+    if description is not None and description != recipe.description:
+        values["description"] = description
 
+    lines_changed = ingredient_set_changed = False
+    old_ingredient_ids = {ri.ingredient_id for ri in recipe.ingredients}
     if ingredients_data is not None:
-        recipe.ingredients.clear()
-        for item in ingredients_data:
-            ri = RecipeIngredient(
-                ingredient_id=item["ingredient_id"],
-                quantity=item["quantity"],
-                unit=item["unit"],
-            )
-            recipe.ingredients.append(ri)
+        lines_changed, ingredient_set_changed = _apply_ingredient_diff(recipe, ingredients_data)
 
-    db.add(recipe)
-    db.commit()
-    db.refresh(recipe)
+    if not (values or lines_changed):
+        return recipe
+
+    # SQL-side increment, so concurrent updates can't both write the same version
+    stmt = update(Recipe).where(Recipe.id == recipe.id).values(
+        **values,
+        version=Recipe.version + 1,
+        updated_at=func.now(),
+    )
+    # Quantities and units are not part of the search document.
+    if values or ingredient_set_changed:
+        # SET expressions see the old row: use the new text where it changed.
+        stmt = stmt.values(search_vector=_search_document(
+            values.get("title", Recipe.title),
+            values.get("description", Recipe.description),
+            _recipe_ingredient_names(),
+        ))
+
+    with raise_constraint_violations(db):
+        try:
+            db.flush()      # the ingredient lines, seen by the names subquery
+        except StaleDataError:   # the lines went with a concurrent delete
+            db.rollback()
+            return None
+        version = db.execute(
+            stmt.returning(Recipe.version),
+            execution_options={"synchronize_session": False},
+        ).scalar_one_or_none()
+        if version is None:
+            db.rollback()
+            return None
+        if ingredient_set_changed:
+            new_ingredient_ids = {ri.ingredient_id for ri in recipe.ingredients}
+            apply_recipe_count_deltas(db, ingredients={
+                **{i: 1 for i in new_ingredient_ids - old_ingredient_ids},
+                **{i: -1 for i in old_ingredient_ids - new_ingredient_ids},
+            })
+        db.commit()
+
+    for key, value in {**values, "version": version}.items():
+        set_committed_value(recipe, key, value)
     return recipe
 
 
-def delete_recipe(db: Session, recipe: Recipe) -> None:
+def delete_recipe(db: Session, recipe_id: int) -> Optional[List[int]]:
     """
-    Delete an existing Recipe from the database.
+    Delete a Recipe and its ingredient lines with two DELETEs, without loading it,
+    and take it off the recipe counters.
 
     Args:
         db: Database session.
-        recipe: The Recipe to delete.
+        recipe_id: Recipe's unique ID.
 
     Returns:
-        None
+        The IDs of the ingredients the recipe used, or None if it does not exist.
     """
-    db.delete(recipe)
+    ingredient_ids = db.scalars(
+        delete(RecipeIngredient)
+        .where(RecipeIngredient.recipe_id == recipe_id)
+        .returning(RecipeIngredient.ingredient_id),
+        execution_options={"synchronize_session": False},
+    ).all()
+    deleted = db.execute(
+        delete(Recipe).where(Recipe.id == recipe_id).returning(Recipe.author_id, Recipe.created_at),
+        execution_options={"synchronize_session": False},
+    ).first()
+    if deleted is None:
+        db.rollback()
+        return None
+    apply_recipe_count_deltas(
+        db,
+        authors={deleted.author_id: -1},
+        ingredients={ingredient_id: -1 for ingredient_id in ingredient_ids},
+        days={created_day(deleted.created_at): -1},
+    )
     db.commit()
+    return list(ingredient_ids)
@@ -0,0 +1,145 @@
+"""
+Repository layer for the recipe statistics.
+
+Recipe counts per author, per ingredient and per creation day live in
+small counter tables (app/domain/models/recipe_stats.py). The recipe write
+paths add their deltas with `apply_recipe_count_deltas` inside their own
+transaction, so a counter commits or rolls back together with the change
+it counts, and reads never aggregate `recipes` or `recipe_ingredients`.
+
+`rebuild_recipe_stats` recomputes every counter from the catalog, for data
+loaded without the repositories (migrations, scripts/generate_dataset.py).
+"""
+
+from datetime import date, datetime, timezone
+from typing import List, Mapping, Optional
+
+from sqlalchemy import Date, Row, cast, func, insert, select, text
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import Session
+
+from app.domain.models.author import Author
+from app.domain.models.ingredient import Ingredient
+from app.domain.models.recipe import Recipe
+from app.domain.models.recipe_ingredient import RecipeIngredient
+from app.domain.models.recipe_stats import AuthorRecipeCount, DailyRecipeCount, IngredientRecipeCount
+
+# Day a recipe counts for, computed the same way in SQL and in Python.
+_CREATED_DAY = cast(func.timezone("UTC", Recipe.created_at), Date)
+
+
+def created_day(created_at: Optional[datetime]) -> Optional[date]:
+    """UTC day of a recipe's `created_at` (None when it has none)."""
+    return created_at.astimezone(timezone.utc).date() if created_at is not None else None
+
+
+# ───────────────────────── WRITE ──────────────────────────
+def apply_recipe_count_deltas(
+    db: Session,
+    *,
+    authors: Optional[Mapping[int, int]] = None,
+    ingredients: Optional[Mapping[int, int]] = None,
+    days: Optional[Mapping[date, int]] = None,
+) -> None:
+    """
+    Add signed deltas to the recipe counters, in the caller's transaction.
+
+    One upsert per counter table. Tables and keys always go in the same
+    order, so concurrent writers lock shared counter rows (a popular
+    ingredient, today) in the same order and cannot deadlock each other.
+
+    Args:
+        db: Database session; the caller commits.
+        authors: ``{author_id: delta}``.
+        ingredients: ``{ingredient_id: delta}``.
+        days: ``{day: delta}``, UTC days from `created_day`.
+    """
+    for model, key, deltas in (
+        (IngredientRecipeCount, IngredientRecipeCount.ingredient_id, ingredients),
+        (AuthorRecipeCount, AuthorRecipeCount.author_id, authors),
+        (DailyRecipeCount, DailyRecipeCount.day, days),
+    ):
+        changes = sorted((k, delta) for k, delta in (deltas or {}).items() if k is not None and delta)
+        if not changes:
+            continue
+        stmt = pg_insert(model).values([{key.key: k, "recipe_count": delta} for k, delta in changes])
+        db.execute(stmt.on_conflict_do_update(
+            index_elements=[key],
+            set_={"recipe_count": model.recipe_count + stmt.excluded.recipe_count},
+        ))
+
+
+def rebuild_recipe_stats(db: Session) -> None:
+    """
+    Recompute every counter from `recipes` and `recipe_ingredients` (the caller commits).
+
+    TRUNCATE locks the counter tables until the commit: writers reaching
+    their counter update meanwhile wait, then add their delta on top of
+    the rebuilt values, so none is lost or counted twice.
+    """
+    db.execute(text(
+        f"TRUNCATE {AuthorRecipeCount.__tablename__}, "
+        f"{IngredientRecipeCount.__tablename__}, {DailyRecipeCount.__tablename__}"
+    ))
+    db.execute(insert(AuthorRecipeCount).from_select(
+        ["author_id", "recipe_count"],
+        select(Recipe.author_id, func.count()).group_by(Recipe.author_id),
+    ))
+    db.execute(insert(IngredientRecipeCount).from_select(
+        ["ingredient_id", "recipe_count"],
+        select(RecipeIngredient.ingredient_id, func.count()).group_by(RecipeIngredient.ingredient_id),
+    ))
+    db.execute(insert(DailyRecipeCount).from_select(
+        ["day", "recipe_count"],
+        select(_CREATED_DAY, func.count()).where(Recipe.created_at.is_not(None)).group_by(_CREATED_DAY),
+    ))
+
+
+# ───────────────────────── READ ───────────────────────────
+def get_author_recipe_count(db: Session, author_id: int) -> Optional[Row]:
+    """(author_id, name, recipe_count) of one author, or None if the author does not exist."""
+    return db.execute(
+        select(
+            Author.id.label("author_id"),
+            Author.name,
+            func.coalesce(AuthorRecipeCount.recipe_count, 0).label("recipe_count"),
+        )
+        .outerjoin(AuthorRecipeCount, AuthorRecipeCount.author_id == Author.id)
+        .where(Author.id == author_id)
+    ).first()
+
+
+def list_top_authors(db: Session, limit: int = 10) -> List[Row]:
+    """(author_id, name, recipe_count) of the authors with the most recipes."""
+    return db.execute(
+        select(AuthorRecipeCount.author_id, Author.name, AuthorRecipeCount.recipe_count)
+        .join(Author, Author.id == AuthorRecipeCount.author_id)
+        .where(AuthorRecipeCount.recipe_count > 0)
+        # Backward scan of ix_author_recipe_counts_top.
+        .order_by(AuthorRecipeCount.recipe_count.desc(), AuthorRecipeCount.author_id.desc())
+        .limit(limit)
+    ).all()
+
+
+def list_top_ingredients(db: Session, limit: int = 10) -> List[Row]:
+    """(ingredient_id, name, recipe_count) of the ingredients used by the most recipes."""
+    return db.execute(
+        select(IngredientRecipeCount.ingredient_id, Ingredient.name, IngredientRecipeCount.recipe_count)
+        .join(Ingredient, Ingredient.id == IngredientRecipeCount.ingredient_id)
+        .where(IngredientRecipeCount.recipe_count > 0)
+        # Backward scan of ix_ingredient_recipe_counts_top.
+        .order_by(IngredientRecipeCount.recipe_count.desc(), IngredientRecipeCount.ingredient_id.desc())
+        .limit(limit)
+    ).all()
+
+
+def list_daily_recipe_counts(db: Session, since: date, until: date) -> List[Row]:
+    """(day, recipe_count) of the days between `since` and `until` (inclusive) with recipes."""
+    return db.execute(
+        select(DailyRecipeCount.day, DailyRecipeCount.recipe_count)
+        .where(
+            DailyRecipeCount.day.between(since, until),
+            DailyRecipeCount.recipe_count > 0,
+        )
+        .order_by(DailyRecipeCount.day)
+    ).all()
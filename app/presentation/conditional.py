@@ -0,0 +1,27 @@
+"""
+Helpers for conditional GET requests (ETag / If-None-Match).
+"""
+
+from typing import Optional
+
+from fastapi import Response, status
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """
+    True if an If-None-Match header value matches `etag`.
+
+    Uses the weak comparison RFC 9110 prescribes for If-None-Match, so
+    ``W/"..."`` tags sent back by proxies still match.
+    """
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    candidates = (tag.strip() for tag in if_none_match.split(","))
+    return any(tag.removeprefix("W/") == etag for tag in candidates)
+
+
+def not_modified(etag: str) -> Response:
+    """An empty 304 response carrying the current ETag."""
+    return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
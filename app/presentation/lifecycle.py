@@ -0,0 +1,74 @@
+"""
+Process lifecycle: startup timings and graceful draining.
+
+Startup phases are recorded in `startup_seconds` and exported on
+`/metrics` (``app_startup_seconds``):
+
+* ``import`` – loading app.main (routers, engines, caches); recorded by
+  gunicorn.conf.py, once, in the master that preloads the app;
+* ``warmup`` – the lifespan's connection pool warm-up, per worker;
+* ``boot`` – from the worker's fork (or the process start without
+  gunicorn) until it accepts requests.
+
+Draining starts when a worker is asked to stop (SIGTERM, see
+app/presentation/worker.py). For `DRAIN_SECONDS` the worker keeps serving,
+but `/ready` answers 503 and `DrainingMiddleware` closes each connection
+after its response, so load balancers and keep-alive clients move to
+other instances before the worker stops accepting connections.
+"""
+
+import os
+import threading
+import time
+from typing import Dict
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+# Seconds a stopping worker keeps serving (with /ready failing) before it
+# stops accepting connections. Should cover the load balancer's probe period.
+DRAIN_SECONDS = float(os.getenv("DRAIN_SECONDS", "5"))
+
+# phase -> seconds
+startup_seconds: Dict[str, float] = {}
+
+# When this process (or gunicorn worker, see `worker_forked`) started booting.
+_boot_started = time.perf_counter()
+
+draining = threading.Event()
+
+
+def worker_forked() -> None:
+    """Restart the boot clock in a freshly forked worker."""
+    global _boot_started
+    _boot_started = time.perf_counter()
+    startup_seconds.pop("boot", None)
+    draining.clear()
+
+
+def record(phase: str, seconds: float) -> None:
+    startup_seconds[phase] = round(seconds, 4)
+
+
+def booted() -> float:
+    """Record and return the ``boot`` phase: the worker is about to accept requests."""
+    record("boot", time.perf_counter() - _boot_started)
+    return startup_seconds["boot"]
+
+
+class DrainingMiddleware:
+    """Pure ASGI middleware: ``Connection: close`` on every response while draining."""
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or not draining.is_set():
+            await self.app(scope, receive, send)
+            return
+
+        async def send_closing(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                message = {**message, "headers": [*message.get("headers", []), (b"connection", b"close")]}
+            await send(message)
+
+        await self.app(scope, receive, send_closing)
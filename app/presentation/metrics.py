@@ -0,0 +1,317 @@
+"""
+Prometheus metrics, rendered in the text exposition format at `/metrics`.
+
+Routers are created with ``route_class=InstrumentedRoute``; each route gets
+its own `RouteStats` when it is registered, so recording a request is a few
+attribute increments on an object the handler already holds: no registry
+lookup and no lock on the hot path. Like the cache counters, increments
+racing between threads may rarely be lost, which is fine for monitoring.
+
+Exposed families:
+
+* ``http_request_duration_seconds`` (histogram) and ``http_requests_in_flight``
+  (gauge) per method and route template;
+* ``http_request_errors_total`` per route and exception type: the domain
+  exception (``RecipeNotFoundError``...) behind an HTTPException, or the
+  exception itself;
+* ``db_pool_*`` for each engine: size, checked out, overflow, checkout
+  count, wait time and timeouts;
+* ``db_replica_healthy`` per read replica, when replicas are configured;
+* ``response_cache_*`` and ``singleflight_*`` counters;
+* ``app_startup_seconds`` per startup phase and ``app_draining``.
+
+Every sample carries a ``worker`` label, the process ID: each gunicorn
+worker counts only the requests it served, and a scrape reaches one
+worker at random. With `METRICS_DIR` set (gunicorn.conf.py does it when
+it starts several workers), each worker also publishes its samples there
+every `METRICS_PUBLISH_SECONDS`, and `/metrics` serves those of every
+live worker: one scrape sees the whole instance, the other workers'
+values up to that many seconds old. Sum over ``worker`` in queries; a
+restarted worker shows up as a new series.
+"""
+
+import asyncio
+import bisect
+import os
+import time
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+from fastapi import HTTPException, Request, Response
+from fastapi.routing import APIRoute
+
+from app.application.cache.response_cache import MemoryCacheBackend, response_cache
+from app.application.singleflight import singleflight_stats
+from app.persistence.db import ASYNC_DB, engine, replicas
+from app.presentation import lifecycle
+
+# Upper bounds (seconds) of the latency histogram buckets; +Inf is implicit.
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+# Directory shared by the workers of one instance (empty: this worker only).
+METRICS_DIR = os.getenv("METRICS_DIR", "")
+METRICS_PUBLISH_SECONDS = float(os.getenv("METRICS_PUBLISH_SECONDS", "5"))
+
+
+class RouteStats:
+    """Latency histogram, in-flight gauge and error counts of one route."""
+
+    __slots__ = ("method", "path", "in_flight", "bucket_counts", "total_seconds", "count", "errors")
+
+    def __init__(self, method: str, path: str) -> None:
+        self.method = method
+        self.path = path
+        self.in_flight = 0
+        self.bucket_counts = [0] * (len(LATENCY_BUCKETS) + 1)   # last one is +Inf
+        self.total_seconds = 0.0
+        self.count = 0
+        self.errors: Dict[str, int] = {}
+
+    def observe(self, seconds: float) -> None:
+        self.bucket_counts[bisect.bisect_left(LATENCY_BUCKETS, seconds)] += 1
+        self.total_seconds += seconds
+        self.count += 1
+
+    def error(self, exc: BaseException) -> None:
+        # Routes re-raise domain errors as HTTPException `from exc`; report the domain type.
+        cause = exc.__cause__ if isinstance(exc, HTTPException) and exc.__cause__ is not None else exc
+        name = type(cause).__name__
+        self.errors[name] = self.errors.get(name, 0) + 1
+
+
+# (method, path) -> stats. Written only while routes are registered at import time.
+_routes: Dict[Tuple[str, str], RouteStats] = {}
+
+
+def _route_stats(methods: Iterable[str], path: str) -> RouteStats:
+    # A router's routes are copied when included in the app; both copies share one RouteStats.
+    key = (",".join(sorted(methods)), path)
+    if key not in _routes:
+        _routes[key] = RouteStats(*key)
+    return _routes[key]
+
+
+class InstrumentedRoute(APIRoute):
+    """APIRoute that records latency, in-flight requests and errors of its handler."""
+
+    def get_route_handler(self) -> Callable:
+        handler = super().get_route_handler()
+        stats = _route_stats(self.methods, self.path)
+
+        async def instrumented_handler(request: Request) -> Response:
+            stats.in_flight += 1
+            started = time.perf_counter()
+            try:
+                return await handler(request)
+            except Exception as exc:
+                stats.error(exc)
+                raise
+            finally:
+                stats.observe(time.perf_counter() - started)
+                stats.in_flight -= 1
+
+        return instrumented_handler
+
+
+# ───────────────────────── exposition ──────────────────────────
+def _escape(value: object) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _labels(**labels: object) -> str:
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{name}="{_escape(value)}"' for name, value in labels.items()) + "}"
+
+
+class _Writer:
+    """Accumulates exposition lines, declaring each metric family once; `labels` go on every sample."""
+
+    def __init__(self, **labels: object) -> None:
+        self.lines: List[str] = []
+        self.labels = labels
+
+    def family(self, name: str, kind: str, help_text: str) -> None:
+        self.lines.append(f"# HELP {name} {help_text}")
+        self.lines.append(f"# TYPE {name} {kind}")
+
+    def sample(self, name: str, value: float, **labels: object) -> None:
+        self.lines.append(f"{name}{_labels(**labels, **self.labels)} {value}")
+
+    def text(self) -> str:
+        return "\n".join(self.lines) + "\n"
+
+
+def _write_routes(out: _Writer, routes: List[RouteStats]) -> None:
+    out.family("http_request_duration_seconds", "histogram", "Request handling time by route.")
+    for r in routes:
+        cumulative = 0
+        for bound, n in zip((*LATENCY_BUCKETS, "+Inf"), r.bucket_counts):
+            cumulative += n
+            out.sample("http_request_duration_seconds_bucket", cumulative, method=r.method, route=r.path, le=bound)
+        out.sample("http_request_duration_seconds_sum", r.total_seconds, method=r.method, route=r.path)
+        out.sample("http_request_duration_seconds_count", r.count, method=r.method, route=r.path)
+
+    out.family("http_requests_in_flight", "gauge", "Requests currently being handled by route.")
+    for r in routes:
+        out.sample("http_requests_in_flight", r.in_flight, method=r.method, route=r.path)
+
+    out.family("http_request_errors_total", "counter", "Requests that raised, by route and exception type.")
+    for r in routes:
+        for exception, n in list(r.errors.items()):
+            out.sample("http_request_errors_total", n, method=r.method, route=r.path, exception=exception)
+
+
+def _write_pools(out: _Writer) -> None:
+    engines = [("sync", engine)] + [(f"sync-replica:{r.name}", r.engine) for r in replicas.replicas]
+    replica_sets = [("sync", replicas)]
+    if ASYNC_DB:
+        from app.persistence.async_db import async_engine, async_replicas
+        engines.append(("async", async_engine.sync_engine))
+        engines += [(f"async-replica:{r.name}", r.engine.sync_engine) for r in async_replicas.replicas]
+        replica_sets.append(("async", async_replicas))
+
+    gauges = [
+        ("db_pool_size", "Configured pool size.", lambda p: p.size()),
+        ("db_pool_checked_out", "Connections currently checked out.", lambda p: p.checkedout()),
+        ("db_pool_overflow", "Connections open beyond pool_size (negative while the pool is filling).", lambda p: p.overflow()),
+        ("db_pool_checked_in", "Idle connections in the pool.", lambda p: p.checkedin()),
+    ]
+    for name, help_text, read in gauges:
+        out.family(name, "gauge", help_text)
+        for label, eng in engines:
+            if hasattr(eng.pool, "checkedout"):
+                out.sample(name, read(eng.pool), engine=label)
+
+    counters = [
+        ("db_pool_checkouts_total", "Connection checkouts.", "checkouts"),
+        ("db_pool_wait_seconds_total", "Time spent waiting for a connection.", "wait_seconds"),
+        ("db_pool_timeouts_total", "Checkouts that gave up after pool_timeout.", "timeouts"),
+    ]
+    for name, help_text, field in counters:
+        out.family(name, "counter", help_text)
+        for label, eng in engines:
+            wait_stats = getattr(eng.pool, "wait_stats", None)
+            if wait_stats is not None:
+                out.sample(name, getattr(wait_stats, field), engine=label)
+
+    if replicas:
+        out.family("db_replica_healthy", "gauge", "1 while a read replica serves reads, 0 while it is ejected.")
+        for label, replica_set in replica_sets:
+            for status in replica_set.status():
+                out.sample("db_replica_healthy", int(status["healthy"]), engine=label, replica=status["name"])
+
+
+def _write_caches(out: _Writer) -> None:
+    if response_cache.enabled:
+        for field, help_text in (
+            ("hits", "Response cache hits."),
+            ("misses", "Response cache misses."),
+            ("invalidations", "Entries dropped by write invalidations."),
+        ):
+            out.family(f"response_cache_{field}_total", "counter", help_text)
+            out.sample(f"response_cache_{field}_total", getattr(response_cache, field))
+        # Only the in-process backend knows its size cheaply (Redis would need a SCAN).
+        if isinstance(response_cache.backend, MemoryCacheBackend):
+            out.family("response_cache_evictions_total", "counter", "Entries evicted by the LRU bound.")
+            out.sample("response_cache_evictions_total", response_cache.backend.evictions)
+            out.family("response_cache_entries", "gauge", "Entries currently cached.")
+            out.sample("response_cache_entries", len(response_cache.backend))
+
+    groups = singleflight_stats()
+    for field, kind, help_text in (
+        ("leaders", "counter", "Loads run on behalf of a coalescing group."),
+        ("coalesced", "counter", "Requests that waited for another request's load."),
+        ("timeouts", "counter", "Waiters that gave up and loaded on their own."),
+        ("in_flight", "gauge", "Loads currently in flight."),
+    ):
+        name = f"singleflight_{field}_total" if kind == "counter" else f"singleflight_{field}"
+        out.family(name, kind, help_text)
+        for group, stats in groups.items():
+            out.sample(name, stats[field], group=group)
+
+
+def _write_process(out: _Writer) -> None:
+    out.family("app_startup_seconds", "gauge", "Duration of each startup phase (import, warmup, boot).")
+    for phase, seconds in list(lifecycle.startup_seconds.items()):
+        out.sample("app_startup_seconds", seconds, phase=phase)
+    out.family("app_draining", "gauge", "1 while this worker drains before stopping.")
+    out.sample("app_draining", int(lifecycle.draining.is_set()))
+
+
+def _render_worker() -> str:
+    out = _Writer(worker=os.getpid())   # read here: workers are forked after import
+    _write_routes(out, list(_routes.values()))
+    _write_pools(out)
+    _write_caches(out)
+    _write_process(out)
+    return out.text()
+
+
+def render_metrics() -> str:
+    """
+    Every metric of this process, in the Prometheus text format, followed
+    by those the other workers published in `METRICS_DIR`, if set.
+    """
+    text = _render_worker()
+    if not METRICS_DIR:
+        return text
+    publish_metrics(text)
+    texts = [text]
+    own = _snapshot_path(os.getpid())
+    for entry in os.scandir(METRICS_DIR):
+        if entry.name.endswith(".prom") and entry.path != own:
+            try:
+                with open(entry.path, encoding="utf-8") as f:
+                    texts.append(f.read())
+            except FileNotFoundError:   # the worker exited meanwhile
+                pass
+    return _merge(texts)
+
+
+def _merge(texts: Iterable[str]) -> str:
+    """Exposition texts of several workers as one, each family declared once with all its samples."""
+    families: Dict[str, List[str]] = {}
+    for text in texts:
+        lines: List[str] = []
+        header = False
+        for line in text.splitlines():
+            if line.startswith("# HELP "):
+                name = line.split(" ", 3)[2]
+                header = name not in families
+                lines = families.setdefault(name, [])
+                if header:
+                    lines.append(line)
+            elif line.startswith("# TYPE "):
+                if header:
+                    lines.append(line)
+            elif line:
+                lines.append(line)
+    return "\n".join(line for lines in families.values() for line in lines) + "\n"
+
+
+# ───────────────────────── multi-worker ──────────────────────────
+def _snapshot_path(pid: int) -> str:
+    return os.path.join(METRICS_DIR, f"{pid}.prom")
+
+
+def publish_metrics(text: Optional[str] = None) -> None:
+    """Write this worker's samples to `METRICS_DIR`, atomically, for the other workers' `/metrics`."""
+    path = _snapshot_path(os.getpid())
+    with open(path + ".tmp", "w", encoding="utf-8") as f:
+        f.write(_render_worker() if text is None else text)
+    os.replace(path + ".tmp", path)
+
+
+def unpublish_metrics(pid: Optional[int] = None) -> None:
+    """Remove the samples of a stopped worker (this one by default)."""
+    try:
+        os.remove(_snapshot_path(os.getpid() if pid is None else pid))
+    except FileNotFoundError:
+        pass
+
+
+async def publish_metrics_forever() -> None:
+    """Lifespan task: `publish_metrics` every `METRICS_PUBLISH_SECONDS` until cancelled."""
+    while True:
+        publish_metrics()
+        await asyncio.sleep(METRICS_PUBLISH_SECONDS)
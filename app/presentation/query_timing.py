@@ -0,0 +1,78 @@
+"""
+Per-request SQL timing: `Server-Timing` header and one structured log line.
+
+`QueryTimingMiddleware` gives every HTTP request a fresh `QueryStats`
+(filled by the engine events of app/persistence/query_stats.py) and
+
+* adds a ``Server-Timing`` header with the DB time, query count and
+  slowest statement known when the response starts (visible in the
+  browser's network panel);
+* logs one JSON line per request on the ``app.requests`` logger once the
+  body is sent, so the queries of streamed responses are counted too.
+
+A jump in `db_queries` for an endpoint is how N+1 regressions show up.
+"""
+
+import json
+import logging
+import time
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.persistence.query_stats import QueryStats, current_query_stats, shorten_sql
+
+logger = logging.getLogger("app.requests")
+
+
+def server_timing(stats: QueryStats, app_ms: float) -> str:
+    """`Server-Timing` header value, e.g. ``db;dur=3.1;desc="2 queries", db-slowest;dur=2.4, app;dur=5.0``."""
+    return (
+        f'db;dur={stats.total_ms:.1f};desc="{stats.count} queries", '
+        f"db-slowest;dur={stats.slowest_ms:.1f}, "
+        f"app;dur={app_ms:.1f}"
+    )
+
+
+class QueryTimingMiddleware:
+    """Pure ASGI middleware (no per-request task, unlike `BaseHTTPMiddleware`)."""
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        stats = QueryStats()
+        token = current_query_stats.set(stats)
+        started = time.perf_counter()
+        status = 500
+
+        async def send_with_timing(message: Message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+                app_ms = (time.perf_counter() - started) * 1000
+                headers = list(message.get("headers", []))
+                headers.append((b"server-timing", server_timing(stats, app_ms).encode()))
+                message = {**message, "headers": headers}
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            current_query_stats.reset(token)
+            if logger.isEnabledFor(logging.INFO):
+                endpoint = scope.get("endpoint")
+                logger.info(json.dumps({
+                    "method": scope["method"],
+                    "path": scope["path"],
+                    "endpoint": getattr(endpoint, "__name__", None),
+                    "status": status,
+                    "duration_ms": round((time.perf_counter() - started) * 1000, 2),
+                    "db_queries": stats.count,
+                    "db_ms": round(stats.total_ms, 2),
+                    "db_slowest_ms": round(stats.slowest_ms, 2),
+                    "db_slowest_sql": shorten_sql(stats.slowest_sql) if stats.slowest_sql else None,
+                }))
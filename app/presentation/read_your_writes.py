@@ -0,0 +1,76 @@
+"""
+Replica routing per request, with read-your-writes.
+
+`ReadYourWritesMiddleware` decides whether a request's DB session may use
+a read replica (the `read_from_replica` context variable `get_db` and
+`get_async_db` look at):
+
+* only GET and HEAD requests may;
+* a successful write (POST, PUT, PATCH or DELETE answered below 400) sets
+  a ``db_primary_until`` cookie `window_seconds` ahead. Until then that
+  client's reads stay on the primary, so it sees its own change even
+  while the replicas are still replaying it.
+
+The deadline travels with the client, so it holds whichever worker or
+host serves the next request. Clients that drop cookies simply read from
+the replicas right away.
+"""
+
+import time
+
+from starlette.requests import cookie_parser
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.persistence.replicas import read_from_replica
+
+COOKIE_NAME = "db_primary_until"
+READ_METHODS = {"GET", "HEAD"}
+WRITE_METHODS = {"POST", "PUT", "PATCH", "DELETE"}
+
+
+def _primary_until(scope: Scope) -> float:
+    """The client's read-your-writes deadline (Unix time), 0 when it has none."""
+    for name, value in scope.get("headers", ()):
+        if name == b"cookie":
+            try:
+                return float(cookie_parser(value.decode("latin-1")).get(COOKIE_NAME, 0))
+            except ValueError:
+                return 0.0
+    return 0.0
+
+
+class ReadYourWritesMiddleware:
+    """Pure ASGI middleware, like `QueryTimingMiddleware`."""
+
+    def __init__(self, app: ASGIApp, *, window_seconds: float) -> None:
+        self.app = app
+        self.window_seconds = window_seconds
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"]
+        if method in READ_METHODS:
+            token = read_from_replica.set(_primary_until(scope) <= time.time())
+            try:
+                await self.app(scope, receive, send)
+            finally:
+                read_from_replica.reset(token)
+            return
+
+        if method not in WRITE_METHODS or self.window_seconds <= 0:
+            await self.app(scope, receive, send)
+            return
+
+        async def send_with_deadline(message: Message) -> None:
+            if message["type"] == "http.response.start" and message["status"] < 400:
+                cookie = (
+                    f"{COOKIE_NAME}={time.time() + self.window_seconds:.3f}; "
+                    f"Max-Age={int(self.window_seconds) or 1}; Path=/; HttpOnly; SameSite=Lax"
+                )
+                message = {**message, "headers": [*message.get("headers", []), (b"set-cookie", cookie.encode())]}
+            await send(message)
+
+        await self.app(scope, receive, send_with_deadline)
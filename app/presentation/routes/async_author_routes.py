@@ -0,0 +1,231 @@
+"""
+Async HTTP routes for the Author entity.
+
+Same endpoints as the sync router, served as `async def` on an AsyncSession.
+Mounted instead of the sync router when ASYNC_DB is enabled.
+
+Exposes RESTful endpoints to create, read, update and delete authors.
+"""
+
+from typing import List, Optional, Union
+
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Response, status
+from fastapi.responses import StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.application.services.async_author_service import (
+    create_authors_service,
+    bulk_create_authors_service,
+    get_author_service,
+    list_authors_service,
+    list_authors_etag_service,
+    get_author_etag_service,
+    update_author_service,
+    delete_author_service,
+)
+from app.application.exceptions.author_exceptions import (
+    AuthorAlreadyExistsError,
+    AuthorNotFoundError,
+)
+from app.application.exceptions.pagination_exceptions import InvalidCursorError
+from app.application.pagination import next_id_cursor
+from app.domain.schemas.author import (
+    AuthorBulkResult,
+    AuthorConflictPolicy,
+    AuthorCreate,
+    AuthorResponse,
+    AuthorUpdate,
+)
+from app.persistence.async_db import get_async_db
+from app.application.services.author_service import export_authors_service
+from app.application.etags import entity_etag, page_etag, version_key
+from app.presentation.conditional import etag_matches, not_modified
+from app.presentation.streaming import ndjson_export
+from app.presentation.metrics import InstrumentedRoute
+
+router = APIRouter(prefix="/authors", tags=["Authors"], route_class=InstrumentedRoute)
+
+# ─────────────────────────────── CREATE ──────────────────────────────
+@router.post(
+    "/",
+    response_model=List[AuthorResponse], 
+    status_code=status.HTTP_201_CREATED,
+    summary="Create one or many authors",
+)
+async def create_author(
+    author_in: Union[AuthorCreate, List[AuthorCreate]],
+    db: AsyncSession = Depends(get_async_db)
+):
+    """
+    Create a new author with a unique email.
+    Returns 409 Conflict if that email already exists.
+    Accepts a single AuthorCreate or a list of AuthorCreate objects.
+    Returns a list of created authors.
+    """
+    # Reject empty list explicitly
+    if isinstance(author_in, list) and not author_in:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Payload list cannot be empty.",
+        )
+    
+    # This normalize the payload income. Author_items is always a list.... with one or several elements. The create_author_service fn is waiting for a list.
+    # Other option would be configure everything to send in the payload always a LIST... for one or several Authors.. but it is an option.
+    author_items = author_in if isinstance(author_in, list) else [author_in]
+
+    try:
+        return await create_authors_service(db, author_items)
+    except AuthorAlreadyExistsError as exc:
+        raise HTTPException(status_code=409, detail=str(exc)) from exc
+
+
+@router.post(
+    "/bulk",
+    response_model=AuthorBulkResult,
+    status_code=status.HTTP_200_OK,
+    summary="Bulk create authors with a per-item report",
+)
+async def bulk_create_authors(
+    author_items: List[AuthorCreate],
+    on_conflict: AuthorConflictPolicy = AuthorConflictPolicy.error,
+    db: AsyncSession = Depends(get_async_db),
+):
+    """
+    Insert large batches of authors in a few multi-row statements.
+
+    `on_conflict` decides what happens to emails that already exist:
+    **error** rejects the whole payload with 409, **skip** leaves the existing
+    author untouched and **update** overwrites its name.
+    The response reports the outcome of every payload item.
+    """
+    try:
+        return await bulk_create_authors_service(db, author_items, on_conflict=on_conflict)
+    except AuthorAlreadyExistsError as exc:
+        raise HTTPException(status_code=409, detail=str(exc)) from exc
+
+
+# ─────────────────────────────── EXPORT ──────────────────────────────
+@router.get(
+    "/export",
+    response_class=StreamingResponse,
+    summary="Export all authors as NDJSON",
+)
+async def export_authors(
+    batch_size: int = Query(1000, gt=0, le=10000, description="Rows fetched per round trip"),
+):
+    """
+    Stream every author as NDJSON (one `AuthorResponse` per line), in ID order.
+
+    Rows are read with a server-side cursor and encoded batch by batch, so
+    the response starts immediately and memory use does not grow with the
+    table size.
+    The export reads through its own sync session and server-side cursor,
+    iterated in the thread pool, in both persistence modes.
+    """
+    return ndjson_export(export_authors_service, batch_size=batch_size)
+
+
+# ─────────────────────────────── READ ONE ────────────────────────────
+@router.get(
+    "/{author_id}",
+    response_model=AuthorResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Get an author by ID",
+)
+async def read_author(
+    author_id: int,
+    response: Response,
+    if_none_match: Optional[str] = Header(None),
+    db: AsyncSession = Depends(get_async_db),
+):
+    """
+    Retrieve a single author by primary key.
+    Returns 404 if the author does not exist, and 304 if `If-None-Match`
+    matches its current ETag.
+    """
+    try:
+        if if_none_match is not None:
+            etag = await get_author_etag_service(db, author_id)
+            if etag_matches(if_none_match, etag):
+                return not_modified(etag)
+        author = await get_author_service(db, author_id)
+    except AuthorNotFoundError as exc:
+        raise HTTPException(status_code=404, detail=str(exc)) from exc
+
+    response.headers["ETag"] = entity_etag("author", version_key(author))
+    return author
+
+
+# ─────────────────────────────── READ LIST ───────────────────────────
+@router.get(
+    "/",
+    response_model=List[AuthorResponse],
+    status_code=status.HTTP_200_OK,
+    summary="List authors (paginated)",
+)
+async def list_authors(
+    response: Response,
+    skip: int = 0,
+    limit: int = 100,
+    after: Optional[str] = None,
+    if_none_match: Optional[str] = Header(None),
+    db: AsyncSession = Depends(get_async_db),
+):
+    """
+    Return a paginated list of authors.
+
+    Pass the `X-Next-Cursor` response header back as `after` to fetch the
+    next page by keyset instead of `skip`. The header is absent on the last page.
+    Responds 304 when `If-None-Match` matches the page's current ETag.
+    """
+    try:
+        if if_none_match is not None:
+            etag = await list_authors_etag_service(db, skip=skip, limit=limit, after=after)
+            if etag_matches(if_none_match, etag):
+                return not_modified(etag)
+        authors = await list_authors_service(db, skip=skip, limit=limit, after=after)
+    except InvalidCursorError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
+
+    response.headers["ETag"] = page_etag("authors", limit, map(version_key, authors))
+
+    next_cursor = next_id_cursor(authors, limit)
+    if next_cursor is not None:
+        response.headers["X-Next-Cursor"] = next_cursor
+    return authors
+
+
+# ─────────────────────────────── DELETE ──────────────────────────────
+@router.delete(
+    "/{author_id}",
+    status_code=status.HTTP_204_NO_CONTENT,
+    summary="Delete an author",
+)
+async def delete_author(author_id: int, db: AsyncSession = Depends(get_async_db)):
+    """
+    Delete an author by ID. Returns 204 No Content on success.
+    """
+    try:
+        await delete_author_service(db, author_id)
+    except AuthorNotFoundError as exc:
+        raise HTTPException(status_code=404, detail=str(exc)) from exc
+
+
+# ─────────────────────────────── UPDATE ──────────────────────────────
+@router.put("/{author_id}", response_model=AuthorResponse, status_code=200)
+async def update_author(
+    author_id: int,
+    author_in: AuthorUpdate,
+    db: AsyncSession = Depends(get_async_db),
+):
+    try:
+        return await update_author_service(
+            db,
+            author_id,
+            name=author_in.name,
+            email=author_in.email,
+        )
+    except AuthorAlreadyExistsError as exc:
+        raise HTTPException(status_code=409, detail=str(exc)) from exc
+    except AuthorNotFoundError as exc:
+        raise HTTPException(status_code=404, detail=str(exc)) from exc
@@ -4,15 +4,20 @@ HTTP routes for the Author entity.
 Exposes RESTful endpoints to create, read, update and delete authors.
 """
 
-from typing import List, Union
+from typing import List, Optional, Union
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Response, status
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
 
 from app.application.services.author_service import (
+    export_authors_service,
     create_authors_service,
+    bulk_create_authors_service,
     get_author_service,
     list_authors_service,
+    list_authors_etag_service,
+    get_author_etag_service,
     update_author_service,
     delete_author_service,
 )
@@ -20,10 +25,22 @@ from app.application.exceptions.author_exceptions import (
     AuthorAlreadyExistsError,
     AuthorNotFoundError,
 )
-from app.domain.schemas.author import AuthorCreate, AuthorResponse, AuthorUpdate
+from app.application.exceptions.pagination_exceptions import InvalidCursorError
+from app.application.pagination import next_id_cursor
+from app.domain.schemas.author import (
+    AuthorBulkResult,
+    AuthorConflictPolicy,
+    AuthorCreate,
+    AuthorResponse,
+    AuthorUpdate,
+)
 from app.persistence.db import get_db
+from app.application.etags import entity_etag, page_etag, version_key
+from app.presentation.conditional import etag_matches, not_modified
+from app.presentation.streaming import ndjson_export
+from app.presentation.metrics import InstrumentedRoute
 
-router = APIRouter(prefix="/authors", tags=["Authors"])
+router = APIRouter(prefix="/authors", tags=["Authors"], route_class=InstrumentedRoute)
 
 # ─────────────────────────────── CREATE ──────────────────────────────
 @router.post(
@@ -59,6 +76,50 @@ def create_author(
         raise HTTPException(status_code=409, detail=str(exc)) from exc
 
 
+@router.post(
+    "/bulk",
+    response_model=AuthorBulkResult,
+    status_code=status.HTTP_200_OK,
+    summary="Bulk create authors with a per-item report",
+)
+def bulk_create_authors(
+    author_items: List[AuthorCreate],
+    on_conflict: AuthorConflictPolicy = AuthorConflictPolicy.error,
+    db: Session = Depends(get_db),
+):
+    """
+    Insert large batches of authors in a few multi-row statements.
+
+    `on_conflict` decides what happens to emails that already exist:
+    **error** rejects the whole payload with 409, **skip** leaves the existing
+    author untouched and **update** overwrites its name.
+    The response reports the outcome of every payload item.
+    """
+    try:
+        return bulk_create_authors_service(db, author_items, on_conflict=on_conflict)
+    except AuthorAlreadyExistsError as exc:
+        raise HTTPException(status_code=409, detail=str(exc)) from exc
+
+
+# ─────────────────────────────── EXPORT ──────────────────────────────
+@router.get(
+    "/export",
+    response_class=StreamingResponse,
+    summary="Export all authors as NDJSON",
+)
+def export_authors(
+    batch_size: int = Query(1000, gt=0, le=10000, description="Rows fetched per round trip"),
+):
+    """
+    Stream every author as NDJSON (one `AuthorResponse` per line), in ID order.
+
+    Rows are read with a server-side cursor and encoded batch by batch, so
+    the response starts immediately and memory use does not grow with the
+    table size.
+    """
+    return ndjson_export(export_authors_service, batch_size=batch_size)
+
+
 # ─────────────────────────────── READ ONE ────────────────────────────
 @router.get(
     "/{author_id}",
@@ -66,16 +127,29 @@ def create_author(
     status_code=status.HTTP_200_OK,
     summary="Get an author by ID",
 )
-def read_author(author_id: int, db: Session = Depends(get_db)):
+def read_author(
+    author_id: int,
+    response: Response,
+    if_none_match: Optional[str] = Header(None),
+    db: Session = Depends(get_db),
+):
     """
     Retrieve a single author by primary key.
-    Returns 404 if the author does not exist.
+    Returns 404 if the author does not exist, and 304 if `If-None-Match`
+    matches its current ETag.
     """
     try:
-        return get_author_service(db, author_id)
+        if if_none_match is not None:
+            etag = get_author_etag_service(db, author_id)
+            if etag_matches(if_none_match, etag):
+                return not_modified(etag)
+        author = get_author_service(db, author_id)
     except AuthorNotFoundError as exc:
         raise HTTPException(status_code=404, detail=str(exc)) from exc
 
+    response.headers["ETag"] = entity_etag("author", version_key(author))
+    return author
+
 
 # ─────────────────────────────── READ LIST ───────────────────────────
 @router.get(
@@ -85,14 +159,35 @@ def read_author(author_id: int, db: Session = Depends(get_db)):
     summary="List authors (paginated)",
 )
 def list_authors(
+    response: Response,
     skip: int = 0,
     limit: int = 100,
+    after: Optional[str] = None,
+    if_none_match: Optional[str] = Header(None),
     db: Session = Depends(get_db),
 ):
     """
     Return a paginated list of authors.
+
+    Pass the `X-Next-Cursor` response header back as `after` to fetch the
+    next page by keyset instead of `skip`. The header is absent on the last page.
+    Responds 304 when `If-None-Match` matches the page's current ETag.
     """
-    return list_authors_service(db, skip=skip, limit=limit)
+    try:
+        if if_none_match is not None:
+            etag = list_authors_etag_service(db, skip=skip, limit=limit, after=after)
+            if etag_matches(if_none_match, etag):
+                return not_modified(etag)
+        authors = list_authors_service(db, skip=skip, limit=limit, after=after)
+    except InvalidCursorError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
+
+    response.headers["ETag"] = page_etag("authors", limit, map(version_key, authors))
+
+    next_cursor = next_id_cursor(authors, limit)
+    if next_cursor is not None:
+        response.headers["X-Next-Cursor"] = next_cursor
+    return authors
 
 
 # ─────────────────────────────── DELETE ──────────────────────────────
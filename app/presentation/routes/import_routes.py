@@ -0,0 +1,68 @@
+"""
+HTTP routes for bulk NDJSON imports.
+
+Exposes one streaming endpoint per entity type (authors, ingredients, recipes).
+"""
+
+from typing import AsyncIterator
+
+from fastapi import APIRouter, Depends, Query, Request
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy.orm import Session
+
+from app.persistence.db import get_db
+from app.domain.schemas.data_import import ImportEntity, ImportResult
+from app.application.services.import_service import NdjsonImporter
+from app.presentation.metrics import InstrumentedRoute
+
+router = APIRouter(prefix="/import", tags=["Import"], route_class=InstrumentedRoute)
+
+
+async def _iter_lines(request: Request) -> AsyncIterator[bytes]:
+    """Split the request body into lines as it arrives, without buffering it whole."""
+    pending = b""
+    async for chunk in request.stream():
+        pending += chunk
+        *lines, pending = pending.split(b"\n")
+        for line in lines:
+            yield line
+    if pending:
+        yield pending
+
+
+# ───────────── IMPORT ─────────────
+@router.post(
+    "/{entity}",
+    response_model=ImportResult,
+    summary="Stream an NDJSON file of authors, ingredients or recipes",
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {"application/x-ndjson": {"schema": {"type": "string"}}},
+        }
+    },
+)
+async def import_ndjson(
+    entity: ImportEntity,
+    request: Request,
+    chunk_size: int = Query(1000, gt=0, le=10000, description="Rows written per batch"),
+    db: Session = Depends(get_db),
+):
+    """
+    Import one JSON object per line from the request body.
+
+    * **authors** – `{"name": ..., "email": ...}`; existing emails are skipped
+    * **ingredients** – `{"name": ...}`; existing names are skipped
+    * **recipes** – like `POST /recipes`, but the author may be given as
+      `author_email` and each ingredient as `ingredient_name`
+
+    Lines are validated as they are received and written in batches of
+    `chunk_size`; each batch is committed on its own. Invalid lines are
+    skipped and reported in the response.
+    """
+    importer = NdjsonImporter(db, entity, chunk_size=chunk_size)
+    async for line in _iter_lines(request):
+        if importer.add_line(line):
+            await run_in_threadpool(importer.flush)
+    await run_in_threadpool(importer.flush)
+    return importer.result()
@@ -4,18 +4,26 @@ HTTP routes for the Ingredient entity.
 Exposes REST-style endpoints to create, read, and delete ingredients.
 """
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from typing import Optional
+
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Response, status
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
 
 from app.persistence.db import get_db
 from app.domain.schemas.ingredient import (
     IngredientCreate,
     IngredientResponse,
+    IngredientSuggestion,
 )
 from app.application.services.ingredient_service import (
+    export_ingredients_service,
     create_ingredient_service,
     get_ingredient_service,
     list_ingredients_service,
+    list_ingredients_etag_service,
+    get_ingredient_etag_service,
+    suggest_ingredients_service,
     delete_ingredient_service,
 )
 from app.application.exceptions.ingredient_exceptions import (
@@ -23,8 +31,14 @@ from app.application.exceptions.ingredient_exceptions import (
     IngredientNotFoundError,
     IngredientInUseError,
 )
+from app.application.exceptions.pagination_exceptions import InvalidCursorError
+from app.application.pagination import next_id_cursor
+from app.application.etags import entity_etag, page_etag, version_key
+from app.presentation.conditional import etag_matches, not_modified
+from app.presentation.streaming import ndjson_export
+from app.presentation.metrics import InstrumentedRoute
 
-router = APIRouter(prefix="/ingredients", tags=["Ingredients"])
+router = APIRouter(prefix="/ingredients", tags=["Ingredients"], route_class=InstrumentedRoute)
 
 # ───────────── CREATE ─────────────
 @router.post(
@@ -50,11 +64,68 @@ def create_ingredient(
     summary="List ingredients (paginated)",
 )
 def list_ingredients(
+    response: Response,
     skip: int = 0,
     limit: int = 100,
+    after: Optional[str] = None,
+    if_none_match: Optional[str] = Header(None),
     db: Session = Depends(get_db),
 ):
-    return list_ingredients_service(db, skip=skip, limit=limit)
+    try:
+        if if_none_match is not None:
+            etag = list_ingredients_etag_service(db, skip=skip, limit=limit, after=after)
+            if etag_matches(if_none_match, etag):
+                return not_modified(etag)
+        ingredients = list_ingredients_service(db, skip=skip, limit=limit, after=after)
+    except InvalidCursorError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
+
+    response.headers["ETag"] = page_etag("ingredients", limit, map(version_key, ingredients))
+
+    next_cursor = next_id_cursor(ingredients, limit)
+    if next_cursor is not None:
+        response.headers["X-Next-Cursor"] = next_cursor
+    return ingredients
+
+
+# ───────────── SUGGEST ────────────
+@router.get(
+    "/suggest",
+    response_model=list[IngredientSuggestion],
+    summary="Ingredient name suggestions for typeahead",
+)
+def suggest_ingredients(
+    prefix: str = Query(..., min_length=1, max_length=100, description="What the user typed so far"),
+    limit: int = Query(10, gt=0, le=50, description="Maximum number of suggestions"),
+    fuzzy: bool = Query(False, description="Complete a short list with trigram matches"),
+    db: Session = Depends(get_db),
+):
+    """
+    Return up to `limit` ingredients whose name (or one of its words) starts
+    with `prefix`, case-insensitively, served from memory. When none does
+    (or, with `fuzzy=true`, when there are fewer than `limit`), typo-tolerant
+    trigram matches (`match: "fuzzy"`) are added for prefixes of 3+ characters.
+    """
+    return suggest_ingredients_service(db, prefix, limit=limit, fuzzy=fuzzy)
+
+
+# ───────────── EXPORT ────────────
+@router.get(
+    "/export",
+    response_class=StreamingResponse,
+    summary="Export all ingredients as NDJSON",
+)
+def export_ingredients(
+    batch_size: int = Query(1000, gt=0, le=10000, description="Rows fetched per round trip"),
+):
+    """
+    Stream every ingredient as NDJSON (one `IngredientResponse` per line), in ID order.
+
+    Rows are read with a server-side cursor and encoded batch by batch, so
+    the response starts immediately and memory use does not grow with the
+    table size.
+    """
+    return ndjson_export(export_ingredients_service, batch_size=batch_size)
 
 
 # ───────────── READ ──────────────
@@ -65,13 +136,22 @@ def list_ingredients(
 )
 def get_ingredient(
     ingredient_id: int,
+    response: Response,
+    if_none_match: Optional[str] = Header(None),
     db: Session = Depends(get_db),
 ):
     try:
-        return get_ingredient_service(db, ingredient_id)
+        if if_none_match is not None:
+            etag = get_ingredient_etag_service(db, ingredient_id)
+            if etag_matches(if_none_match, etag):
+                return not_modified(etag)
+        ingredient = get_ingredient_service(db, ingredient_id)
     except IngredientNotFoundError as exc:
         raise HTTPException(status_code=404, detail=str(exc)) from exc
 
+    response.headers["ETag"] = entity_etag("ingredient", version_key(ingredient))
+    return ingredient
+
 
 # ───────────── DELETE ────────────
 @router.delete(
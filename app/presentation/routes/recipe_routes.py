@@ -4,9 +4,10 @@ HTTP routes for the Recipe entity.
 Exposes REST-style endpoints to create, read, update and delete recipes.
 """
 
-from typing import List
+from typing import List, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Response, status
+from fastapi.responses import ORJSONResponse, StreamingResponse
 from sqlalchemy.orm import Session
 
 from app.persistence.db import get_db
@@ -15,12 +16,23 @@ from app.domain.schemas.recipe import (
     RecipeCreate,
     RecipeUpdate,
     RecipeResponse,
+    RecipePantryMatch,
+    RecipeSearchHit,
+    ShoppingListRequest,
+    ShoppingListResponse,
 )
 
 from app.application.services.recipe_service import (
+    export_recipes_service,
     create_recipe_service,
     get_recipe_service,
     list_recipes_service,
+    list_recipes_etag_service,
+    get_recipe_etag_service,
+    search_recipes_service,
+    find_recipes_by_ingredients_service,
+    pantry_recipes_service,
+    shopping_list_service,
     update_recipe_service,
     delete_recipe_service,
 )
@@ -28,8 +40,14 @@ from app.application.services.recipe_service import (
 from app.application.exceptions.author_exceptions import AuthorNotFoundError
 from app.application.exceptions.recipe_exceptions import RecipeNotFoundError
 from app.application.exceptions.ingredient_exceptions import IngredientNotFoundError
+from app.application.exceptions.pagination_exceptions import InvalidCursorError
+from app.application.pagination import encode_cursor, next_id_cursor, next_rank_cursor
+from app.application.etags import entity_etag, page_etag, version_key
+from app.presentation.conditional import etag_matches, not_modified
+from app.presentation.streaming import ndjson_export
+from app.presentation.metrics import InstrumentedRoute
 
-router = APIRouter(prefix="/recipes", tags=["Recipes"])
+router = APIRouter(prefix="/recipes", tags=["Recipes"], route_class=InstrumentedRoute)
 
 # ─────────────────────────────── CREATE ──────────────────────────────
 @router.post(
@@ -70,10 +88,181 @@ def create_recipe(
 def list_recipes(
     skip: int = Query(0, ge=0, description="Records to skip"),
     limit: int = Query(100, gt=0, le=500, description="Page size"),
+    after: Optional[str] = Query(None, description="Cursor from the X-Next-Cursor header"),
+    if_none_match: Optional[str] = Header(None),
     db: Session = Depends(get_db),
 ):
-    """Return a paginated list of recipes."""
-    return list_recipes_service(db, skip=skip, limit=limit)
+    """
+    Return a paginated list of recipes.
+
+    * **304** – `If-None-Match` matches the page's current ETag
+    * **400** – `after` is not a valid cursor
+    """
+    try:
+        if if_none_match is not None:
+            etag = list_recipes_etag_service(db, skip=skip, limit=limit, after=after)
+            if etag_matches(if_none_match, etag):
+                return not_modified(etag)
+        recipes = list_recipes_service(db, skip=skip, limit=limit, after=after)
+    except InvalidCursorError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
+
+    headers = {"ETag": page_etag("recipes", limit, map(version_key, recipes))}
+    next_cursor = next_id_cursor(recipes, limit)
+    if next_cursor is not None:
+        headers["X-Next-Cursor"] = next_cursor
+    # The page is already plain dicts in RecipeResponse's shape: encode it
+    # with orjson as is, skipping response_model's validate-and-serialize pass.
+    return ORJSONResponse(recipes, headers=headers)
+
+
+# ─────────────────────────────── SEARCH ──────────────────────────────
+@router.get(
+    "/search",
+    response_model=List[RecipeSearchHit],
+    status_code=status.HTTP_200_OK,
+    summary="Full-text search over recipes",
+)
+def search_recipes(
+    response: Response,
+    q: str = Query(..., min_length=1, max_length=200, description="Search terms (web search syntax)"),
+    limit: int = Query(20, gt=0, le=100, description="Page size"),
+    after: Optional[str] = Query(None, description="Cursor from the X-Next-Cursor header"),
+    db: Session = Depends(get_db),
+):
+    """
+    Search titles, descriptions and ingredient names, best matches first.
+
+    `q` accepts `"quoted phrases"`, `or` and `-excluded` terms. Each hit
+    carries its `rank` and `highlights` with the matched terms in `<mark>`.
+
+    * **400** – `after` is not a valid cursor
+    """
+    try:
+        hits = search_recipes_service(db, q, limit=limit, after=after)
+    except InvalidCursorError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
+
+    next_cursor = next_rank_cursor(hits, limit)
+    if next_cursor is not None:
+        response.headers["X-Next-Cursor"] = next_cursor
+    return hits
+
+
+# ─────────────────────────── BY INGREDIENTS ──────────────────────────
+@router.get(
+    "/by-ingredients",
+    response_model=List[RecipeResponse],
+    status_code=status.HTTP_200_OK,
+    summary="Filter recipes by the ingredients they use",
+)
+def find_recipes_by_ingredients(
+    response: Response,
+    all_of: List[int] = Query([], alias="all", description="Ingredient IDs the recipe must all use"),
+    any_of: List[int] = Query([], alias="any", description="Ingredient IDs the recipe must use at least one of"),
+    none_of: List[int] = Query([], alias="none", description="Ingredient IDs the recipe must not use"),
+    limit: int = Query(100, gt=0, le=500, description="Page size"),
+    after: Optional[str] = Query(None, description="Cursor from the X-Next-Cursor header"),
+    db: Session = Depends(get_db),
+):
+    """
+    Return recipes matching an ingredient filter, in ID order, e.g.
+    `?all=1&all=2&none=3` for "eggs and flour but no milk".
+
+    * **400** – `after` is not a valid cursor
+    """
+    try:
+        recipes = find_recipes_by_ingredients_service(
+            db, all_of=all_of, any_of=any_of, none_of=none_of, limit=limit, after=after
+        )
+    except InvalidCursorError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
+
+    next_cursor = next_id_cursor(recipes, limit)
+    if next_cursor is not None:
+        response.headers["X-Next-Cursor"] = next_cursor
+    return recipes
+
+
+@router.get(
+    "/by-ingredients/pantry",
+    response_model=List[RecipePantryMatch],
+    status_code=status.HTTP_200_OK,
+    summary="Recipes you can cook with what is in your pantry",
+)
+def pantry_recipes(
+    response: Response,
+    have: List[int] = Query(..., description="Ingredient IDs available in the pantry"),
+    max_missing: int = Query(3, ge=0, le=20, description="Leave out recipes missing more ingredients"),
+    limit: int = Query(20, gt=0, le=100, description="Page size"),
+    after: Optional[str] = Query(None, description="Cursor from the X-Next-Cursor header"),
+    db: Session = Depends(get_db),
+):
+    """
+    Return recipes using at least one pantry ingredient, fewest missing
+    ingredients first; each one lists the IDs it is still missing.
+
+    * **400** – `after` is not a valid cursor
+    """
+    try:
+        matches = pantry_recipes_service(
+            db, have, max_missing=max_missing, limit=limit, after=after
+        )
+    except InvalidCursorError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
+
+    if matches and len(matches) == limit:
+        last = matches[-1]
+        response.headers["X-Next-Cursor"] = encode_cursor({"missing": last.missing_count, "id": last.id})
+    return matches
+
+
+# ─────────────────────────────── SHOPPING LIST ───────────────────────
+@router.post(
+    "/shopping-list",
+    response_model=ShoppingListResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Total ingredient quantities of a meal plan",
+)
+def shopping_list(
+    plan: ShoppingListRequest,
+    db: Session = Depends(get_db),
+):
+    """
+    Sum the ingredients of the given recipes, each scaled by its
+    multiplier, into one line per ingredient. Quantities are converted to
+    g, ml or pcs where the unit is known (kg, l, tbsp...); other units are
+    totalled as written.
+
+    * **404** – A recipe of the plan does not exist
+    """
+    try:
+        return shopping_list_service(
+            db,
+            [entry.recipe_id for entry in plan.recipes],
+            [entry.multiplier for entry in plan.recipes],
+        )
+    except RecipeNotFoundError as exc:
+        raise HTTPException(status_code=404, detail=str(exc)) from exc
+
+
+# ─────────────────────────────── EXPORT ──────────────────────────────
+@router.get(
+    "/export",
+    response_class=StreamingResponse,
+    summary="Export all recipes as NDJSON",
+)
+def export_recipes(
+    batch_size: int = Query(1000, gt=0, le=10000, description="Rows fetched per round trip"),
+):
+    """
+    Stream every recipe as NDJSON (one `RecipeResponse` per line), in ID order.
+
+    Rows are read with a server-side cursor and encoded batch by batch, so
+    the response starts immediately and memory use does not grow with the
+    table size.
+    """
+    return ndjson_export(export_recipes_service, batch_size=batch_size)
 
 
 # ─────────────────────────────── RETRIEVE ────────────────────────────
@@ -83,17 +272,30 @@ def list_recipes(
     status_code=status.HTTP_200_OK,
     summary="Get recipe by ID",
 )
-def get_recipe(recipe_id: int, db: Session = Depends(get_db)):
+def get_recipe(
+    recipe_id: int,
+    response: Response,
+    if_none_match: Optional[str] = Header(None),
+    db: Session = Depends(get_db),
+):
     """
     Fetch a single recipe.
- 
+
+    * **304** – `If-None-Match` matches the current ETag
     * **404** – Recipe not found
     """
     try:
-        return get_recipe_service(db, recipe_id)
+        if if_none_match is not None:
+            etag = get_recipe_etag_service(db, recipe_id)
+            if etag_matches(if_none_match, etag):
+                return not_modified(etag)
+        recipe = get_recipe_service(db, recipe_id)
     except RecipeNotFoundError as exc:
         raise HTTPException(status_code=404, detail=str(exc)) from exc
 
+    response.headers["ETag"] = entity_etag("recipe", version_key(recipe))
+    return recipe
+
 
 # ─────────────────────────────── UPDATE ──────────────────────────────
 @router.put(
@@ -0,0 +1,89 @@
+"""
+HTTP routes for catalog statistics.
+
+Exposes dashboard counters: recipes per author, ingredient popularity and
+recipes created per day. Served from incrementally maintained counter
+tables, never from aggregates over the catalog.
+"""
+
+from datetime import date
+from typing import List, Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlalchemy.orm import Session
+
+from app.persistence.db import get_db
+from app.domain.schemas.stats import AuthorRecipeCount, DailyRecipeCount, IngredientUsage
+from app.application.services.stats_service import (
+    author_recipe_count_service,
+    top_authors_service,
+    top_ingredients_service,
+    recipes_per_day_service,
+)
+from app.application.exceptions.author_exceptions import AuthorNotFoundError
+from app.presentation.metrics import InstrumentedRoute
+
+router = APIRouter(prefix="/stats", tags=["Stats"], route_class=InstrumentedRoute)
+
+
+# ─────────────────────────────── AUTHORS ─────────────────────────────
+@router.get(
+    "/authors",
+    response_model=List[AuthorRecipeCount],
+    status_code=status.HTTP_200_OK,
+    summary="Authors with the most recipes",
+)
+def top_authors(
+    limit: int = Query(10, gt=0, le=1000, description="Number of authors"),
+    db: Session = Depends(get_db),
+):
+    return top_authors_service(db, limit)
+
+
+@router.get(
+    "/authors/{author_id}",
+    response_model=AuthorRecipeCount,
+    status_code=status.HTTP_200_OK,
+    summary="Number of recipes of an author",
+)
+def author_recipe_count(author_id: int, db: Session = Depends(get_db)):
+    """
+    * **404** – Author not found
+    """
+    try:
+        return author_recipe_count_service(db, author_id)
+    except AuthorNotFoundError as exc:
+        raise HTTPException(status_code=404, detail=str(exc)) from exc
+
+
+# ─────────────────────────────── INGREDIENTS ─────────────────────────
+@router.get(
+    "/ingredients",
+    response_model=List[IngredientUsage],
+    status_code=status.HTTP_200_OK,
+    summary="Most used ingredients",
+)
+def top_ingredients(
+    limit: int = Query(10, gt=0, le=1000, description="Number of ingredients"),
+    db: Session = Depends(get_db),
+):
+    return top_ingredients_service(db, limit)
+
+
+# ─────────────────────────────── RECIPES ─────────────────────────────
+@router.get(
+    "/recipes-per-day",
+    response_model=List[DailyRecipeCount],
+    status_code=status.HTTP_200_OK,
+    summary="Recipes created per day",
+)
+def recipes_per_day(
+    since: Optional[date] = Query(None, description="First day (UTC); default: 30 days before `until`"),
+    until: Optional[date] = Query(None, description="Last day (UTC), inclusive; default: today"),
+    db: Session = Depends(get_db),
+):
+    """
+    Existing recipes by creation day, oldest first; days without recipes
+    are left out.
+    """
+    return recipes_per_day_service(db, since, until)
@@ -1,11 +1,77 @@
+import asyncio
+import os
+
 from fastapi import APIRouter
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import JSONResponse, PlainTextResponse
+
+from app.application.cache.response_cache import response_cache
+from app.application.singleflight import singleflight_stats
+from app.persistence.db import ASYNC_DB, engine, ping_db, pool_status, replicas
+from app.presentation import lifecycle
+from app.presentation.metrics import InstrumentedRoute, render_metrics
+
+# /ready fails once this share of the pool's capacity is checked out (1 = exhausted).
+READY_MAX_SATURATION = float(os.getenv("READY_MAX_SATURATION", "1"))
+# ...or when `SELECT 1` takes longer than this many seconds.
+READY_TIMEOUT = float(os.getenv("READY_TIMEOUT", "2"))
 
-router = APIRouter()
+router = APIRouter(route_class=InstrumentedRoute)
 
 @router.get("/health", tags=["System"])
 def healthcheck():
     return {"status": "ok"}
 
+@router.get("/ready", tags=["System"])
+async def readiness():
+    """
+    Readiness probe: DB round trip and pool saturation of this worker.
+
+    Answers 503 when the pool is saturated (without queueing for a
+    connection), the ping times out or the database is unreachable, so the
+    load balancer stops routing to this worker until it recovers. A worker
+    that is draining before it stops answers 503 as well.
+    Read replicas are listed with their health but do not affect the
+    status: reads fall back to the primary when none is healthy.
+    """
+    if ASYNC_DB:
+        from app.persistence.async_db import async_engine, async_replicas, ping_async_db
+        pool, ping, replica_set = async_engine.sync_engine.pool, ping_async_db, async_replicas
+    else:
+        pool, ping, replica_set = engine.pool, lambda: run_in_threadpool(ping_db), replicas
+
+    body = {"status": "ready", "pool": pool_status(pool), "db_latency_ms": None}
+    if replica_set:
+        body["replicas"] = replica_set.status()
+    if lifecycle.draining.is_set():
+        body["status"] = "draining"
+    elif body["pool"]["saturation"] >= READY_MAX_SATURATION:
+        body["status"] = "pool saturated"
+    else:
+        try:
+            body["db_latency_ms"] = round(await asyncio.wait_for(ping(), READY_TIMEOUT), 2)
+        except asyncio.TimeoutError:
+            body["status"] = "database timeout"
+        except Exception as exc:   # pylint: disable=broad-except
+            body["status"] = f"database error: {type(exc).__name__}"
+
+    return JSONResponse(body, status_code=200 if body["status"] == "ready" else 503)
+
 @router.get("/version", tags=["System"])
 def version():
     return {"version": "0.1.0"}
+
+@router.get("/cache/stats", tags=["System"])
+def cache_stats():
+    """Response cache counters of this process (hits, misses, invalidations...)."""
+    return response_cache.stats()
+
+@router.get("/coalescing/stats", tags=["System"])
+def coalescing_stats():
+    """Request coalescing counters of this process, per group (leaders, coalesced waiters, timeouts)."""
+    return singleflight_stats()
+
+@router.get("/metrics", tags=["System"], response_class=PlainTextResponse)
+def metrics():
+    """Prometheus metrics of this worker, and of the other workers with METRICS_DIR (text exposition format)."""
+    return PlainTextResponse(render_metrics(), media_type="text/plain; version=0.0.4; charset=utf-8")
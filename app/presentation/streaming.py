@@ -0,0 +1,40 @@
+"""
+Helpers for streaming large responses.
+
+`ndjson_export` turns a service generator of batches into an NDJSON
+StreamingResponse. The generator gets its own DB session: FastAPI closes
+the request's `get_db` session before a streaming body is sent, and the
+export must keep its server-side cursor open until the last batch.
+"""
+
+from typing import Callable, Iterator, List
+
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel
+from sqlalchemy.orm import Session
+
+from app.persistence.db import new_session
+
+
+def ndjson_export(
+    export: Callable[..., Iterator[List[BaseModel]]],
+    *,
+    batch_size: int,
+) -> StreamingResponse:
+    """
+    Stream `export(db, batch_size=...)` as NDJSON, one line per item.
+
+    Each batch is encoded as soon as it is fetched and sent as one chunk,
+    so the first bytes go out right away and memory holds a single batch.
+    The sync generator is iterated in Starlette's thread pool; its session
+    is bound like the request's would be (a replica for GET requests).
+    """
+    def body() -> Iterator[bytes]:
+        db: Session = new_session()
+        try:
+            for batch in export(db, batch_size=batch_size):
+                yield b"".join(item.model_dump_json().encode() + b"\n" for item in batch)
+        finally:
+            db.close()
+
+    return StreamingResponse(body(), media_type="application/x-ndjson")
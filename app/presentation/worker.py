@@ -0,0 +1,75 @@
+"""
+Gunicorn worker class for production: uvicorn's, with graceful draining.
+
+Used through gunicorn.conf.py (``worker_class``). On SIGTERM (sent by
+gunicorn to every worker on shutdown, rolling restarts and ``HUP``
+reloads) a worker:
+
+1. keeps serving for `DRAIN_SECONDS` while draining (see
+   app/presentation/lifecycle.py: /ready fails, connections are closed
+   after their response);
+2. stops accepting connections and waits for the in-flight requests, up to
+   gunicorn's ``graceful_timeout`` minus the drain and a margin;
+3. runs the lifespan shutdown, which closes its connection pools.
+
+A second SIGTERM, SIGINT or SIGQUIT skips the drain. Gunicorn kills
+workers still running after ``graceful_timeout``.
+"""
+
+import signal
+import sys
+import time
+from types import FrameType
+from typing import Optional
+
+from gunicorn.arbiter import Arbiter
+from uvicorn.server import Server
+from uvicorn.workers import UvicornWorker
+
+from app.presentation import lifecycle
+
+# Seconds of graceful_timeout kept for the lifespan shutdown (closing pools).
+SHUTDOWN_MARGIN = 2.0
+
+
+class DrainingServer(Server):
+    """uvicorn `Server` that delays the exit requested by SIGTERM by `drain_seconds`."""
+
+    def __init__(self, config, drain_seconds: float) -> None:
+        super().__init__(config)
+        self.drain_seconds = drain_seconds
+        self._exit_at: Optional[float] = None
+        self._exit_signal = signal.SIGTERM
+
+    def handle_exit(self, sig: int, frame: Optional[FrameType]) -> None:
+        if sig != signal.SIGTERM or self.drain_seconds <= 0 or self._exit_at is not None:
+            super().handle_exit(sig, frame)
+            return
+        lifecycle.draining.set()
+        self._exit_signal = sig
+        self._exit_at = time.monotonic() + self.drain_seconds
+
+    async def on_tick(self, counter: int) -> bool:
+        # Called every 0.1 s by uvicorn's main loop; True ends it.
+        if self._exit_at is not None and not self.should_exit and time.monotonic() >= self._exit_at:
+            super().handle_exit(self._exit_signal, None)
+        return await super().on_tick(counter)
+
+
+class DrainingUvicornWorker(UvicornWorker):
+    """`UvicornWorker` serving through `DrainingServer`, with a bounded request drain."""
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.config.timeout_graceful_shutdown = max(
+            self.cfg.graceful_timeout - lifecycle.DRAIN_SECONDS - SHUTDOWN_MARGIN, 1
+        )
+
+    async def _serve(self) -> None:
+        # Same as UvicornWorker._serve, with our Server subclass.
+        self.config.app = self.wsgi
+        server = DrainingServer(config=self.config, drain_seconds=lifecycle.DRAIN_SECONDS)
+        self._install_sigquit_handler()
+        await server.serve(sockets=self.sockets)
+        if not server.started:
+            sys.exit(Arbiter.WORKER_BOOT_ERROR)
@@ -0,0 +1,113 @@
+# gunicorn.conf.py
+"""
+Production server: gunicorn managing uvicorn workers.
+
+    gunicorn -c gunicorn.conf.py app.main:app
+
+* One worker per CPU core available to the process (`WEB_CONCURRENCY`
+  overrides it). The count is exported as WEB_CONCURRENCY before the app
+  is loaded, so app/persistence/db.py shares DB_MAX_CONNECTIONS between
+  the actual workers.
+* The app is imported once in the master (``preload_app``) and the workers
+  are forked from it: imports are paid once, not per worker. Each worker
+  still builds and warms its own connection pools in the lifespan.
+* Workers drain on shutdown (app/presentation/worker.py); `GRACEFUL_TIMEOUT`
+  bounds the drain, after which gunicorn kills them.
+* The in-memory ingredient indexes (app/application/indexes/) are per
+  worker and only see the writes their own worker handled; other workers
+  catch up when they rebuild. With several workers the rebuild interval
+  defaults to `MULTI_WORKER_INDEX_MAX_AGE` seconds instead of 300.
+* Metrics are counted per worker. With several workers, unless
+  `METRICS_DIR` is set, they publish them to a temporary directory so
+  that `/metrics`, whichever worker answers, reports all of them
+  (app/presentation/metrics.py).
+"""
+
+import os
+import shutil
+import tempfile
+import time
+
+_config_loaded = time.perf_counter()
+
+
+def _cpu_count() -> int:
+    # Cores this process may run on (cpusets / taskset), not all of the host's.
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:
+        return os.cpu_count() or 1
+
+
+bind = os.getenv("BIND", "0.0.0.0:8000")
+workers = int(os.getenv("WEB_CONCURRENCY", str(_cpu_count())))
+os.environ["WEB_CONCURRENCY"] = str(workers)
+worker_class = "app.presentation.worker.DrainingUvicornWorker"
+preload_app = True
+
+# Index rebuild interval (seconds) with several workers, unless set: bounds
+# how long a worker misses the ingredient changes made through the others.
+MULTI_WORKER_INDEX_MAX_AGE = "60"
+if workers > 1:
+    os.environ.setdefault("INGREDIENT_INDEX_MAX_AGE", MULTI_WORKER_INDEX_MAX_AGE)
+    os.environ.setdefault("INGREDIENT_SUGGEST_MAX_AGE", MULTI_WORKER_INDEX_MAX_AGE)
+
+# Where the workers publish their metrics to each other. Created here, it is
+# removed on exit; the environment keeps it across config reloads (HUP).
+if workers > 1 and not os.getenv("METRICS_DIR"):
+    os.environ["METRICS_DIR"] = tempfile.mkdtemp(prefix="recipes-metrics-")
+    os.environ["METRICS_DIR_TEMPORARY"] = "1"
+
+# Seconds a stopping worker gets to drain (DRAIN_SECONDS of failing /ready,
+# then its in-flight requests) before it is killed.
+graceful_timeout = int(os.getenv("GRACEFUL_TIMEOUT", "30"))
+# A worker silent for this long (blocked event loop) is killed and replaced.
+timeout = int(os.getenv("WORKER_TIMEOUT", "60"))
+# Idle keep-alive seconds; should exceed the load balancer's idle timeout.
+keepalive = int(os.getenv("KEEPALIVE", "5"))
+
+accesslog = None        # app.requests already logs one line per request
+loglevel = os.getenv("LOG_LEVEL", "INFO").lower()
+
+
+def on_starting(server) -> None:
+    # Runs once the master has preloaded the app.
+    from app.presentation import lifecycle
+
+    lifecycle.record("import", time.perf_counter() - _config_loaded)
+    server.log.info(
+        "App preloaded in %.2f s; starting %d workers (%s)",
+        lifecycle.startup_seconds["import"], workers, worker_class,
+    )
+    if workers > 1 and os.getenv("RESPONSE_CACHE_BACKEND", "memory").lower() == "memory":
+        server.log.warning(
+            "RESPONSE_CACHE_BACKEND=memory with %d workers: each worker only sees its own "
+            "invalidations, so reads may be stale for up to RESPONSE_CACHE_TTL. Use redis.",
+            workers,
+        )
+    if workers > 1:
+        server.log.warning(
+            "%d workers: the ingredient indexes (/recipes/by-ingredients, /ingredients/suggest) "
+            "are per worker and miss writes handled by the others for up to "
+            "INGREDIENT_INDEX_MAX_AGE=%s / INGREDIENT_SUGGEST_MAX_AGE=%s seconds.",
+            workers, os.environ["INGREDIENT_INDEX_MAX_AGE"], os.environ["INGREDIENT_SUGGEST_MAX_AGE"],
+        )
+
+
+def post_fork(server, worker) -> None:
+    from app.presentation import lifecycle
+
+    lifecycle.worker_forked()
+
+
+def child_exit(server, worker) -> None:
+    # A worker that crashed could not remove its metrics: drop them here.
+    if os.getenv("METRICS_DIR"):
+        from app.presentation import metrics
+
+        metrics.unpublish_metrics(worker.pid)
+
+
+def on_exit(server) -> None:
+    if os.getenv("METRICS_DIR_TEMPORARY"):
+        shutil.rmtree(os.environ["METRICS_DIR"], ignore_errors=True)
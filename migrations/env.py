@@ -0,0 +1,54 @@
+"""
+Alembic environment: runs migrations against DATABASE_URL.
+
+    alembic upgrade head                    # apply pending revisions
+    alembic revision --autogenerate -m ...  # draft a revision from the models
+
+Revisions that build indexes on populated tables use
+``CREATE INDEX CONCURRENTLY`` inside ``op.get_context().autocommit_block()``,
+so they do not block writes while the index is built.
+"""
+
+from logging.config import fileConfig
+
+from alembic import context
+from sqlalchemy import create_engine, pool
+
+from app.persistence.db import DATABASE_URL, Base
+
+# Import all models so they are registered on Base.metadata
+import app.domain.models  # noqa: F401  # pylint: disable=unused-import
+
+config = context.config
+# scripts/init_db.py runs migrations with its own logging setup already in place.
+if config.config_file_name is not None and config.attributes.get("configure_logger", True):
+    fileConfig(config.config_file_name, disable_existing_loggers=False)
+
+target_metadata = Base.metadata
+
+
+def run_migrations_offline() -> None:
+    """Emit the SQL to stdout (``alembic upgrade head --sql``) instead of running it."""
+    context.configure(
+        url=DATABASE_URL,
+        target_metadata=target_metadata,
+        literal_binds=True,
+        dialect_opts={"paramstyle": "named"},
+    )
+    with context.begin_transaction():
+        context.run_migrations()
+
+
+def run_migrations_online() -> None:
+    # A throwaway engine: the app's pool settings and query instrumentation don't apply here.
+    connectable = create_engine(DATABASE_URL, poolclass=pool.NullPool)
+    with connectable.connect() as connection:
+        context.configure(connection=connection, target_metadata=target_metadata)
+        with context.begin_transaction():
+            context.run_migrations()
+
+
+if context.is_offline_mode():
+    run_migrations_offline()
+else:
+    run_migrations_online()
@@ -0,0 +1,161 @@
+"""Initial schema, catch-up columns and production indexes
+
+Databases created before migrations existed were built with
+``Base.metadata.create_all`` at some earlier version of the models, which
+never altered existing tables. This revision brings any of them (or an empty
+database) to the current schema, idempotently:
+
+* creates the four tables if they are missing;
+* adds the columns introduced since: ``version`` / ``updated_at`` on authors,
+  ingredients and recipes, and ``recipes.search_vector`` (backfilled in
+  batches);
+* installs ``pg_trgm``;
+* builds every secondary index with ``CREATE INDEX CONCURRENTLY``, so it can
+  run against a live database: the full-text GIN and trigram GiST indexes and
+  the previously missing ``recipes.author_id``, ``recipes.created_at`` and
+  ``recipe_ingredients.ingredient_id``. A concurrent build that failed
+  leaves an INVALID index behind; it is dropped and rebuilt.
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-17
+"""
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects.postgresql import TSVECTOR
+
+revision = "0001"
+down_revision = None
+branch_labels = None
+depends_on = None
+
+# Recipes per search_vector backfill statement (each one commits on its own).
+BACKFILL_BATCH = 10_000
+
+# name -> (table, index definition)
+INDEXES = {
+    "ix_recipes_search_vector": ("recipes", "USING gin (search_vector)"),
+    "ix_ingredients_name_trgm": ("ingredients", "USING gist (name gist_trgm_ops)"),
+    "ix_recipes_author_id": ("recipes", "(author_id)"),
+    "ix_recipes_created_at": ("recipes", "(created_at)"),
+    "ix_recipe_ingredients_ingredient_id": ("recipe_ingredients", "(ingredient_id)"),
+}
+NEW_INDEXES = ("ix_recipes_author_id", "ix_recipes_created_at", "ix_recipe_ingredients_ingredient_id")
+
+
+def _versioned_columns():
+    return [
+        sa.Column("version", sa.Integer(), server_default="1", nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), server_default=sa.func.now()),
+    ]
+
+
+def _create_missing_tables() -> None:
+    existing = set(sa.inspect(op.get_bind()).get_table_names())
+    if "authors" not in existing:
+        op.create_table(
+            "authors",
+            sa.Column("id", sa.Integer(), primary_key=True),
+            sa.Column("name", sa.String(), nullable=False),
+            sa.Column("email", sa.String(), nullable=False, unique=True),
+            *_versioned_columns(),
+        )
+        op.create_index("ix_authors_id", "authors", ["id"])
+    if "ingredients" not in existing:
+        op.create_table(
+            "ingredients",
+            sa.Column("id", sa.Integer(), primary_key=True),
+            sa.Column("name", sa.String(), nullable=False, unique=True),
+            *_versioned_columns(),
+        )
+        op.create_index("ix_ingredients_id", "ingredients", ["id"])
+    if "recipes" not in existing:
+        op.create_table(
+            "recipes",
+            sa.Column("id", sa.Integer(), primary_key=True),
+            sa.Column("title", sa.String(), nullable=False),
+            sa.Column("description", sa.String()),
+            sa.Column("author_id", sa.Integer(), sa.ForeignKey("authors.id"), nullable=False),
+            sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now()),
+            *_versioned_columns(),
+            sa.Column("search_vector", TSVECTOR()),
+        )
+        op.create_index("ix_recipes_id", "recipes", ["id"])
+    if "recipe_ingredients" not in existing:
+        op.create_table(
+            "recipe_ingredients",
+            sa.Column("recipe_id", sa.Integer(), sa.ForeignKey("recipes.id"), primary_key=True),
+            sa.Column("ingredient_id", sa.Integer(), sa.ForeignKey("ingredients.id"), primary_key=True),
+            sa.Column("quantity", sa.Float(), nullable=False),
+            sa.Column("unit", sa.String(), nullable=False),
+        )
+
+
+def _add_missing_columns() -> None:
+    # ADD COLUMN with a constant or now() default does not rewrite the table (PostgreSQL 11+).
+    for table in ("authors", "ingredients", "recipes"):
+        op.execute(
+            f"ALTER TABLE {table} "
+            "ADD COLUMN IF NOT EXISTS version integer NOT NULL DEFAULT 1, "
+            "ADD COLUMN IF NOT EXISTS updated_at timestamptz DEFAULT now()"
+        )
+    op.execute("ALTER TABLE recipes ADD COLUMN IF NOT EXISTS search_vector tsvector")
+
+
+def _backfill_search_vectors() -> None:
+    """Same document as recipe_repository.refresh_search_vectors, in committed ID batches."""
+    bind = op.get_bind()
+    max_id = bind.execute(sa.text("SELECT MAX(id) FROM recipes WHERE search_vector IS NULL")).scalar()
+    if max_id is None:
+        return
+    statement = sa.text(
+        """
+        UPDATE recipes r SET search_vector =
+            setweight(to_tsvector('english'::regconfig, coalesce(r.title, '')), 'A')
+            || setweight(to_tsvector('english'::regconfig, coalesce(r.description, '')), 'B')
+            || setweight(to_tsvector('english'::regconfig, coalesce((
+                SELECT string_agg(i.name, ' ')
+                FROM recipe_ingredients ri JOIN ingredients i ON i.id = ri.ingredient_id
+                WHERE ri.recipe_id = r.id
+            ), '')), 'C')
+        WHERE r.search_vector IS NULL AND r.id >= :first AND r.id < :stop
+        """
+    )
+    for first in range(0, max_id + 1, BACKFILL_BATCH):
+        with op.get_context().autocommit_block():
+            bind.execute(statement, {"first": first, "stop": first + BACKFILL_BATCH})
+
+
+def _create_index_concurrently(name: str, table: str, definition: str) -> None:
+    bind = op.get_bind()
+    invalid = bind.execute(
+        sa.text(
+            "SELECT 1 FROM pg_index JOIN pg_class c ON c.oid = pg_index.indexrelid "
+            "WHERE c.relname = :name AND NOT pg_index.indisvalid"
+        ),
+        {"name": name},
+    ).scalar()
+    if invalid:
+        op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {name}")
+    op.execute(f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {name} ON {table} {definition}")
+
+
+def upgrade() -> None:
+    _create_missing_tables()
+    _add_missing_columns()
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+
+    # CONCURRENTLY cannot run inside a transaction block.
+    _backfill_search_vectors()
+    with op.get_context().autocommit_block():
+        for name, (table, definition) in INDEXES.items():
+            _create_index_concurrently(name, table, definition)
+
+
+def downgrade() -> None:
+    # Only the indexes this revision introduced; the tables and columns are
+    # what the application needs to run at all.
+    with op.get_context().autocommit_block():
+        for name in NEW_INDEXES:
+            op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {name}")
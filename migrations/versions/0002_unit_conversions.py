@@ -0,0 +1,55 @@
+"""Unit conversion table for shopping lists
+
+Creates ``unit_conversions`` (unit spelling -> base unit and factor) and
+loads the default spellings of grams, millilitres and pieces, so
+``POST /recipes/shopping-list`` can add up quantities written in g and kg,
+ml and l, tbsp... The rows are a snapshot of
+``app.domain.models.unit_conversion.DEFAULT_CONVERSIONS``.
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-17
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0002"
+down_revision = "0001"
+branch_labels = None
+depends_on = None
+
+# (base unit, factor, spellings)
+CONVERSIONS = [
+    ("g", 1, ("g", "gr", "gram", "grams", "gramme", "grammes")),
+    ("g", 1000, ("kg", "kilo", "kilos", "kilogram", "kilograms")),
+    ("g", 0.001, ("mg", "milligram", "milligrams")),
+    ("ml", 1, ("ml", "milliliter", "milliliters", "millilitre", "millilitres")),
+    ("ml", 10, ("cl", "centiliter", "centiliters", "centilitre", "centilitres")),
+    ("ml", 100, ("dl", "deciliter", "deciliters", "decilitre", "decilitres")),
+    ("ml", 1000, ("l", "liter", "liters", "litre", "litres")),
+    ("ml", 15, ("tbsp", "tablespoon", "tablespoons")),
+    ("ml", 5, ("tsp", "teaspoon", "teaspoons")),
+    ("pcs", 1, ("pcs", "pc", "piece", "pieces", "unit", "units")),
+]
+
+
+def upgrade() -> None:
+    table = op.create_table(
+        "unit_conversions",
+        sa.Column("unit", sa.String(), primary_key=True),
+        sa.Column("base_unit", sa.String(), nullable=False),
+        sa.Column("factor", sa.Float(), nullable=False),
+    )
+    op.bulk_insert(
+        table,
+        [
+            {"unit": spelling, "base_unit": base_unit, "factor": factor}
+            for base_unit, factor, spellings in CONVERSIONS
+            for spelling in spellings
+        ],
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("unit_conversions")
@@ -0,0 +1,69 @@
+"""Recipe statistics counter tables
+
+Creates the counters behind the /stats endpoints, which the recipe write
+paths keep up to date:
+
+* ``author_recipe_counts`` – recipes per author;
+* ``ingredient_recipe_counts`` – recipes per ingredient;
+* ``daily_recipe_counts`` – recipes per creation day (UTC).
+
+They are filled once here from the current catalog. Recipes written by
+API processes still running the previous release while this runs are not
+counted; run ``python -m scripts.rebuild_stats`` after the rollout.
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-17
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0003"
+down_revision = "0002"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "author_recipe_counts",
+        sa.Column("author_id", sa.Integer(), sa.ForeignKey("authors.id", ondelete="CASCADE"), primary_key=True),
+        sa.Column("recipe_count", sa.Integer(), server_default="0", nullable=False),
+    )
+    op.create_index("ix_author_recipe_counts_top", "author_recipe_counts", ["recipe_count", "author_id"])
+    op.create_table(
+        "ingredient_recipe_counts",
+        sa.Column(
+            "ingredient_id", sa.Integer(), sa.ForeignKey("ingredients.id", ondelete="CASCADE"), primary_key=True
+        ),
+        sa.Column("recipe_count", sa.Integer(), server_default="0", nullable=False),
+    )
+    op.create_index(
+        "ix_ingredient_recipe_counts_top", "ingredient_recipe_counts", ["recipe_count", "ingredient_id"]
+    )
+    op.create_table(
+        "daily_recipe_counts",
+        sa.Column("day", sa.Date(), primary_key=True),
+        sa.Column("recipe_count", sa.Integer(), server_default="0", nullable=False),
+    )
+
+    op.execute(
+        "INSERT INTO author_recipe_counts (author_id, recipe_count) "
+        "SELECT author_id, count(*) FROM recipes GROUP BY author_id"
+    )
+    op.execute(
+        "INSERT INTO ingredient_recipe_counts (ingredient_id, recipe_count) "
+        "SELECT ingredient_id, count(*) FROM recipe_ingredients GROUP BY ingredient_id"
+    )
+    op.execute(
+        "INSERT INTO daily_recipe_counts (day, recipe_count) "
+        "SELECT (created_at AT TIME ZONE 'UTC')::date, count(*) FROM recipes "
+        "WHERE created_at IS NOT NULL GROUP BY 1"
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("daily_recipe_counts")
+    op.drop_table("ingredient_recipe_counts")
+    op.drop_table("author_recipe_counts")
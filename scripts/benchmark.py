@@ -0,0 +1,143 @@
+"""
+Compare request throughput between the sync and the async (ASYNC_DB) stacks.
+
+Start one API instance per mode, e.g.
+
+    uvicorn app.main:app --port 8000
+    ASYNC_DB=true uvicorn app.main:app --port 8001
+
+and fire the same read workload at both with a fixed number of concurrent
+clients:
+
+    python -m scripts.benchmark \
+        --target sync=http://localhost:8000 \
+        --target async=http://localhost:8001 \
+        --path "/recipes/?limit=50" --concurrency 200 --requests 5000
+"""
+
+import argparse
+import asyncio
+import logging
+import statistics
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import httpx
+
+# ───────────────────────────────────────────
+# Configure basic logging to the console
+# ───────────────────────────────────────────
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s [%(levelname)s] %(message)s",
+)
+logger = logging.getLogger(__name__)
+logging.getLogger("httpx").setLevel(logging.WARNING)   # one INFO line per request otherwise
+
+
+# (method, path, extra httpx.request kwargs such as params/json/headers)
+Request = Tuple[str, str, Dict[str, Any]]
+
+
+def summarize(latencies: List[float], errors: int, elapsed: float) -> Dict[str, float]:
+    """Throughput (req/s), error count and latency percentiles (ms) of one run."""
+    # statistics.quantiles needs two samples; a single (e.g. export) request is its own percentile.
+    quantiles = statistics.quantiles(latencies, n=100) if len(latencies) > 1 else latencies * 99
+    return {
+        "requests": len(latencies),
+        "errors": errors,
+        "throughput_rps": len(latencies) / elapsed if elapsed else 0.0,
+        "p50_ms": quantiles[49],
+        "p95_ms": quantiles[94],
+        "p99_ms": quantiles[98],
+    }
+
+
+async def run_requests(
+    base_url: str,
+    make_request: Callable[[int], Request],
+    *,
+    concurrency: int,
+    total_requests: int,
+    on_response: Optional[Callable[[int, Any], None]] = None,
+) -> Dict[str, float]:
+    """
+    Send requests 0..`total_requests`-1, built by `make_request(i)`, from
+    `concurrency` workers sharing keep-alive connections.
+
+    Bodies are streamed and discarded, so large exports do not pile up in
+    memory, unless `on_response(i, json_body)` wants the decoded body of
+    successful responses (e.g. to collect created IDs).
+
+    Returns:
+        See `summarize`.
+    """
+    latencies: List[float] = []
+    errors = 0
+    next_index = 0
+
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+    async with httpx.AsyncClient(base_url=base_url, limits=limits, timeout=600) as client:
+
+        async def worker() -> None:
+            nonlocal next_index, errors
+            while next_index < total_requests:
+                i = next_index
+                next_index += 1
+                method, path, kwargs = make_request(i)
+                start = time.perf_counter()
+                try:
+                    async with client.stream(method, path, **kwargs) as response:
+                        if response.status_code >= 400:
+                            errors += 1
+                            await response.aread()
+                        elif on_response is not None:
+                            await response.aread()
+                            on_response(i, response.json() if response.content else None)
+                        else:
+                            async for _ in response.aiter_raw():
+                                pass
+                except httpx.HTTPError:
+                    errors += 1
+                latencies.append((time.perf_counter() - start) * 1000)
+
+        started = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(min(concurrency, total_requests))))
+        elapsed = time.perf_counter() - started
+
+    return summarize(latencies, errors, elapsed)
+
+
+async def run_load(base_url: str, path: str, *, concurrency: int, total_requests: int) -> Dict[str, float]:
+    """
+    Send `total_requests` GETs to `base_url + path` from `concurrency` workers.
+
+    Returns:
+        Throughput (req/s), error count and latency percentiles (ms).
+    """
+    return await run_requests(
+        base_url, lambda i: ("GET", path, {}), concurrency=concurrency, total_requests=total_requests
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--target", action="append", required=True, help="NAME=BASE_URL, repeatable")
+    parser.add_argument("--path", default="/recipes/?limit=50")
+    parser.add_argument("--concurrency", type=int, default=100)
+    parser.add_argument("--requests", type=int, default=2000)
+    args = parser.parse_args()
+
+    for target in args.target:
+        name, _, base_url = target.partition("=")
+        result = asyncio.run(
+            run_load(base_url, args.path, concurrency=args.concurrency, total_requests=args.requests)
+        )
+        logger.info(
+            "%-8s %8.1f req/s  p50=%.1fms p95=%.1fms p99=%.1fms errors=%d",
+            name, result["throughput_rps"], result["p50_ms"], result["p95_ms"], result["p99_ms"], result["errors"],
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,158 @@
+"""
+Micro-benchmark of the recipe listing's serialization, without a database.
+
+Builds one synthetic page (500 recipes by default) and times turning it
+into the response body both ways:
+
+* before – a validated `RecipeResponse` per recipe (with its author and
+  ingredient models) from the ORM entities, then FastAPI's
+  `response_model` pass and the standard library JSON encoder;
+* after – the plain dicts `list_recipes_service` builds straight from the
+  repository rows, encoded with orjson.
+
+Both bodies are checked to be identical before timing.
+
+    python -m scripts.benchmark_serialization --recipes 500 --repeat 50
+"""
+
+import argparse
+import asyncio
+import logging
+import random
+import statistics
+import time
+from collections import namedtuple
+from typing import Callable, Dict, List, Tuple
+
+from fastapi.responses import JSONResponse, ORJSONResponse
+from fastapi.routing import serialize_response
+from fastapi.utils import create_response_field
+
+from app.application.services import recipe_service
+from app.domain.models.author import Author
+from app.domain.models.recipe import Recipe
+from app.domain.models.recipe_ingredient import RecipeIngredient
+from app.domain.schemas.recipe import RecipeResponse
+
+# ───────────────────────────────────────────
+# Configure basic logging to the console
+# ───────────────────────────────────────────
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s [%(levelname)s] %(message)s",
+)
+logger = logging.getLogger(__name__)
+
+# Shapes of the rows returned by recipe_repository.list_recipe_rows.
+RecipeRow = namedtuple(
+    "RecipeRow",
+    "id version title description author_id author_name author_email author_version",
+)
+IngredientRow = namedtuple("IngredientRow", "recipe_id ingredient_id quantity unit")
+
+UNITS = ("g", "kg", "ml", "l", "tbsp", "tsp", "pcs")
+
+
+def synthetic_page(
+    recipes: int, ingredients_per_recipe: int, authors: int, seed: int
+) -> Tuple[List[RecipeRow], List[IngredientRow], Dict[int, str]]:
+    """Rows of one page, plus the ingredient names the name cache would hold."""
+    rng = random.Random(seed)
+    id_to_name = {i: f"Ingredient {i}" for i in range(1, 1001)}
+    recipe_rows, ingredient_rows = [], []
+    for recipe_id in range(1, recipes + 1):
+        author_id = rng.randint(1, authors)
+        recipe_rows.append(RecipeRow(
+            recipe_id,
+            rng.randint(1, 5),
+            f"Recipe {recipe_id}",
+            "Simmer gently, season to taste and serve warm. " * rng.randint(0, 3) or None,
+            author_id,
+            f"Author {author_id}",
+            f"author{author_id}@example.com",
+            1,
+        ))
+        for ingredient_id in rng.sample(sorted(id_to_name), ingredients_per_recipe):
+            ingredient_rows.append(IngredientRow(
+                recipe_id, ingredient_id, float(rng.randint(1, 500)), rng.choice(UNITS)
+            ))
+    return recipe_rows, ingredient_rows, id_to_name
+
+
+def as_entities(recipe_rows: List[RecipeRow], ingredient_rows: List[IngredientRow]) -> List[Recipe]:
+    """The same page as the (transient) ORM entities the old listing serialized."""
+    authors: Dict[int, Author] = {}
+    recipes: Dict[int, Recipe] = {}
+    for r in recipe_rows:
+        author = authors.get(r.author_id)
+        if author is None:
+            author = authors[r.author_id] = Author(
+                id=r.author_id, name=r.author_name, email=r.author_email, version=r.author_version
+            )
+        recipes[r.id] = Recipe(id=r.id, version=r.version, title=r.title, description=r.description, author=author)
+    for line in ingredient_rows:
+        recipes[line.recipe_id].ingredients.append(RecipeIngredient(
+            ingredient_id=line.ingredient_id, quantity=line.quantity, unit=line.unit
+        ))
+    return list(recipes.values())
+
+
+def time_per_call(fn: Callable[[], bytes], repeat: int) -> List[float]:
+    fn()                                            # warm-up
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - started) * 1000)
+    return samples
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Time the serialization of one recipe listing page.")
+    parser.add_argument("--recipes", type=int, default=500, help="Recipes on the page")
+    parser.add_argument("--ingredients-per-recipe", type=int, default=9)
+    parser.add_argument("--authors", type=int, default=100, help="Distinct authors the recipes are drawn from")
+    parser.add_argument("--repeat", type=int, default=50, help="Timed runs per path")
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    recipe_rows, ingredient_rows, id_to_name = synthetic_page(
+        args.recipes, args.ingredients_per_recipe, args.authors, args.seed
+    )
+    entities = as_entities(recipe_rows, ingredient_rows)
+    field = create_response_field(name="Response_list_recipes", type_=List[RecipeResponse])
+    loop = asyncio.new_event_loop()
+
+    def before() -> bytes:
+        page = [recipe_service._to_recipe_response(r, id_to_name) for r in entities]
+        content = loop.run_until_complete(
+            serialize_response(field=field, response_content=page, is_coroutine=False)
+        )
+        return JSONResponse(content).body
+
+    def after() -> bytes:
+        page = recipe_service._recipe_dicts(recipe_rows, ingredient_rows, id_to_name)
+        return ORJSONResponse(page).body
+
+    if before() != after():
+        raise SystemExit("❌ The two paths produce different bodies")
+
+    logger.info(
+        "Page: %d recipes, %d ingredient lines, %d bytes",
+        len(recipe_rows), len(ingredient_rows), len(after()),
+    )
+    results = {"before": time_per_call(before, args.repeat), "after": time_per_call(after, args.repeat)}
+    for name, samples in results.items():
+        logger.info(
+            "%-6s median %7.2f ms   min %7.2f ms   max %7.2f ms",
+            name, statistics.median(samples), min(samples), max(samples),
+        )
+    logger.info(
+        "Speed-up: %.1fx",
+        statistics.median(results["before"]) / statistics.median(results["after"]),
+    )
+    loop.close()
+
+
+if __name__ == "__main__":
+    main()
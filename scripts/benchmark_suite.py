@@ -0,0 +1,335 @@
+"""
+Benchmark every recipe, author and ingredient route and keep a JSON baseline.
+
+Load the synthetic catalog first (same counts and seed as below), start the
+API against it, then run the suite:
+
+    python -m scripts.generate_dataset --truncate
+    uvicorn app.main:app --port 8000
+    python -m scripts.benchmark_suite --output bench/baseline.json
+
+Each scenario sends `--requests` requests from `--concurrency` clients and
+records throughput and p50/p95/p99 latency. Request parameters (IDs, search
+terms, ingredient filters) are drawn from `--seed`, so two runs against the
+same dataset send the same requests. Reads run first, on the untouched
+catalog; the write scenarios then create rows, update them and delete them
+again, leaving the dataset as it was.
+
+To check a change, save a baseline on the parent commit and compare:
+
+    python -m scripts.benchmark_suite --output after.json --compare bench/baseline.json
+
+The comparison exits with status 1 when a route's p95 grew or its
+throughput dropped by more than `--tolerance`.
+"""
+
+import argparse
+import asyncio
+import fnmatch
+import json
+import logging
+import os
+import platform
+import random
+import subprocess
+import sys
+import time
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Optional
+
+from app.application.pagination import encode_cursor
+from app.presentation.routes import author_routes, ingredients_routes, recipe_routes
+from scripts.benchmark import Request, run_requests
+from scripts.generate_dataset import FOODS, ingredient_name
+
+# ───────────────────────────────────────────
+# Configure basic logging to the console
+# ───────────────────────────────────────────
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s [%(levelname)s] %(message)s",
+)
+logger = logging.getLogger(__name__)
+logging.getLogger("httpx").setLevel(logging.WARNING)
+
+# Ingredient IDs are popularity ranks in the generated dataset: filters on the
+# top ones match many recipes, the tail matches few.
+POPULAR_INGREDIENTS = 50
+PANTRY_POOL = 300
+BULK_AUTHORS = 100
+
+
+class Scenario:
+    """One route under load: how to build its i-th request and how many to send."""
+
+    __slots__ = ("name", "method", "route", "make_request", "total", "on_response")
+
+    def __init__(
+        self,
+        name: str,
+        method: str,
+        route: str,
+        make_request: Callable[[int], Request],
+        total: Callable[[], int],
+        on_response: Optional[Callable[[int, Any], None]] = None,
+    ) -> None:
+        self.name = name
+        self.method = method
+        self.route = route
+        self.make_request = make_request
+        self.total = total
+        self.on_response = on_response
+
+
+def build_scenarios(args: argparse.Namespace) -> List[Scenario]:
+    """Reads first, then writes that clean up after themselves, in run order."""
+    # A unique tag keeps created emails and names from colliding with earlier runs.
+    run_tag = f"{int(time.time())}"
+    created: Dict[str, List[int]] = {"authors": [], "ingredients": [], "recipes": []}
+
+    def rng(name: str) -> random.Random:
+        return random.Random(f"{args.seed}:{name}")
+
+    def reads(n: int = args.requests) -> Callable[[], int]:
+        return lambda: n
+
+    def each_created(kind: str) -> Callable[[], int]:
+        return lambda: len(created[kind])
+
+    def collect(kind: str) -> Callable[[int, Any], None]:
+        def on_response(i: int, body: Any) -> None:
+            if isinstance(body, list):                   # POST /authors/ returns a list
+                created[kind].extend(item["id"] for item in body)
+            elif isinstance(body, dict) and "items" in body:   # POST /authors/bulk
+                created[kind].extend(item["author"]["id"] for item in body["items"] if item["author"])
+            else:
+                created[kind].append(body["id"])
+        return on_response
+
+    def random_id(r: random.Random, count: int) -> int:
+        return r.randint(1, count)
+
+    def ingredient_lines(r: random.Random) -> List[Dict[str, Any]]:
+        picked = r.sample(range(1, min(args.ingredients, PANTRY_POOL) + 1), min(8, args.ingredients))
+        return [{"ingredient_id": i, "quantity": r.randint(1, 500), "unit": "grams"} for i in picked]
+
+    r_recipe_page, r_recipe_get, r_search, r_filter, r_pantry = (
+        rng("recipes.list_keyset"), rng("recipes.get"), rng("recipes.search"),
+        rng("recipes.by_ingredients"), rng("recipes.pantry"),
+    )
+    r_author_page, r_author_get = rng("authors.list_keyset"), rng("authors.get")
+    r_ingredient_page, r_ingredient_get, r_suggest = (
+        rng("ingredients.list_keyset"), rng("ingredients.get"), rng("ingredients.suggest"),
+    )
+    r_recipe_write = rng("recipes.write")
+    top = min(POPULAR_INGREDIENTS, args.ingredients)
+
+    def search_terms(i: int) -> Request:
+        terms = r_search.sample(FOODS, r_search.choice((1, 1, 2)))
+        return "GET", "/recipes/search", {"params": {"q": " ".join(terms).lower(), "limit": 20}}
+
+    def by_ingredients(i: int) -> Request:
+        all_of = r_filter.sample(range(1, top + 1), min(2, top))
+        none_of = r_filter.randint(1, args.ingredients)
+        return "GET", "/recipes/by-ingredients", {"params": {"all": all_of, "none": none_of, "limit": 50}}
+
+    def pantry(i: int) -> Request:
+        have = r_pantry.sample(range(1, min(PANTRY_POOL, args.ingredients) + 1), min(10, args.ingredients))
+        return "GET", "/recipes/by-ingredients/pantry", {"params": {"have": have, "limit": 20}}
+
+    def suggest(i: int) -> Request:
+        name = ingredient_name(r_suggest.randint(0, args.ingredients - 1)).lower()
+        return "GET", "/ingredients/suggest", {"params": {"prefix": name[: r_suggest.randint(2, 4)]}}
+
+    def page_after(r: random.Random, prefix: str, count: int) -> Callable[[int], Request]:
+        return lambda i: ("GET", f"{prefix}/", {"params": {"limit": 50, "after": encode_cursor({"id": random_id(r, count)})}})
+
+    def create_recipe(i: int) -> Request:
+        return "POST", "/recipes/", {"json": {
+            "title": f"Bench {run_tag} recipe {i}",
+            "description": "Created by the benchmark suite.",
+            "author_id": random_id(r_recipe_write, args.authors),
+            "ingredients": ingredient_lines(r_recipe_write),
+        }}
+
+    def update_recipe(i: int) -> Request:
+        return "PUT", f"/recipes/{created['recipes'][i]}", {"json": {
+            "title": f"Bench {run_tag} recipe {i} (updated)",
+            "ingredients": ingredient_lines(r_recipe_write),
+        }}
+
+    exports = reads(args.export_requests)
+    batch = {"params": {"batch_size": 1000}}
+    return [
+        # ── reads ──
+        Scenario("recipes.list", "GET", "/recipes/", lambda i: ("GET", "/recipes/", {"params": {"limit": 50}}), reads()),
+        Scenario("recipes.list_keyset", "GET", "/recipes/", page_after(r_recipe_page, "/recipes", args.recipes), reads()),
+        Scenario("recipes.get", "GET", "/recipes/{recipe_id}",
+                 lambda i: ("GET", f"/recipes/{random_id(r_recipe_get, args.recipes)}", {}), reads()),
+        Scenario("recipes.search", "GET", "/recipes/search", search_terms, reads()),
+        Scenario("recipes.by_ingredients", "GET", "/recipes/by-ingredients", by_ingredients, reads()),
+        Scenario("recipes.pantry", "GET", "/recipes/by-ingredients/pantry", pantry, reads()),
+        Scenario("authors.list", "GET", "/authors/", lambda i: ("GET", "/authors/", {"params": {"limit": 50}}), reads()),
+        Scenario("authors.list_keyset", "GET", "/authors/", page_after(r_author_page, "/authors", args.authors), reads()),
+        Scenario("authors.get", "GET", "/authors/{author_id}",
+                 lambda i: ("GET", f"/authors/{random_id(r_author_get, args.authors)}", {}), reads()),
+        Scenario("ingredients.list", "GET", "/ingredients/",
+                 lambda i: ("GET", "/ingredients/", {"params": {"limit": 50}}), reads()),
+        Scenario("ingredients.list_keyset", "GET", "/ingredients/",
+                 page_after(r_ingredient_page, "/ingredients", args.ingredients), reads()),
+        Scenario("ingredients.get", "GET", "/ingredients/{ingredient_id}",
+                 lambda i: ("GET", f"/ingredients/{random_id(r_ingredient_get, args.ingredients)}", {}), reads()),
+        Scenario("ingredients.suggest", "GET", "/ingredients/suggest", suggest, reads()),
+        # Full-catalog streams: few requests, throughput is what matters.
+        Scenario("recipes.export", "GET", "/recipes/export", lambda i: ("GET", "/recipes/export", batch), exports),
+        Scenario("authors.export", "GET", "/authors/export", lambda i: ("GET", "/authors/export", batch), exports),
+        Scenario("ingredients.export", "GET", "/ingredients/export",
+                 lambda i: ("GET", "/ingredients/export", batch), exports),
+        # ── writes (create, then update and delete what was created) ──
+        Scenario("authors.create", "POST", "/authors/", lambda i: ("POST", "/authors/", {"json": {
+            "name": f"Bench Author {i}", "email": f"bench-{run_tag}-{i}@bench.example.com",
+        }}), reads(), collect("authors")),
+        Scenario("authors.bulk", "POST", "/authors/bulk", lambda i: ("POST", "/authors/bulk", {
+            "params": {"on_conflict": "skip"},
+            "json": [
+                {"name": f"Bench Bulk {i}.{j}", "email": f"bench-{run_tag}-bulk{i}.{j}@bench.example.com"}
+                for j in range(BULK_AUTHORS)
+            ],
+        }), reads(max(1, args.requests // BULK_AUTHORS)), collect("authors")),
+        Scenario("ingredients.create", "POST", "/ingredients/", lambda i: ("POST", "/ingredients/", {"json": {
+            "name": f"Bench {run_tag} ingredient {i}",
+        }}), reads(), collect("ingredients")),
+        Scenario("recipes.create", "POST", "/recipes/", create_recipe, reads(), collect("recipes")),
+        Scenario("recipes.update", "PUT", "/recipes/{recipe_id}", update_recipe, each_created("recipes")),
+        Scenario("recipes.delete", "DELETE", "/recipes/{recipe_id}",
+                 lambda i: ("DELETE", f"/recipes/{created['recipes'][i]}", {}), each_created("recipes")),
+        Scenario("authors.update", "PUT", "/authors/{author_id}",
+                 lambda i: ("PUT", f"/authors/{created['authors'][i]}", {"json": {"name": f"Bench Renamed {i}"}}),
+                 each_created("authors")),
+        Scenario("authors.delete", "DELETE", "/authors/{author_id}",
+                 lambda i: ("DELETE", f"/authors/{created['authors'][i]}", {}), each_created("authors")),
+        Scenario("ingredients.delete", "DELETE", "/ingredients/{ingredient_id}",
+                 lambda i: ("DELETE", f"/ingredients/{created['ingredients'][i]}", {}), each_created("ingredients")),
+    ]
+
+
+def uncovered_routes(scenarios: List[Scenario]) -> List[str]:
+    """Routes of the recipe, author and ingredient routers no scenario drives."""
+    covered = {(s.method, s.route) for s in scenarios}
+    missing = []
+    for module in (recipe_routes, author_routes, ingredients_routes):
+        for route in module.router.routes:
+            for method in route.methods:
+                if (method, route.path) not in covered:
+                    missing.append(f"{method} {route.path}")
+    return missing
+
+
+def git_revision() -> Dict[str, Any]:
+    def git(*argv: str) -> str:
+        return subprocess.run(("git", *argv), capture_output=True, text=True, check=True).stdout.strip()
+
+    try:
+        return {"commit": git("rev-parse", "HEAD"), "dirty": bool(git("status", "--porcelain", "--untracked-files=no"))}
+    except (OSError, subprocess.CalledProcessError):
+        return {"commit": None, "dirty": None}
+
+
+def run_suite(args: argparse.Namespace) -> Dict[str, Any]:
+    scenarios = build_scenarios(args)
+    for route in uncovered_routes(scenarios):
+        logger.warning("No scenario for %s", route)
+
+    results: Dict[str, Any] = {}
+    for scenario in scenarios:
+        if args.only and not any(fnmatch.fnmatch(scenario.name, pattern) for pattern in args.only):
+            continue
+        total = scenario.total()
+        if total == 0:
+            logger.info("%-26s skipped (nothing to send)", scenario.name)
+            continue
+        if args.warmup and scenario.method == "GET" and scenario.on_response is None:
+            asyncio.run(run_requests(
+                args.base_url, scenario.make_request,
+                concurrency=args.concurrency, total_requests=min(args.warmup, total),
+            ))
+        result = asyncio.run(run_requests(
+            args.base_url, scenario.make_request,
+            concurrency=args.concurrency, total_requests=total, on_response=scenario.on_response,
+        ))
+        results[scenario.name] = {"method": scenario.method, "route": scenario.route, **result}
+        logger.info(
+            "%-26s %8.1f req/s  p50=%.1fms p95=%.1fms p99=%.1fms errors=%d",
+            scenario.name, result["throughput_rps"], result["p50_ms"], result["p95_ms"], result["p99_ms"],
+            result["errors"],
+        )
+
+    return {
+        "meta": {
+            **git_revision(),
+            "created_at": datetime.now(timezone.utc).isoformat(),
+            "base_url": args.base_url,
+            "python": platform.python_version(),
+            "concurrency": args.concurrency,
+            "requests": args.requests,
+            "warmup": args.warmup,
+            "seed": args.seed,
+            "dataset": {"authors": args.authors, "ingredients": args.ingredients, "recipes": args.recipes},
+        },
+        "results": results,
+    }
+
+
+def compare(current: Dict[str, Any], baseline: Dict[str, Any], tolerance: float) -> bool:
+    """Log per-route changes against `baseline`; True if any route regressed beyond `tolerance`."""
+    if current["meta"]["dataset"] != baseline["meta"].get("dataset"):
+        logger.warning("Baseline was taken on a different dataset: %s", baseline["meta"].get("dataset"))
+    regressed = False
+    for name, now in current["results"].items():
+        before = baseline["results"].get(name)
+        if before is None:
+            continue
+        rps_change = now["throughput_rps"] / before["throughput_rps"] - 1 if before["throughput_rps"] else 0.0
+        p95_change = now["p95_ms"] / before["p95_ms"] - 1 if before["p95_ms"] else 0.0
+        worse = rps_change < -tolerance or p95_change > tolerance
+        regressed |= worse
+        logger.log(
+            logging.WARNING if worse else logging.INFO,
+            "%-26s throughput %+6.1f%%  p95 %+6.1f%%%s",
+            name, rps_change * 100, p95_change * 100, "  REGRESSION" if worse else "",
+        )
+    return regressed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--base-url", default="http://localhost:8000")
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--requests", type=int, default=1000, help="Requests per scenario")
+    parser.add_argument("--export-requests", type=int, default=1, help="Requests per export scenario (0 skips them)")
+    parser.add_argument("--warmup", type=int, default=100, help="Unrecorded requests before each read scenario")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--authors", type=int, default=100_000, help="Authors in the dataset")
+    parser.add_argument("--ingredients", type=int, default=50_000, help="Ingredients in the dataset")
+    parser.add_argument("--recipes", type=int, default=5_000_000, help="Recipes in the dataset")
+    parser.add_argument("--only", action="append", help="Run only scenarios matching this glob, repeatable")
+    parser.add_argument("--output", help="Write the results to this JSON file")
+    parser.add_argument("--compare", help="Baseline JSON file to compare the results with")
+    parser.add_argument("--tolerance", type=float, default=0.10, help="Allowed relative regression")
+    args = parser.parse_args()
+
+    report = run_suite(args)
+    if args.output:
+        os.makedirs(os.path.dirname(args.output) or ".", exist_ok=True)
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+        logger.info("Results written to %s", args.output)
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            baseline = json.load(f)
+        if compare(report, baseline, args.tolerance):
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
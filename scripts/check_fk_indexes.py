@@ -0,0 +1,82 @@
+"""
+Report foreign keys that no index can serve.
+
+PostgreSQL indexes the referenced side of a foreign key (a primary or unique
+key) but not the referencing columns. Without an index there, joins from the
+parent, deletes of a parent row (the FK check) and "is it still used?"
+lookups scan the whole child table.
+
+A foreign key counts as covered when a valid, non-partial index starts with
+its columns (in any order), e.g. the primary key (recipe_id, ingredient_id)
+covers recipe_id but not ingredient_id.
+
+    docker-compose exec api python -m scripts.check_fk_indexes
+
+Exits with status 1 and prints a CREATE INDEX statement for every uncovered key.
+"""
+
+import logging
+import sys
+from typing import List, Tuple
+
+from sqlalchemy import text
+from sqlalchemy.engine import Connection
+
+from app.persistence.db import engine
+
+# ───────────────────────────────────────────
+# Configure basic logging to the console
+# ───────────────────────────────────────────
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s [%(levelname)s] %(message)s",
+)
+logger = logging.getLogger(__name__)
+
+MISSING_FK_INDEXES = text(
+    """
+    SELECT c.conrelid::regclass::text AS table_name,
+           c.conname AS constraint_name,
+           array_agg(a.attname::text ORDER BY k.ord) AS columns
+    FROM pg_constraint c
+    CROSS JOIN LATERAL unnest(c.conkey) WITH ORDINALITY AS k(attnum, ord)
+    JOIN pg_attribute a ON a.attrelid = c.conrelid AND a.attnum = k.attnum
+    WHERE c.contype = 'f'
+      AND c.connamespace = current_schema()::regnamespace
+      AND NOT EXISTS (
+          SELECT 1
+          FROM pg_index i
+          WHERE i.indrelid = c.conrelid
+            AND i.indisvalid
+            AND i.indpred IS NULL
+            AND (string_to_array(i.indkey::text, ' ')::int2[])[1:cardinality(c.conkey)] @> c.conkey
+      )
+    GROUP BY c.conrelid, c.conname
+    ORDER BY 1, 2
+    """
+)
+
+
+def missing_fk_indexes(conn: Connection) -> List[Tuple[str, str, List[str]]]:
+    """(table, constraint, columns) of every foreign key without a supporting index."""
+    return [(row.table_name, row.constraint_name, list(row.columns)) for row in conn.execute(MISSING_FK_INDEXES)]
+
+
+def main() -> None:
+    with engine.connect() as conn:
+        missing = missing_fk_indexes(conn)
+
+    if not missing:
+        logger.info("✅ Every foreign key has a supporting index")
+        return
+
+    for table, constraint, columns in missing:
+        logger.warning(
+            "❌ %s.%s (%s) has no supporting index:\n    CREATE INDEX CONCURRENTLY ix_%s_%s ON %s (%s);",
+            table, constraint, ", ".join(columns), table, "_".join(columns), table, ", ".join(columns),
+        )
+    sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,313 @@
+"""
+Generate a large, deterministic synthetic catalog for benchmarking.
+
+The same `--seed` and counts always produce the same rows (IDs included),
+so benchmark baselines taken on different commits run against identical
+data. Every row has its own random stream, so changing `--recipes` or
+`--chunk-size` does not change the other generated rows.
+
+The shape mimics a real recipe site:
+
+* the number of ingredients per recipe is log-normal (median 8, 2 to 25);
+* ingredient popularity follows a Zipf law: ingredient 1 is the most
+  used (think salt), the long tail is rarely seen. IDs are assigned by
+  popularity rank, which scripts/benchmark_suite.py relies on;
+* a few prolific authors write many recipes (Zipf as well);
+* `created_at` grows with the recipe ID over `--days` days.
+
+Rows are written with COPY in committed chunks, then the ID sequences are
+moved past the generated IDs, the /stats counters are rebuilt and the tables
+are ANALYZEd. The target tables
+must be empty unless `--truncate` is given. Restart the API afterwards: its
+response cache and ingredient index still hold the old catalog.
+
+    python -m scripts.generate_dataset --authors 100000 --ingredients 50000 --recipes 5000000 --truncate
+"""
+
+import argparse
+import itertools
+import logging
+import math
+import random
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Iterable, Iterator, List, Sequence, Tuple
+
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from app.persistence.copy import copy_rows
+from app.persistence.db import SessionLocal, engine
+from app.persistence.repositories.recipe_repository import refresh_search_vectors
+from app.persistence.repositories.stats_repository import rebuild_recipe_stats
+
+# ───────────────────────────────────────────
+# Configure basic logging to the console
+# ───────────────────────────────────────────
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s [%(levelname)s] %(message)s",
+)
+logger = logging.getLogger(__name__)
+
+# ───────────────────────── vocabulary ──────────────────────────
+FIRST_NAMES = (
+    "Ana", "Juan", "Lucía", "Mateo", "Sofía", "Hugo", "Martina", "Leo", "Valentina", "Daniel",
+    "Emma", "Pablo", "Olivia", "Marco", "Chloé", "Kenji", "Aisha", "Noah", "Ingrid", "Ravi",
+    "Mei", "Omar", "Elena", "Lars", "Amara", "Tomás", "Yuki", "Nadia", "Felix", "Priya",
+)
+LAST_NAMES = (
+    "García", "Pérez", "Gómez", "Rossi", "Müller", "Dubois", "Tanaka", "Silva", "Novak", "Khan",
+    "Smith", "Jensen", "Kowalski", "Costa", "Nakamura", "Okafor", "Lindqvist", "Moreau", "Patel", "Chen",
+)
+# Ingredient names are QUALIFIER + FOOD; the bare foods come first so the
+# most popular (lowest) IDs get the plain names.
+FOODS = (
+    "Salt", "Olive Oil", "Garlic", "Onion", "Butter", "Eggs", "Flour", "Sugar", "Black Pepper", "Milk",
+    "Tomato", "Lemon", "Parsley", "Rice", "Chicken", "Carrot", "Potato", "Cheese", "Basil", "Cream",
+    "Ginger", "Chili", "Honey", "Yogurt", "Beef", "Pork", "Salmon", "Shrimp", "Mushroom", "Spinach",
+    "Cumin", "Paprika", "Cinnamon", "Vanilla", "Oregano", "Thyme", "Rosemary", "Coriander", "Lime", "Pasta",
+    "Beans", "Lentils", "Chickpeas", "Corn", "Pepper", "Zucchini", "Eggplant", "Cabbage", "Broccoli", "Peas",
+    "Almonds", "Walnuts", "Oats", "Bread", "Tofu", "Soy Sauce", "Vinegar", "Mustard", "Coconut Milk", "Chocolate",
+)
+QUALIFIERS = (
+    "Smoked", "Fresh", "Dried", "Roasted", "Ground", "Organic", "Wild", "Red", "Green", "Yellow",
+    "Sweet", "Spicy", "Baby", "Toasted", "Pickled", "Frozen", "Aged", "Young", "Charred", "White",
+    "Crushed", "Whole", "Sliced", "Minced", "Grated", "Candied", "Salted", "Unsalted", "Raw", "Fermented",
+)
+DISHES = (
+    "Soup", "Stew", "Salad", "Curry", "Pie", "Tart", "Risotto", "Casserole", "Stir-Fry", "Tacos",
+    "Bowl", "Skewers", "Bake", "Gratin", "Pancakes", "Sandwich", "Wrap", "Roast", "Noodles", "Cake",
+)
+STYLES = (
+    "Classic", "Quick", "Easy", "Grandma's", "Weeknight", "Rustic", "Creamy", "Crispy", "Spicy", "Hearty",
+    "Summer", "Winter", "One-Pot", "Slow-Cooked", "Healthy", "Vegan", "Smoky", "Zesty", "Golden", "Homemade",
+)
+# (unit, smallest, largest quantity, step)
+UNITS = (
+    ("grams", 5, 800, 5), ("ml", 10, 1000, 10), ("pieces", 1, 12, 1), ("tbsp", 0.5, 6, 0.5),
+    ("tsp", 0.25, 4, 0.25), ("cups", 0.25, 4, 0.25), ("pinch", 1, 3, 1),
+)
+
+# ───────────────────────── distributions ───────────────────────
+INGREDIENTS_MEDIAN = 8
+INGREDIENTS_SIGMA = 0.45          # log-normal spread; ~90 % of recipes get 4-16
+MIN_INGREDIENTS, MAX_INGREDIENTS = 2, 25
+INGREDIENT_ZIPF = 1.0             # popularity exponent of ingredient ranks
+AUTHOR_ZIPF = 0.8                 # prolific authors
+
+EPOCH = datetime(2020, 1, 1, tzinfo=timezone.utc)
+
+
+def zipf_cum_weights(n: int, exponent: float) -> List[float]:
+    """Cumulative weights for `random.choices`, rank 1 (index 0) most likely."""
+    return list(itertools.accumulate(1 / (rank ** exponent) for rank in range(1, n + 1)))
+
+
+def chunked(start: int, stop: int, size: int) -> Iterator[Tuple[int, int]]:
+    """[first, last] ID ranges of at most `size` IDs covering start..stop."""
+    for first in range(start, stop + 1, size):
+        yield first, min(first + size - 1, stop)
+
+
+def ingredient_name(index: int) -> str:
+    """Unique name of the ingredient at popularity rank `index` (0-based)."""
+    food = FOODS[index % len(FOODS)]
+    round_, _ = divmod(index, len(FOODS))
+    if round_ == 0:
+        return food
+    qualifier_round, q = divmod(round_ - 1, len(QUALIFIERS))
+    name = f"{QUALIFIERS[q]} {food}"
+    return name if qualifier_round == 0 else f"{name} No. {qualifier_round + 1}"
+
+
+# ───────────────────────── row generators ──────────────────────
+def author_rows(seed: int, first: int, last: int) -> Iterator[Sequence]:
+    for author_id in range(first, last + 1):
+        rng = random.Random(f"{seed}:author:{author_id}")
+        name = f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}"
+        yield author_id, name, f"author{author_id}@bench.example.com"
+
+
+def ingredient_rows(first: int, last: int) -> Iterator[Sequence]:
+    for ingredient_id in range(first, last + 1):
+        yield ingredient_id, ingredient_name(ingredient_id - 1)
+
+
+def recipe_chunk(
+    seed: int,
+    first: int,
+    last: int,
+    *,
+    authors: int,
+    ingredient_weights: List[float],
+    author_weights: List[float],
+    total_recipes: int,
+    days: int,
+) -> Tuple[List[Sequence], List[Sequence]]:
+    """Recipe rows and recipe_ingredients rows of recipe IDs first..last."""
+    ingredient_ids = range(1, len(ingredient_weights) + 1)
+    author_ids = range(1, authors + 1)
+    mu = math.log(INGREDIENTS_MEDIAN)
+    span = timedelta(days=days)
+
+    recipes: List[Sequence] = []
+    lines: List[Sequence] = []
+    for recipe_id in range(first, last + 1):
+        # Seeded per row, so the output does not depend on --chunk-size.
+        rng = random.Random(f"{seed}:recipe:{recipe_id}")
+        count = round(rng.lognormvariate(mu, INGREDIENTS_SIGMA))
+        count = max(MIN_INGREDIENTS, min(MAX_INGREDIENTS, count, len(ingredient_weights)))
+
+        picked: List[int] = []
+        seen = set()
+        while len(picked) < count:
+            for ingredient_id in rng.choices(ingredient_ids, cum_weights=ingredient_weights, k=count - len(picked)):
+                if ingredient_id not in seen:
+                    seen.add(ingredient_id)
+                    picked.append(ingredient_id)
+
+        # The rarest ingredient names the dish ("Smoked Paprika Stew", not "Salt Stew").
+        main = ingredient_name(max(picked) - 1)
+        title = f"{rng.choice(STYLES)} {main} {rng.choice(DISHES)}"
+        highlights = ", ".join(ingredient_name(i - 1).lower() for i in picked[:3])
+        description = f"{title} with {highlights}" + (f" and {count - 3} more ingredients." if count > 3 else ".")
+        author_id = rng.choices(author_ids, cum_weights=author_weights)[0]
+        created_at = EPOCH + span * (recipe_id / total_recipes) + timedelta(seconds=rng.randrange(3600))
+        recipes.append((recipe_id, title, description, author_id, created_at.isoformat()))
+
+        for ingredient_id in picked:
+            unit, low, high, step = rng.choice(UNITS)
+            quantity = max(low, round(rng.uniform(low, high) / step) * step)
+            lines.append((recipe_id, ingredient_id, quantity, unit))
+    return recipes, lines
+
+
+# ───────────────────────── loading ─────────────────────────────
+TABLES = ("recipe_ingredients", "recipes", "ingredients", "authors")
+
+
+def prepare_tables(db: Session, truncate: bool) -> None:
+    """Empty the catalog tables (`truncate`) or make sure they already are."""
+    if truncate:
+        db.execute(text(f"TRUNCATE {', '.join(TABLES)} RESTART IDENTITY CASCADE"))
+        db.commit()
+        return
+    for table in TABLES:
+        if db.execute(text(f"SELECT EXISTS (SELECT 1 FROM {table})")).scalar():
+            raise SystemExit(f"Table {table} is not empty; pass --truncate to replace its rows.")
+
+
+def copy(db: Session, table: str, columns: Sequence[str], rows: Iterable[Sequence]) -> None:
+    if not copy_rows(db, table, columns, rows):
+        raise SystemExit("COPY is not available on this connection (psycopg2 is required).")
+
+
+def log_progress(table: str, done: int, started: float) -> None:
+    logger.info("%s: %d rows (%.0f rows/s)", table, done, done / max(time.perf_counter() - started, 1e-9))
+
+
+def generate_dataset(
+    *,
+    authors: int,
+    ingredients: int,
+    recipes: int,
+    seed: int,
+    chunk_size: int,
+    days: int,
+    truncate: bool,
+    search_vectors: bool,
+) -> None:
+    db: Session = SessionLocal()
+    try:
+        prepare_tables(db, truncate)
+
+        started = time.perf_counter()
+        for first, last in chunked(1, authors, chunk_size):
+            copy(db, "authors", ("id", "name", "email"), author_rows(seed, first, last))
+            db.commit()
+            log_progress("authors", last, started)
+
+        started = time.perf_counter()
+        for first, last in chunked(1, ingredients, chunk_size):
+            copy(db, "ingredients", ("id", "name"), ingredient_rows(first, last))
+            db.commit()
+            log_progress("ingredients", last, started)
+
+        ingredient_weights = zipf_cum_weights(ingredients, INGREDIENT_ZIPF)
+        author_weights = zipf_cum_weights(authors, AUTHOR_ZIPF)
+        started = time.perf_counter()
+        lines_total = 0
+        for first, last in chunked(1, recipes, chunk_size):
+            recipe_rows, line_rows = recipe_chunk(
+                seed, first, last,
+                authors=authors,
+                ingredient_weights=ingredient_weights,
+                author_weights=author_weights,
+                total_recipes=recipes,
+                days=days,
+            )
+            copy(db, "recipes", ("id", "title", "description", "author_id", "created_at"), recipe_rows)
+            copy(db, "recipe_ingredients", ("recipe_id", "ingredient_id", "quantity", "unit"), line_rows)
+            if search_vectors:
+                refresh_search_vectors(db, range(first, last + 1))
+            db.commit()
+            lines_total += len(line_rows)
+            log_progress("recipes", last, started)
+
+        logger.info("recipe_ingredients: %d rows (%.1f per recipe)", lines_total, lines_total / max(recipes, 1))
+
+        # Rows were COPYed with explicit IDs; move the sequences past them.
+        for table in ("authors", "ingredients", "recipes"):
+            db.execute(text(
+                f"SELECT setval(pg_get_serial_sequence('{table}', 'id'), "
+                f"COALESCE((SELECT MAX(id) FROM {table}), 0) + 1, false)"
+            ))
+        # COPY bypasses the repositories: count the catalog once for /stats.
+        rebuild_recipe_stats(db)
+        db.commit()
+    except Exception:
+        db.rollback()
+        logger.exception("Dataset generation failed")
+        raise
+    finally:
+        db.close()
+
+    # ANALYZE cannot run inside a transaction block.
+    with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+        for table in TABLES:
+            conn.execute(text(f"ANALYZE {table}"))
+    logger.info("Dataset ready: %d authors, %d ingredients, %d recipes", authors, ingredients, recipes)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--authors", type=int, default=100_000)
+    parser.add_argument("--ingredients", type=int, default=50_000)
+    parser.add_argument("--recipes", type=int, default=5_000_000)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--chunk-size", type=int, default=20_000, help="Rows per COPY / commit")
+    parser.add_argument("--days", type=int, default=5 * 365, help="Time span of created_at")
+    parser.add_argument("--truncate", action="store_true", help="Empty the catalog tables first")
+    parser.add_argument(
+        "--skip-search-vectors", action="store_true",
+        help="Do not compute search_vector (faster load; /recipes/search finds nothing)",
+    )
+    args = parser.parse_args()
+    if min(args.authors, args.ingredients) < 1 or args.recipes < 0:
+        parser.error("--authors and --ingredients must be at least 1")
+
+    generate_dataset(
+        authors=args.authors,
+        ingredients=args.ingredients,
+        recipes=args.recipes,
+        seed=args.seed,
+        chunk_size=args.chunk_size,
+        days=args.days,
+        truncate=args.truncate,
+        search_vectors=not args.skip_search_vectors,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+"""
+Bulk-import authors, ingredients or recipes from an NDJSON file.
+
+The file is read line by line and written in committed batches, so memory
+use does not grow with the file size. Use "-" to read from stdin.
+
+Run inside the running API container:
+
+    docker-compose exec api python -m scripts.import_ndjson authors authors.ndjson
+    docker-compose exec -T api python -m scripts.import_ndjson recipes - < recipes.ndjson
+"""
+
+import argparse
+import logging
+import sys
+from sqlalchemy.orm import Session
+
+from app.persistence.db import SessionLocal
+from app.domain.schemas.data_import import ImportEntity
+from app.application.services.import_service import import_ndjson_service
+
+# ───────────────────────────────────────────
+# Configure basic logging to the console
+# ───────────────────────────────────────────
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s [%(levelname)s] %(message)s",
+)
+logger = logging.getLogger(__name__)
+
+
+def import_file(entity: ImportEntity, path: str, chunk_size: int) -> None:
+    """
+    Stream `path` into the database through the NDJSON import service.
+    """
+    logger.info("Importing %s from %s...", entity.value, path)
+    db: Session = SessionLocal()
+    source = sys.stdin.buffer if path == "-" else open(path, "rb")
+
+    try:
+        result = import_ndjson_service(db, entity, source, chunk_size=chunk_size)
+        logger.info(
+            "✅ %s: %d imported, %d skipped, %d failed",
+            entity.value, result.imported, result.skipped, result.failed,
+        )
+        for error in result.errors:
+            logger.warning("line %d: %s", error.line, error.error)
+
+    except Exception as e:
+        db.rollback()
+        logger.error("❌ Import failed: %s", e)
+        raise
+
+    finally:
+        if source is not sys.stdin.buffer:
+            source.close()
+        db.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Bulk-import an NDJSON file.")
+    parser.add_argument("entity", type=ImportEntity, choices=list(ImportEntity))
+    parser.add_argument("path", help="NDJSON file, or - for stdin")
+    parser.add_argument("--chunk-size", type=int, default=1000)
+    args = parser.parse_args()
+
+    import_file(args.entity, args.path, args.chunk_size)
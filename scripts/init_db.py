@@ -1,6 +1,11 @@
 """
-Initialize the PostgreSQL schema by creating every table
-registered in Base.metadata.
+Initialize the PostgreSQL schema and bring it to the latest migration.
+
+* Empty database: create every table registered in Base.metadata (with
+  its indexes; the tables are empty, so nothing needs CONCURRENTLY) and
+  stamp it with the latest Alembic revision.
+* Existing database: run the pending migrations (``alembic upgrade head``),
+  which also catches up databases created before migrations existed.
 
 Run inside the running API container:
 
@@ -8,6 +13,11 @@ Run inside the running API container:
 """
 
 import logging
+from pathlib import Path
+
+from alembic import command
+from alembic.config import Config
+from sqlalchemy import inspect
 
 from app.persistence.db import engine, Base
 
@@ -23,15 +33,29 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+ALEMBIC_INI = Path(__file__).resolve().parent.parent / "alembic.ini"
+
+
+def alembic_config() -> Config:
+    config = Config(str(ALEMBIC_INI))
+    config.attributes["configure_logger"] = False
+    return config
+
+
 def init_db() -> None:
     """
-    Create all tables if they do not exist.
+    Create the schema of an empty database, or migrate an existing one.
     Raises an exception if the operation fails.
     """
     logger.info("Starting database schema initialization...")
     try:
-        Base.metadata.create_all(bind=engine)
-        logger.info("✅ Database schema created (or already present)")
+        if inspect(engine).get_table_names():
+            command.upgrade(alembic_config(), "head")
+            logger.info("✅ Database schema migrated to the latest revision")
+        else:
+            Base.metadata.create_all(bind=engine)
+            command.stamp(alembic_config(), "head")
+            logger.info("✅ Database schema created")
     except Exception as exc:
         logger.error("❌ Failed to initialize database schema: %s", exc)
         raise
@@ -0,0 +1,47 @@
+"""
+Recompute the recipe statistics counters from the catalog.
+
+The API keeps the counters behind /stats up to date on every recipe write;
+this rebuilds them after data was changed another way (manual SQL, a
+restore, writes by a release that predates the counters). Safe to run
+against a live database: concurrent writes wait for it and are counted
+on top (see `stats_repository.rebuild_recipe_stats`).
+
+    docker-compose exec api python -m scripts.rebuild_stats
+"""
+
+import logging
+import time
+
+from sqlalchemy.orm import Session
+
+from app.persistence.db import SessionLocal
+from app.persistence.repositories.stats_repository import rebuild_recipe_stats
+
+# ───────────────────────────────────────────
+# Configure basic logging to the console
+# ───────────────────────────────────────────
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s [%(levelname)s] %(message)s",
+)
+logger = logging.getLogger(__name__)
+
+
+def rebuild_stats() -> None:
+    db: Session = SessionLocal()
+    started = time.perf_counter()
+    try:
+        rebuild_recipe_stats(db)
+        db.commit()
+        logger.info("✅ Recipe statistics rebuilt in %.1f s", time.perf_counter() - started)
+    except Exception as exc:
+        db.rollback()
+        logger.error("❌ Failed to rebuild recipe statistics: %s", exc)
+        raise
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    rebuild_stats()
@@ -15,6 +15,8 @@ from sqlalchemy.orm import Session
 
 from app.persistence.db import SessionLocal
 from app.domain.models import Author, Ingredient, Recipe, RecipeIngredient
+from app.persistence.repositories.recipe_repository import refresh_search_vectors
+from app.persistence.repositories.stats_repository import rebuild_recipe_stats
 
 # ───────────────────────────────────────────
 # Configure basic logging to the console
@@ -73,6 +75,11 @@ def seed_data() -> None:
             ing_flour, ing_eggs, ing_milk, ing_sugar,
             recipe_pancakes, recipe_cake
         ])
+        db.flush()
+        # Inserted without the repository, so build the full-text vectors
+        # and the /stats counters here.
+        refresh_search_vectors(db, [recipe_pancakes.id, recipe_cake.id])
+        rebuild_recipe_stats(db)
         db.commit()
         logger.info("✅ Seed data inserted successfully")
 
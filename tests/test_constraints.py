@@ -0,0 +1,78 @@
+"""Database constraint violations surface as the matching HTTP errors."""
+
+import pytest
+
+
+def recipe(author_id, *ingredient_ids):
+    return {
+        "title": "Recipe",
+        "description": "Test recipe.",
+        "author_id": author_id,
+        "ingredients": [{"ingredient_id": i, "quantity": 1, "unit": "g"} for i in ingredient_ids],
+    }
+
+
+def test_recipe_with_unknown_references(client, make_recipes):
+    make_recipes([{1}])
+    author_id = client.get("/authors/").json()[0]["id"]
+
+    assert client.post("/recipes/", json=recipe(author_id, 999)).status_code == 404
+    assert client.post("/recipes/", json=recipe(999, 1)).status_code == 404
+    assert client.get("/stats/ingredients").json()[0]["recipe_count"] == 1
+
+
+def test_recipe_update_with_unknown_ingredient(client, make_recipes):
+    [recipe_id] = make_recipes([{1}])
+
+    response = client.put(f"/recipes/{recipe_id}", json={
+        "ingredients": [{"ingredient_id": 999, "quantity": 1, "unit": "g"}],
+    })
+    assert response.status_code == 404
+    assert [i["ingredient_id"] for i in client.get(f"/recipes/{recipe_id}").json()["ingredients"]] == [1]
+
+
+def test_duplicate_author_email(client, make_recipes):
+    make_recipes([])
+    response = client.post("/authors/", json={"name": "Other", "email": "ada@example.com"})
+    assert response.status_code == 409
+
+    other = client.post("/authors/", json={"name": "Other", "email": "other@example.com"}).json()[0]
+    assert client.put(f"/authors/{other['id']}", json={"email": "ada@example.com"}).status_code == 409
+
+
+def test_duplicate_ingredient_name(client):
+    assert client.post("/ingredients/", json={"name": "Flour"}).status_code == 201
+    assert client.post("/ingredients/", json={"name": "Flour"}).status_code == 409
+
+
+def test_ingredient_in_use(client, make_recipes):
+    [recipe_id] = make_recipes([{1}])
+
+    assert client.delete("/ingredients/1").status_code == 409
+    assert client.delete(f"/recipes/{recipe_id}").status_code == 204
+    assert client.delete("/ingredients/1").status_code == 204
+
+
+@pytest.mark.parametrize("update", [
+    {"title": "New title"},
+    {"ingredients": [{"ingredient_id": 1, "quantity": 2, "unit": "g"}]},
+    {"ingredients": [{"ingredient_id": 1, "quantity": 1, "unit": "g"},
+                     {"ingredient_id": 2, "quantity": 1, "unit": "g"}]},
+])
+def test_recipe_deleted_while_being_updated(client, make_recipes, monkeypatch, update):
+    from app.persistence.db import SessionLocal
+    from app.persistence.repositories import recipe_repository
+
+    [recipe_id] = make_recipes([{1, 2}])
+    client.put(f"/recipes/{recipe_id}", json={"ingredients": [{"ingredient_id": 1, "quantity": 1, "unit": "g"}]})
+    get_recipe_for_update = recipe_repository.get_recipe_for_update
+
+    def load_then_delete(db, recipe_id):
+        loaded = get_recipe_for_update(db, recipe_id)
+        with SessionLocal() as other:
+            recipe_repository.delete_recipe(other, recipe_id)
+        return loaded
+
+    monkeypatch.setattr(recipe_repository, "get_recipe_for_update", load_then_delete)
+
+    assert client.put(f"/recipes/{recipe_id}", json=update).status_code == 404
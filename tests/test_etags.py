@@ -0,0 +1,67 @@
+"""Conditional GETs: ETags change with the data, and If-None-Match answers 304."""
+
+from app.application.cache.response_cache import response_cache
+
+
+def test_recipe_etag(client, make_recipes):
+    [recipe_id] = make_recipes([{1}])
+    first = client.get(f"/recipes/{recipe_id}")
+    etag = first.headers["ETag"]
+
+    not_modified = client.get(f"/recipes/{recipe_id}", headers={"If-None-Match": etag})
+    assert not_modified.status_code == 304
+    assert not_modified.headers["ETag"] == etag
+
+    assert client.put(f"/recipes/{recipe_id}", json={"title": "Renamed"}).status_code == 200
+    modified = client.get(f"/recipes/{recipe_id}", headers={"If-None-Match": etag})
+    assert modified.status_code == 200
+    assert modified.headers["ETag"] != etag
+    assert modified.json()["title"] == "Renamed"
+
+
+def test_recipe_etag_follows_its_author(client, make_recipes):
+    [recipe_id] = make_recipes([{1}])
+    etag = client.get(f"/recipes/{recipe_id}").headers["ETag"]
+    author_id = client.get("/authors/").json()[0]["id"]
+
+    assert client.put(f"/authors/{author_id}", json={"name": "Grace"}).status_code == 200
+
+    response = client.get(f"/recipes/{recipe_id}", headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.json()["author"]["name"] == "Grace"
+
+
+def test_recipe_page_etag(client, make_recipes):
+    make_recipes([{1}, {2}])
+    etag = client.get("/recipes/").headers["ETag"]
+
+    assert client.get("/recipes/", headers={"If-None-Match": etag}).status_code == 304
+
+    created = client.post("/recipes/", json={
+        "title": "Another",
+        "description": "Test recipe.",
+        "author_id": client.get("/authors/").json()[0]["id"],
+        "ingredients": [{"ingredient_id": 1, "quantity": 1, "unit": "g"}],
+    })
+    assert created.status_code == 201
+    assert client.get("/recipes/", headers={"If-None-Match": etag}).status_code == 200
+
+
+def test_etag_without_cache(client, make_recipes):
+    """With nothing cached the ETag comes from the version columns alone, and must match."""
+    [recipe_id] = make_recipes([{1}])
+    etag = client.get(f"/recipes/{recipe_id}").headers["ETag"]
+    response_cache.clear()
+
+    assert client.get(f"/recipes/{recipe_id}", headers={"If-None-Match": etag}).status_code == 304
+    assert client.get("/recipes/999", headers={"If-None-Match": etag}).status_code == 404
+
+
+def test_author_etag(client, make_recipes):
+    make_recipes([{1}])
+    author_id = client.get("/authors/").json()[0]["id"]
+    etag = client.get(f"/authors/{author_id}").headers["ETag"]
+
+    assert client.get(f"/authors/{author_id}", headers={"If-None-Match": etag}).status_code == 304
+    assert client.put(f"/authors/{author_id}", json={"email": "grace@example.com"}).status_code == 200
+    assert client.get(f"/authors/{author_id}", headers={"If-None-Match": etag}).status_code == 200
@@ -0,0 +1,154 @@
+"""The in-process ingredient -> recipes index, checked against brute force."""
+
+import itertools
+
+from app.application.indexes.ingredient_recipe_index import IngredientRecipeIndex, ingredient_recipe_index
+
+RECIPES = {
+    1: {1, 2},
+    2: {1, 2, 3},
+    3: {2, 4},
+    4: {4},
+    5: {1, 3, 4, 5},
+    6: set(),
+}
+
+
+def brute_force_pantry(recipes, have, max_missing):
+    rows = []
+    for recipe_id, ingredient_ids in recipes.items():
+        matched = len(ingredient_ids & have)
+        missing = len(ingredient_ids) - matched
+        if matched and missing <= max_missing:
+            rows.append((missing, recipe_id))
+    return [(recipe_id, missing) for missing, recipe_id in sorted(rows)]
+
+
+def build_index(recipes):
+    index = IngredientRecipeIndex()
+    by_ingredient, by_size = {}, {}
+    for recipe_id, ingredient_ids in recipes.items():
+        for ingredient_id in ingredient_ids:
+            by_ingredient.setdefault(ingredient_id, []).append(recipe_id)
+        by_size.setdefault(len(ingredient_ids), []).append(recipe_id)
+    index.ensure_loaded(lambda: (by_ingredient.items(), by_size.items()))
+    return index
+
+
+def pantries():
+    for size in range(1, 4):
+        yield from (set(have) for have in itertools.combinations(range(1, 6), size))
+
+
+def test_pantry_matches_brute_force():
+    index = build_index(RECIPES)
+    for have in pantries():
+        for max_missing in range(4):
+            assert index.pantry(have, max_missing=max_missing) == brute_force_pantry(RECIPES, have, max_missing)
+
+
+def test_pantry_pages_with_keyset_cursor():
+    index = build_index(RECIPES)
+    expected = brute_force_pantry(RECIPES, {1, 4}, 3)
+
+    rows, after = [], None
+    while True:
+        page = index.pantry({1, 4}, max_missing=3, after=after, limit=2)
+        if not page:
+            break
+        rows.extend(page)
+        recipe_id, missing = page[-1]
+        after = (missing, recipe_id)
+    assert rows == expected
+
+
+def test_match():
+    index = build_index(RECIPES)
+    assert index.match(all_of=[1, 2]) == [1, 2]
+    assert index.match(any_of=[3, 5]) == [2, 5]
+    assert index.match(all_of=[4], none_of=[1]) == [3, 4]
+    assert index.match(none_of=[1, 2, 3, 4, 5]) == [6]
+    assert index.match(after_id=3, limit=2) == [4, 5]
+
+
+def test_writes_keep_size_buckets_consistent():
+    index = build_index(RECIPES)
+    recipes = {recipe_id: set(ids) for recipe_id, ids in RECIPES.items()}
+
+    # What the recipe services do on update (full sets both ways), create and delete.
+    index.remove_recipe(2, recipes[2])
+    recipes[2] = {1, 4}
+    index.add_recipe(2, recipes[2])
+    index.add_recipe(7, {2, 3, 5})
+    recipes[7] = {2, 3, 5}
+    index.remove_recipe(6, recipes.pop(6))
+
+    for have in pantries():
+        assert index.pantry(have, max_missing=3) == brute_force_pantry(recipes, have, 3)
+    assert index.match() == sorted(recipes)
+
+
+# ───────────────────────── through the API ──────────────────────────
+def api_pantry(client, have, max_missing):
+    response = client.get(
+        "/recipes/by-ingredients/pantry", params={"have": sorted(have), "max_missing": max_missing, "limit": 100}
+    )
+    assert response.status_code == 200, response.text
+    return [(row["id"], row["missing_count"]) for row in response.json()]
+
+
+def catalog(client):
+    return {
+        recipe["id"]: {line["ingredient_id"] for line in recipe["ingredients"]}
+        for recipe in client.get("/recipes/", params={"limit": 500}).json()
+    }
+
+
+def test_pantry_after_recipe_updates(client, make_recipes):
+    recipe_ids = make_recipes([{1, 2}, {1, 2, 3}, {2, 4}, {4}, {1, 3, 4, 5}])
+    assert api_pantry(client, {1}, 3)  # builds the index
+
+    # Ingredient set changed: {1, 2, 3} -> {1, 4}
+    response = client.put(f"/recipes/{recipe_ids[1]}", json={"ingredients": [
+        {"ingredient_id": 1, "quantity": 1, "unit": "g"},
+        {"ingredient_id": 4, "quantity": 2, "unit": "g"},
+    ]})
+    assert response.status_code == 200, response.text
+    # Same ingredients, new quantities.
+    response = client.put(f"/recipes/{recipe_ids[2]}", json={"ingredients": [
+        {"ingredient_id": 2, "quantity": 5, "unit": "g"},
+        {"ingredient_id": 4, "quantity": 5, "unit": "g"},
+    ]})
+    assert response.status_code == 200, response.text
+
+    recipes = catalog(client)
+    for have in pantries():
+        for max_missing in range(3):
+            assert api_pantry(client, have, max_missing) == brute_force_pantry(recipes, have, max_missing)
+
+
+def test_author_delete_unindexes_every_recipe(client, make_recipes):
+    make_recipes([{1, 2}, set(), {2}])
+    assert api_pantry(client, {2}, 1)  # builds the index
+
+    author_id = client.get("/authors/").json()[0]["id"]
+    assert client.delete(f"/authors/{author_id}").status_code == 204
+
+    assert ingredient_recipe_index.match() == []
+    assert api_pantry(client, {1, 2}, 3) == []
+
+
+def test_concurrent_first_builds_in_async_mode(client, make_recipes, run_async, monkeypatch):
+    from app.application.services import async_recipe_service, recipe_service
+
+    make_recipes([{1, 2}, {2, 3}])
+    index = IngredientRecipeIndex()
+    monkeypatch.setattr(recipe_service, "ingredient_recipe_index", index)
+    monkeypatch.setattr(async_recipe_service, "ingredient_recipe_index", index)
+
+    results = run_async(
+        lambda db: async_recipe_service.find_recipes_by_ingredients_service(db, all_of=[2], any_of=[], none_of=[]),
+        times=3,
+    )
+    assert [[recipe.title for recipe in found] for found in results] == [["Recipe 0", "Recipe 1"]] * 3
+    assert index.loaded
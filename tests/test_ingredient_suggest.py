@@ -0,0 +1,60 @@
+"""Typeahead: served from the prefix index; pg_trgm only for typos or on request."""
+
+import pytest
+
+
+@pytest.fixture
+def ingredients(client):
+    for name in ("Flour", "Flaxseed", "Sugar", "Brown sugar"):
+        assert client.post("/ingredients/", json={"name": name}).status_code == 201
+    client.get("/ingredients/suggest", params={"prefix": "x"})  # builds the index
+
+
+def suggest(client, prefix, **params):
+    response = client.get("/ingredients/suggest", params={"prefix": prefix, **params})
+    assert response.status_code == 200, response.text
+    return [(s["name"], s["match"]) for s in response.json()]
+
+
+def test_prefix_matches_do_not_query_the_database(client, ingredients, queries):
+    queries.clear()
+
+    assert suggest(client, "Fla") == [("Flaxseed", "prefix")]
+    assert sorted(suggest(client, "sug")) == [("Brown sugar", "prefix"), ("Sugar", "prefix")]
+    assert queries == []
+
+
+def test_no_prefix_match_falls_back_to_trigrams(client, ingredients, queries):
+    queries.clear()
+
+    assert ("Flour", "fuzzy") in suggest(client, "Flourr")
+    assert queries
+
+
+def test_short_prefix_never_falls_back(client, ingredients, queries):
+    queries.clear()
+
+    assert suggest(client, "zz") == []
+    assert queries == []
+
+
+def test_fuzzy_on_request(client, ingredients, queries):
+    queries.clear()
+
+    assert suggest(client, "Flo", fuzzy=True)[0] == ("Flour", "prefix")
+    assert queries
+
+
+def test_concurrent_first_loads_in_async_mode(client, run_async, monkeypatch):
+    from app.application.indexes.ingredient_prefix_index import IngredientPrefixIndex
+    from app.application.services import async_ingredient_service, ingredient_service
+
+    for name in ("Flour", "Flaxseed"):
+        assert client.post("/ingredients/", json={"name": name}).status_code == 201
+    index = IngredientPrefixIndex()
+    monkeypatch.setattr(ingredient_service, "ingredient_prefix_index", index)
+    monkeypatch.setattr(async_ingredient_service, "ingredient_prefix_index", index)
+
+    results = run_async(lambda db: async_ingredient_service.suggest_ingredients_service(db, "Fla"), times=3)
+    assert [[s.name for s in suggestions] for suggestions in results] == [["Flaxseed"]] * 3
+    assert index.loaded
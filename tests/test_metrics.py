@@ -0,0 +1,39 @@
+"""/metrics: per-worker samples, merged across the workers of an instance."""
+
+import os
+
+from app.presentation import metrics
+
+
+def families(text):
+    return [line.split(" ")[2] for line in text.splitlines() if line.startswith("# TYPE ")]
+
+
+def test_samples_carry_the_worker_label():
+    text = metrics.render_metrics()
+    samples = [line for line in text.splitlines() if line and not line.startswith("#")]
+    assert samples
+    assert all(f'worker="{os.getpid()}"' in line for line in samples)
+
+
+def test_other_workers_samples_are_merged(tmp_path, monkeypatch):
+    monkeypatch.setattr(metrics, "METRICS_DIR", str(tmp_path))
+    other = metrics._render_worker().replace(f'worker="{os.getpid()}"', 'worker="1"')
+    (tmp_path / "1.prom").write_text(other)
+
+    text = metrics.render_metrics()
+    assert (tmp_path / f"{os.getpid()}.prom").exists()
+    assert len(families(text)) == len(set(families(text)))
+
+    # Each family's samples of both workers follow its own header.
+    current = None
+    for line in text.splitlines():
+        if line.startswith("# TYPE "):
+            current = line.split(" ")[2]
+        elif not line.startswith("#"):
+            assert line.startswith(current)
+    draining = [line for line in text.splitlines() if line.startswith("app_draining")]
+    assert sorted(draining) == sorted([f'app_draining{{worker="{os.getpid()}"}} 0', 'app_draining{worker="1"} 0'])
+
+    metrics.unpublish_metrics()
+    assert not (tmp_path / f"{os.getpid()}.prom").exists()
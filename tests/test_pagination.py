@@ -0,0 +1,108 @@
+"""Keyset cursors: the tokens themselves, and paging through the API with X-Next-Cursor."""
+
+import pytest
+
+from app.application.exceptions.pagination_exceptions import InvalidCursorError
+from app.application.pagination import (
+    decode_cursor,
+    decode_id_cursor,
+    decode_int_cursor,
+    decode_rank_cursor,
+    encode_cursor,
+    next_id_cursor,
+)
+
+
+def test_cursor_round_trip():
+    assert decode_cursor(encode_cursor({"id": 42})) == {"id": 42}
+    assert decode_id_cursor(encode_cursor({"id": 42})) == 42
+    assert decode_int_cursor(encode_cursor({"missing": 1, "id": 7}), "missing", "id") == (1, 7)
+    assert decode_rank_cursor(encode_cursor({"rank": 0.5, "id": 3})) == (0.5, 3)
+    assert decode_id_cursor(None) is None
+
+
+@pytest.mark.parametrize("cursor", ["not a cursor", encode_cursor({"id": "42"}), encode_cursor({"id": True})])
+def test_invalid_id_cursor(cursor):
+    with pytest.raises(InvalidCursorError):
+        decode_id_cursor(cursor)
+
+
+def test_invalid_cursor_shapes():
+    with pytest.raises(InvalidCursorError):
+        decode_cursor(encode_cursor([1, 2]))  # type: ignore[arg-type]
+    with pytest.raises(InvalidCursorError):
+        decode_int_cursor(encode_cursor({"missing": 1}), "missing", "id")
+    with pytest.raises(InvalidCursorError):
+        decode_rank_cursor(encode_cursor({"rank": "high", "id": 1}))
+
+
+def test_next_id_cursor_only_for_full_pages():
+    assert next_id_cursor([{"id": 1}, {"id": 2}], limit=2) == encode_cursor({"id": 2})
+    assert next_id_cursor([{"id": 1}], limit=2) is None
+    assert next_id_cursor([], limit=2) is None
+
+
+# ───────────────────────── through the API ──────────────────────────
+def walk(client, url, **params):
+    """Every page of a listing, following X-Next-Cursor; returns the pages."""
+    pages, after = [], None
+    while True:
+        response = client.get(url, params={**params, **({"after": after} if after else {})})
+        assert response.status_code == 200, response.text
+        pages.append(response.json())
+        after = response.headers.get("X-Next-Cursor")
+        if after is None:
+            return pages
+
+
+def test_recipe_listing_pages(client, make_recipes):
+    recipe_ids = make_recipes([{1}] * 7)
+
+    pages = walk(client, "/recipes/", limit=3)
+
+    assert [len(page) for page in pages] == [3, 3, 1]
+    assert [r["id"] for page in pages for r in page] == recipe_ids
+
+
+def test_recipe_listing_page_after_a_delete(client, make_recipes):
+    recipe_ids = make_recipes([{1}] * 4)
+    first = client.get("/recipes/", params={"limit": 2})
+
+    # The cursor holds the last ID, not an offset: deleting a row already seen shifts nothing.
+    assert client.delete(f"/recipes/{recipe_ids[0]}").status_code == 204
+    second = client.get("/recipes/", params={"limit": 2, "after": first.headers["X-Next-Cursor"]})
+
+    assert [r["id"] for r in second.json()] == recipe_ids[2:]
+
+
+def test_by_ingredients_pages(client, make_recipes):
+    recipe_ids = make_recipes([{1, 2}, {1}, {1, 2}, {2}, {1, 2, 3}])
+
+    pages = walk(client, "/recipes/by-ingredients", all=[1, 2], limit=2)
+
+    assert [r["id"] for page in pages for r in page] == [recipe_ids[0], recipe_ids[2], recipe_ids[4]]
+
+
+def test_pantry_pages(client, make_recipes):
+    recipe_ids = make_recipes([{1, 2}, {1}, {1, 2, 3}, {2, 3}, {1, 3}])
+
+    pages = walk(client, "/recipes/by-ingredients/pantry", have=[1], max_missing=2, limit=2)
+
+    rows = [(r["id"], r["missing_count"]) for page in pages for r in page]
+    assert rows == [
+        (recipe_ids[1], 0),
+        (recipe_ids[0], 1),
+        (recipe_ids[4], 1),
+        (recipe_ids[2], 2),
+    ]
+
+
+@pytest.mark.parametrize("url, params", [
+    ("/recipes/", {}),
+    ("/recipes/by-ingredients", {"all": 1}),
+    ("/recipes/by-ingredients/pantry", {"have": 1}),
+    ("/recipes/search", {"q": "recipe"}),
+])
+def test_invalid_cursor_is_a_bad_request(client, url, params):
+    response = client.get(url, params={**params, "after": "not a cursor"})
+    assert response.status_code == 400
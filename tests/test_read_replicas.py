@@ -0,0 +1,139 @@
+"""
+Reads from a replica that has not replayed the latest writes.
+
+The "replica" is a second database (``TEST_REPLICA_DATABASE_URL``) holding
+an old copy of the primary's rows, which is what a lagging streaming
+replica looks like to the app.
+"""
+
+import os
+import threading
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+
+from app.application.indexes.ingredient_recipe_index import ingredient_recipe_index
+from app.persistence import db as db_module
+from app.persistence.db import Base
+from app.persistence.replicas import ReplicaSet
+from app.presentation.read_your_writes import ReadYourWritesMiddleware
+
+TEST_REPLICA_DATABASE_URL = os.getenv("TEST_REPLICA_DATABASE_URL")
+
+
+@pytest.fixture
+def replica(client, monkeypatch):
+    """A lagging replica; `replica.catch_up()` copies the primary's current rows to it."""
+    if not TEST_REPLICA_DATABASE_URL:
+        pytest.skip("TEST_REPLICA_DATABASE_URL is not set")
+
+    engine = create_engine(TEST_REPLICA_DATABASE_URL)
+    Base.metadata.drop_all(engine)
+    Base.metadata.create_all(engine)
+
+    def catch_up():
+        with db_module.engine.connect() as primary, engine.begin() as conn:
+            for table in reversed(Base.metadata.sorted_tables):
+                conn.execute(table.delete())
+            for table in Base.metadata.sorted_tables:
+                rows = [dict(row._mapping) for row in primary.execute(table.select())]
+                if rows:
+                    conn.execute(table.insert(), rows)
+
+    engine.catch_up = catch_up
+    monkeypatch.setattr(db_module, "replicas", ReplicaSet([engine], primary=db_module.engine))
+    yield engine
+    Base.metadata.drop_all(engine)
+    engine.dispose()
+
+
+@pytest.fixture
+def reader(client):
+    """
+    Another client, whose GETs go to the replica. (`client` has no replica
+    routing, as if it always were within its read-your-writes window.)
+    """
+    return TestClient(ReadYourWritesMiddleware(client.app, window_seconds=10))
+
+
+def test_write_is_not_undone_by_a_replica_read(client, reader, replica, make_recipes):
+    [recipe_id] = make_recipes([{1, 2}])
+    replica.catch_up()
+    old = client.get(f"/recipes/{recipe_id}")
+
+    assert client.put(f"/recipes/{recipe_id}", json={"title": "New title"}).status_code == 200
+
+    # The replica still has the old title, and serves it to the reader...
+    # but the shared cache is filled from the primary.
+    assert reader.get(f"/recipes/{recipe_id}").json()["title"] == "New title"
+    assert reader.get("/recipes/").json()[0]["title"] == "New title"
+
+    # The writer reads its own write, and its old ETag no longer matches.
+    response = client.get(f"/recipes/{recipe_id}", headers={"If-None-Match": old.headers["ETag"]})
+    assert response.status_code == 200
+    assert response.json()["title"] == "New title"
+
+
+def test_author_cache_is_filled_from_the_primary(client, reader, replica, make_recipes):
+    make_recipes([{1}])
+    replica.catch_up()
+    author_id = client.get("/authors/").json()[0]["id"]
+
+    assert client.put(f"/authors/{author_id}", json={"name": "Grace"}).status_code == 200
+
+    assert reader.get(f"/authors/{author_id}").json()["name"] == "Grace"
+    assert reader.get("/authors/").json()[0]["name"] == "Grace"
+
+
+def test_indexes_are_built_from_the_primary(client, reader, replica, make_recipes):
+    # The replica has not replayed anything yet.
+    replica.catch_up()
+    recipe_ids = make_recipes([{1, 2}, {2}])
+
+    assert reader.get("/recipes/by-ingredients/pantry", params={"have": [2]}).status_code == 200
+    assert ingredient_recipe_index.match() == recipe_ids
+
+    suggestions = reader.get("/ingredients/suggest", params={"prefix": "In"}).json()
+    assert [s["name"] for s in suggestions] == ["Ingredient 1", "Ingredient 2"]
+
+
+def test_primary_read_does_not_join_a_replica_read(client, replica, make_recipes, monkeypatch):
+    from app.application.cache.response_cache import response_cache
+    from app.application.services import recipe_service
+    from app.persistence.db import SessionLocal
+    from app.persistence.repositories import recipe_repository
+
+    [recipe_id] = make_recipes([{1}])
+    replica.catch_up()
+    assert client.put(f"/recipes/{recipe_id}", json={"title": "New title"}).status_code == 200
+    monkeypatch.setattr(response_cache, "backend", None)   # RESPONSE_CACHE_BACKEND=none
+
+    # Hold the replica read in flight while a request pinned to the primary reads the same recipe.
+    entered, release = threading.Event(), threading.Event()
+    get_recipe_by_id = recipe_repository.get_recipe_by_id
+
+    def slow_on_replica(session, *args):
+        if session.get_bind() is replica:
+            entered.set()
+            release.wait(10)
+        return get_recipe_by_id(session, *args)
+
+    monkeypatch.setattr(recipe_repository, "get_recipe_by_id", slow_on_replica)
+    titles = {}
+
+    def read(name, bind):
+        with SessionLocal(bind=bind) as session:
+            titles[name] = recipe_service.get_recipe_service(session, recipe_id).title
+
+    leader = threading.Thread(target=read, args=("replica", replica))
+    leader.start()
+    assert entered.wait(10)
+    follower = threading.Thread(target=read, args=("primary", db_module.engine))
+    follower.start()
+    follower.join(1)
+    release.set()
+    follower.join()
+    leader.join()
+
+    assert titles == {"replica": "Recipe 0", "primary": "New title"}
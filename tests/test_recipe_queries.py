@@ -0,0 +1,50 @@
+"""
+Queries per request: a recipe read costs a fixed number of statements,
+whatever the page size or the number of ingredients (no N+1).
+"""
+
+from app.application.cache.ingredient_name_cache import ingredient_name_cache
+from app.application.cache.response_cache import response_cache
+
+
+def cold_get(client, queries, url, **params):
+    """GET `url` with empty caches; returns the response and the number of statements it ran."""
+    response_cache.clear()
+    ingredient_name_cache.clear()
+    queries.clear()
+    response = client.get(url, params=params)
+    assert response.status_code == 200, response.text
+    return response, len(queries)
+
+
+def test_recipe_list_query_count_does_not_grow_with_the_page(client, queries, make_recipes):
+    make_recipes([{1, 2, n % 5 + 3} for n in range(20)])
+
+    small, small_count = cold_get(client, queries, "/recipes/", limit=2)
+    large, large_count = cold_get(client, queries, "/recipes/", limit=20)
+
+    assert (len(small.json()), len(large.json())) == (2, 20)
+    assert small_count == large_count
+    assert large_count <= 3   # recipes + authors, ingredient lines, ingredient names
+
+
+def test_recipe_read_query_count_does_not_grow_with_ingredients(client, queries, make_recipes):
+    one, many = make_recipes([{1}, set(range(1, 13))])
+
+    _, one_count = cold_get(client, queries, f"/recipes/{one}")
+    response, many_count = cold_get(client, queries, f"/recipes/{many}")
+
+    assert len(response.json()["ingredients"]) == 12
+    assert one_count == many_count
+    assert many_count <= 3
+
+
+def test_cached_reads_run_no_query(client, queries, make_recipes):
+    [recipe_id] = make_recipes([{1, 2}])
+    client.get(f"/recipes/{recipe_id}")
+    client.get("/recipes/")
+
+    queries.clear()
+    assert client.get(f"/recipes/{recipe_id}").status_code == 200
+    assert client.get("/recipes/").status_code == 200
+    assert queries == []
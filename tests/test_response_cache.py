@@ -0,0 +1,52 @@
+"""Response cache backends: a load racing with an invalidation never caches its stale value."""
+
+import pytest
+
+from app.application.cache.response_cache import (
+    PLAIN_JSON,
+    MemoryCacheBackend,
+    RedisCacheBackend,
+    ResponseCache,
+)
+
+
+@pytest.fixture(params=["memory", "redis"])
+def cache(request):
+    if request.param == "memory":
+        return ResponseCache(MemoryCacheBackend(), ttl=60)
+    fakeredis = pytest.importorskip("fakeredis")
+    return ResponseCache(RedisCacheBackend(client=fakeredis.FakeRedis()), ttl=60)
+
+
+def load_during(cache, *invalidated):
+    """A loader that reads the old row, then sees a write invalidate `invalidated` before it returns."""
+    def _load():
+        value = {"id": 1, "title": "Old title"}
+        cache.invalidate(*invalidated)
+        return value
+    return _load
+
+
+def get_or_load(cache, load):
+    return cache.get_or_load("recipe:1", load, adapter=PLAIN_JSON, tags=lambda value: ["recipe:1", "recipes"])
+
+
+def test_load_interleaved_with_invalidation_is_not_cached(cache):
+    assert get_or_load(cache, load_during(cache, "recipe:1")) == {"id": 1, "title": "Old title"}
+    assert cache.peek("recipe:1", PLAIN_JSON) is None
+
+    # The next load started after the write: its value is cached.
+    assert get_or_load(cache, lambda: {"id": 1, "title": "New title"}) == {"id": 1, "title": "New title"}
+    assert cache.peek("recipe:1", PLAIN_JSON) == {"id": 1, "title": "New title"}
+
+
+def test_unrelated_invalidation_does_not_prevent_caching(cache):
+    get_or_load(cache, load_during(cache, "author:7"))
+    assert cache.peek("recipe:1", PLAIN_JSON) == {"id": 1, "title": "Old title"}
+
+
+def test_invalidation_drops_cached_entries(cache):
+    get_or_load(cache, lambda: {"id": 1, "title": "Old title"})
+    cache.invalidate("recipes")
+    assert cache.peek("recipe:1", PLAIN_JSON) is None
+    assert len(cache.backend) == 0
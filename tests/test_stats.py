@@ -0,0 +1,32 @@
+"""The /stats counters follow every recipe write."""
+
+from datetime import datetime, timezone
+
+
+def counts(client):
+    authors = {row["author_id"]: row["recipe_count"] for row in client.get("/stats/authors").json()}
+    ingredients = {row["ingredient_id"]: row["recipe_count"] for row in client.get("/stats/ingredients").json()}
+    days = {row["day"]: row["recipe_count"] for row in client.get("/stats/recipes-per-day").json()}
+    return authors, ingredients, days
+
+
+def test_counters_follow_writes(client, make_recipes):
+    recipe_ids = make_recipes([{1, 2}, {1}, {2, 3}])
+    author_id = client.get("/authors/").json()[0]["id"]
+    today = datetime.now(timezone.utc).date().isoformat()
+
+    assert counts(client) == ({author_id: 3}, {1: 2, 2: 2, 3: 1}, {today: 3})
+
+    assert client.put(f"/recipes/{recipe_ids[1]}", json={"ingredients": [
+        {"ingredient_id": 3, "quantity": 1, "unit": "g"},
+    ]}).status_code == 200
+    assert client.delete(f"/recipes/{recipe_ids[0]}").status_code == 204
+    assert counts(client) == ({author_id: 2}, {2: 1, 3: 2}, {today: 2})
+
+    assert client.get(f"/stats/authors/{author_id}").json()["recipe_count"] == 2
+    assert client.delete(f"/authors/{author_id}").status_code == 204
+    assert counts(client) == ({}, {}, {})
+
+
+def test_unknown_author(client):
+    assert client.get("/stats/authors/999").status_code == 404